@@ -0,0 +1,379 @@
+"""
+Benchmark del pipeline sobre CSV sintéticos: lectores, validadores, limpiadores,
+transformaciones y DataPipelineOrchestrator.run completo.
+
+Cada caso se mide con el mejor tiempo de --repeat ejecuciones y se divide por el tiempo de
+una carga de calibración fija medida en el mismo proceso. La línea base
+(benchmarks/baseline.json) guarda esas proporciones y no tiempos absolutos, de modo que sirve
+en cualquier máquina. Si algún caso es más lento que la línea base por encima de la
+tolerancia, el script termina con código 1; si la línea base se midió en otro entorno, solo
+se avisa.
+
+Uso:
+    PYTHONPATH=src python benchmarks/bench_pipeline.py --rows 10000 100000
+    PYTHONPATH=src python benchmarks/bench_pipeline.py --rows 10000 100000 --save-baseline
+"""
+import argparse
+import io
+import json
+import platform
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from synthetic_data import PROFILES, generate_sales_csv
+
+from module.cleaners import (
+    apply_schema_types,
+    drop_null_rows,
+    fill_null_values,
+    impute_amounts,
+    remove_duplicate_rows,
+)
+from module.cleaners.cleaner_dispatcher import DataCleanerDispatcher
+from module.data_models.schema import COLUMN_TYPES, CRITICAL_COLUMNS, TRANSACTION_ID
+from module.pipelines import DataPipelineOrchestrator
+from module.read.reader import ReaderCSVGenerator, ReaderCSVMmap, ReaderCSVPandas, fast_engine
+from module.reports import get_exporter
+from module.transforms import (
+    add_category_column,
+    add_weekday_column,
+    add_year_third_column,
+    default_pipeline,
+)
+from module.validators import DuplicateValidator, FusedValidator, NullValidator, TypeValidator
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+BASELINE_PATH = BENCHMARKS_DIR / "baseline.json"
+CONFIG_PATH = BENCHMARKS_DIR.parent / "src" / "module" / "data_models" / "config.json"
+
+# El lector fila a fila es el de respaldo para archivos pequeños: no se mide por encima
+GENERATOR_MAX_ROWS = 1_000_000
+# Filas de la carga de calibración
+CALIBRATION_ROWS = 100_000
+
+Case = tuple[str, Callable[[], Any]]
+
+
+@dataclass(frozen=True)
+class Regression:
+    rows: str
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+
+def pipeline_cases(path: Path, base_dir: Path, rows: int) -> list[Case]:
+    """
+    Casos del benchmark para un CSV. Las entradas de cada etapa se preparan una vez con las
+    etapas anteriores, de modo que cada caso mide solo su función.
+
+    :param path: CSV sintético.
+    :type path: Path
+    :param base_dir: Directorio donde el orquestador escribe sus salidas.
+    :type base_dir: Path
+    :param rows: Filas del CSV.
+    :type rows: int
+    :return: Lista de (nombre, función sin argumentos).
+    :rtype: list[Case]
+    """
+    with CONFIG_PATH.open() as file:
+        config = json.load(file)
+    config["metrics"] = {"enabled": False}
+
+    raw = ReaderCSVPandas(compact=True).read(str(path))
+    validator = FusedValidator()
+    errors = validator.validate(raw, config)
+    typed = apply_schema_types(raw, COLUMN_TYPES, errors, validator.coerced)
+    clean = DataCleanerDispatcher(config).clean(raw, errors, validator.coerced)
+    nulls = config["nulls"]
+
+    cases: list[Case] = [
+        ("read:ReaderCSVPandas", lambda: ReaderCSVPandas().read(str(path))),
+        ("read:ReaderCSVPandas(compact)", lambda: ReaderCSVPandas(compact=True).read(str(path))),
+        (
+            "read:ReaderCSVPandas(memory_map)",
+            lambda: ReaderCSVPandas(memory_map=True).read(str(path)),
+        ),
+        ("read:ReaderCSVMmap", lambda: ReaderCSVMmap().read(str(path))),
+    ]
+    if rows <= GENERATOR_MAX_ROWS:
+        cases.append(("read:ReaderCSVGenerator", lambda: ReaderCSVGenerator().read(str(path))))
+
+    cases += [
+        (f"validate:{type(check).__name__}", lambda check=check: check.validate(raw, config))
+        for check in (FusedValidator(), NullValidator(), DuplicateValidator(), TypeValidator())
+    ]
+    cases += [
+        (
+            "clean:remove_duplicate_rows",
+            lambda: remove_duplicate_rows(raw, [TRANSACTION_ID], keep="last"),
+        ),
+        (
+            "clean:fill_null_values",
+            lambda: fill_null_values(
+                raw, ["Payment Method"], nulls["fill_value"], sentinels=nulls["sentinels"]
+            ),
+        ),
+        ("clean:drop_null_rows", lambda: drop_null_rows(raw, CRITICAL_COLUMNS)),
+        (
+            "clean:apply_schema_types",
+            lambda: apply_schema_types(raw, COLUMN_TYPES, errors),
+        ),
+        ("clean:impute_amounts", lambda: impute_amounts(typed)),
+        ("clean:DataCleanerDispatcher", lambda: DataCleanerDispatcher(config).clean(raw, errors)),
+        ("transform:add_year_third_column", lambda: add_year_third_column(clean)),
+        ("transform:add_weekday_column", lambda: add_weekday_column(clean)),
+        ("transform:add_category_column", lambda: add_category_column(clean)),
+        ("transform:default_pipeline", lambda: default_pipeline().run(clean, log=False)),
+    ]
+    formats = ["csv", "parquet", "feather"] if fast_engine() == "pyarrow" else ["csv"]
+    for fmt in formats:
+        cases.append((f"export:{fmt}", lambda fmt=fmt: _export(base_dir, fmt, clean)))
+    for mode in ("memory", "chunked"):
+        run_config = {**config, "execution": {**config["execution"], "mode": mode}}
+        cases.append((
+            f"run:{mode}",
+            lambda c=run_config: DataPipelineOrchestrator(path, c, base_dir).run(),
+        ))
+    return cases
+
+
+def _export(base_dir: Path, fmt: str, df: pd.DataFrame) -> None:
+    with get_exporter(base_dir, "bench", {"export": {"format": fmt}}) as exporter:
+        exporter.write(df)
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    """Devuelve el mejor tiempo de repeat ejecuciones."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def calibrate(repeat: int) -> float:
+    """
+    Mejor tiempo de una carga fija de pandas (lectura de CSV, groupby y ordenación), que
+    sirve de unidad para comparar los tiempos de máquinas distintas.
+
+    :param repeat: Ejecuciones de la carga.
+    :type repeat: int
+    :return: Segundos de la carga.
+    :rtype: float
+    """
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame(
+        {
+            "key": rng.integers(0, 1_000, CALIBRATION_ROWS).astype(str),
+            "value": rng.random(CALIBRATION_ROWS).round(4),
+        }
+    )
+    text = frame.to_csv(index=False)
+
+    def workload() -> None:
+        df = pd.read_csv(io.StringIO(text))
+        df.groupby("key")["value"].sum()
+        df.sort_values("value")
+
+    return measure(workload, repeat)
+
+
+def run_suite(
+    sizes: list[int],
+    profile: str,
+    repeat: int,
+    rates: dict[str, float],
+    seed: int = 0,
+    only: dict[str, set[str]] | None = None,
+) -> dict[str, dict[str, float]]:
+    """
+    Genera un CSV por tamaño y mide todos los casos.
+
+    Si se indica only ({filas: casos}), solo se miden esos casos.
+
+    :return: Tiempos {filas: {caso: segundos}}.
+    :rtype: dict[str, dict[str, float]]
+    """
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in sizes:
+            path = generate_sales_csv(
+                Path(tmp) / f"{profile}_{rows}.csv", rows, profile, seed=seed, **rates
+            )
+            results[str(rows)] = timings = {}
+            for name, func in pipeline_cases(path, Path(tmp), rows):
+                if only is not None and name not in only.get(str(rows), set()):
+                    continue
+                timings[name] = round(measure(func, repeat), 6)
+                print(f"{rows:>11} {name:<36}{timings[name]:>10.4f} s", flush=True)
+            path.unlink()
+    return results
+
+
+def to_ratios(
+    results: dict[str, dict[str, float]], calibration: float
+) -> dict[str, dict[str, float]]:
+    """Tiempos divididos por el tiempo de calibración, que es lo que guarda la línea base."""
+    return {
+        rows: {name: round(seconds / calibration, 4) for name, seconds in timings.items()}
+        for rows, timings in results.items()
+    }
+
+
+def find_regressions(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    calibration: float,
+    tolerance: float,
+    min_delta: float,
+) -> list[Regression]:
+    """
+    Casos más lentos que la línea base.
+
+    La referencia de cada caso es su proporción en la línea base multiplicada por el tiempo
+    de calibración de esta ejecución. Un caso es una regresión si la supera en más de la
+    tolerancia relativa y en más de min_delta segundos (así el ruido de los casos de
+    milisegundos no cuenta). Los casos que no están en la línea base se ignoran.
+
+    :param results: Tiempos medidos {filas: {caso: segundos}}.
+    :type results: dict[str, dict[str, float]]
+    :param baseline: Proporciones de la línea base {filas: {caso: tiempo / calibración}}.
+    :type baseline: dict[str, dict[str, float]]
+    :param calibration: Segundos de la carga de calibración en esta ejecución.
+    :type calibration: float
+    :param tolerance: Aumento relativo permitido (0.25 = 25 %).
+    :type tolerance: float
+    :param min_delta: Aumento absoluto mínimo en segundos para contar como regresión.
+    :type min_delta: float
+    :return: Regresiones encontradas.
+    :rtype: list[Regression]
+    """
+    regressions = []
+    for rows, timings in results.items():
+        for name, current in timings.items():
+            ratio = baseline.get(rows, {}).get(name)
+            if ratio is None:
+                continue
+            reference = ratio * calibration
+            if current > reference * (1 + tolerance) and current - reference > min_delta:
+                regressions.append(Regression(rows, name, reference, current))
+    return regressions
+
+
+def environment() -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "engine": fast_engine(),
+        "machine": platform.machine(),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--rows", type=lambda value: int(float(value)), nargs="+", default=[10_000, 100_000]
+    )
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="cafe")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--null-rate", type=float, default=0.01)
+    parser.add_argument("--duplicate-rate", type=float, default=0.01)
+    parser.add_argument("--type-error-rate", type=float, default=0.01)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Guarda los tiempos como línea base"
+    )
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--min-delta", type=float, default=0.005)
+    args = parser.parse_args()
+
+    rates = {
+        "null_rate": args.null_rate,
+        "duplicate_rate": args.duplicate_rate,
+        "type_error_rate": args.type_error_rate,
+    }
+    calibration = calibrate(max(args.repeat, 5))
+    print(f"Calibración: {calibration:.4f} s")
+    results = run_suite(args.rows, args.profile, args.repeat, rates)
+
+    if args.save_baseline:
+        baseline = {
+            "environment": environment(),
+            "profile": args.profile,
+            "rates": rates,
+            "ratios": to_ratios(results, calibration),
+        }
+        args.baseline.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+        print(f"Línea base guardada en {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No hay línea base en {args.baseline}; usa --save-baseline para crearla")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if "ratios" not in baseline:
+        print(
+            f"Aviso: {args.baseline} no tiene proporciones de calibración; "
+            "usa --save-baseline para regenerarla"
+        )
+        return 0
+    comparable = True
+    if baseline.get("environment") != environment():
+        comparable = False
+        print(f"Aviso: la línea base se midió en otro entorno: {baseline.get('environment')}")
+    if (baseline.get("profile"), baseline.get("rates")) != (args.profile, rates):
+        comparable = False
+        print(
+            f"Aviso: la línea base se midió con otros datos: perfil {baseline.get('profile')}, "
+            f"tasas {baseline.get('rates')}"
+        )
+
+    regressions = find_regressions(
+        results, baseline["ratios"], calibration, args.tolerance, args.min_delta
+    )
+    if regressions:
+        # Una medida lenta aislada suele ser ruido de la máquina: se repiten los casos
+        # sospechosos con el doble de ejecuciones y se queda el mejor tiempo
+        print(f"Repitiendo {len(regressions)} casos más lentos que la línea base...")
+        suspects: dict[str, set[str]] = {}
+        for reg in regressions:
+            suspects.setdefault(reg.rows, set()).add(reg.name)
+        retry = run_suite(
+            [int(rows) for rows in suspects], args.profile, args.repeat * 2, rates,
+            only=suspects,
+        )
+        for rows, timings in retry.items():
+            for name, seconds in timings.items():
+                results[rows][name] = min(results[rows][name], seconds)
+        regressions = find_regressions(
+            results, baseline["ratios"], calibration, args.tolerance, args.min_delta
+        )
+    # Con otro entorno o con otros datos las diferencias no son fiables: solo se avisa
+    label = "REGRESIÓN" if comparable else "Aviso: más lento"
+    for reg in regressions:
+        print(
+            f"{label} {reg.name} ({reg.rows} filas): {reg.baseline:.4f} s -> "
+            f"{reg.current:.4f} s ({reg.ratio:.2f}x)"
+        )
+    if regressions:
+        return 1 if comparable else 0
+    print(f"Sin regresiones respecto a {args.baseline} (tolerancia {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
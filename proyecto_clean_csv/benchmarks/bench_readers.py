@@ -0,0 +1,78 @@
+"""
+Benchmark de lectura: parser python con sep=None frente a ReaderCSVPandas.
+
+Escala los CSV de ejemplo repitiendo sus filas y mide el rendimiento de cada lector.
+
+Uso:
+    PYTHONPATH=src python benchmarks/bench_readers.py --scale 1 10 50
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from module.read.reader import ReaderCSVPandas, fast_engine
+
+EXAMPLES_DIR = Path(__file__).resolve().parents[1] / "examples"
+EXAMPLES = ["ventas_cafe.csv", "retail_store_sales.csv"]
+
+
+def scale_csv(source: Path, target: Path, factor: int) -> Path:
+    """Escribe en target la cabecera de source y sus filas repetidas factor veces."""
+    header, *rows = source.read_text(encoding="utf-8").splitlines(keepends=True)
+    body = "".join(rows)
+    with target.open("w", encoding="utf-8") as fichero:
+        fichero.write(header)
+        for _ in range(factor):
+            fichero.write(body)
+    return target
+
+
+def read_legacy(path: Path) -> pd.DataFrame:
+    """Lectura anterior: detección del delimitador con el parser python sobre todo el archivo."""
+    return pd.read_csv(path, sep=None, engine="python", header=0)
+
+
+def read_fast(path: Path) -> pd.DataFrame:
+    return ReaderCSVPandas().read(str(path))
+
+
+def measure(func, path: Path, repeat: int) -> tuple[float, int]:
+    """Devuelve el mejor tiempo de repeat ejecuciones y el número de filas leídas."""
+    best = float("inf")
+    rows = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = len(func(path))
+        best = min(best, time.perf_counter() - start)
+    return best, rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"Motor rápido: {fast_engine()}")
+    print(f"{'archivo':<28}{'x':>5}{'MB':>9}{'filas':>11}"
+          f"{'python (s)':>12}{'rápido (s)':>12}{'MB/s':>9}{'mejora':>9}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in EXAMPLES:
+            for factor in args.scale:
+                path = scale_csv(EXAMPLES_DIR / name, Path(tmp) / f"x{factor}_{name}", factor)
+                size_mb = path.stat().st_size / (1024 * 1024)
+
+                legacy, rows = measure(read_legacy, path, args.repeat)
+                fast, _ = measure(read_fast, path, args.repeat)
+
+                print(f"{name:<28}{factor:>5}{size_mb:>9.1f}{rows:>11}"
+                      f"{legacy:>12.3f}{fast:>12.3f}{size_mb / fast:>9.1f}{legacy / fast:>8.1f}x")
+                path.unlink()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""
+Generador de CSV sintéticos de ventas (cafetería o retail) para los benchmarks.
+
+Las columnas salen de COLUMN_TYPES y se pueden inyectar nulos, Transaction ID duplicados y
+errores de tipo ("ERROR"/"UNKNOWN" en las columnas numéricas y de fecha) con tasas
+controladas. El archivo se escribe por bloques, así que la memoria no depende del número de
+filas y se pueden generar archivos de 10^4 a 10^8 filas.
+
+Uso:
+    PYTHONPATH=src python benchmarks/synthetic_data.py ventas.csv --rows 1000000 --profile retail
+"""
+import argparse
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from module.data_models.schema import COLUMN_TYPES, TRANSACTION_ID
+
+BLOCK_ROWS = 1_000_000
+TYPE_ERROR_VALUES = np.array(["ERROR", "UNKNOWN"])
+FIRST_DATE = np.datetime64("2023-01-01")
+DAYS = 365
+
+
+@dataclass(frozen=True)
+class SalesProfile:
+    """Valores posibles de las columnas de un tipo de archivo de ventas."""
+
+    items: dict[str, float]
+    payment_methods: tuple[str, ...]
+    locations: tuple[str, ...]
+    max_quantity: int
+    # Columnas propias del archivo que no están en COLUMN_TYPES
+    extra_columns: bool = False
+
+
+PROFILES = {
+    "cafe": SalesProfile(
+        items={
+            "Coffee": 2.0, "Tea": 1.5, "Juice": 3.0, "Smoothie": 4.0,
+            "Cake": 3.0, "Cookie": 1.0, "Salad": 5.0, "Sandwich": 4.0,
+        },
+        payment_methods=("Cash", "Credit Card", "Digital Wallet"),
+        locations=("In-store", "Takeaway"),
+        max_quantity=5,
+    ),
+    "retail": SalesProfile(
+        items={f"Item_{n}_{dep}": 5.0 + 1.5 * n for n in range(1, 26)
+               for dep in ("BEV", "BUT", "PAT", "MILK")},
+        payment_methods=("Cash", "Credit Card", "Digital Wallet"),
+        locations=("In-store", "Online"),
+        max_quantity=10,
+        extra_columns=True,
+    ),
+}
+
+
+def generate_sales_frame(
+    rows: int,
+    profile: str = "cafe",
+    null_rate: float = 0.0,
+    duplicate_rate: float = 0.0,
+    type_error_rate: float = 0.0,
+    seed: int | np.random.Generator = 0,
+    start: int = 0,
+) -> pd.DataFrame:
+    """
+    Genera un bloque de filas de ventas con los valores como texto, tal como se leen del CSV.
+
+    :param rows: Número de filas.
+    :type rows: int
+    :param profile: "cafe" o "retail" (ver PROFILES).
+    :type profile: str
+    :param null_rate: Proporción de celdas vacías en cada columna salvo Transaction ID.
+    :type null_rate: float
+    :param duplicate_rate: Proporción de filas que repiten un Transaction ID anterior.
+    :type duplicate_rate: float
+    :param type_error_rate: Proporción de celdas con "ERROR" o "UNKNOWN" en cada columna
+                            numérica o de fecha del esquema.
+    :type type_error_rate: float
+    :param seed: Semilla o generador aleatorio.
+    :type seed: int | np.random.Generator
+    :param start: Número de filas generadas antes de este bloque; los Transaction ID siguen
+                  la numeración y los duplicados pueden repetir cualquier ID anterior.
+    :type start: int
+    :raises ValueError: Si el perfil no existe o alguna tasa no está entre 0 y 1.
+    :return: DataFrame con las columnas del perfil.
+    :rtype: pd.DataFrame
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown profile '{profile}', expected one of {sorted(PROFILES)}")
+    for name, rate in (
+        ("null_rate", null_rate),
+        ("duplicate_rate", duplicate_rate),
+        ("type_error_rate", type_error_rate),
+    ):
+        if not 0 <= rate <= 1:
+            raise ValueError(f"{name} must be between 0 and 1, got {rate}")
+
+    spec = PROFILES[profile]
+    rng = np.random.default_rng(seed)
+
+    ids = np.arange(start, start + rows)
+    repeated = rng.random(rows) < duplicate_rate
+    repeated &= ids > 0
+    ids[repeated] = (rng.random(repeated.sum()) * ids[repeated]).astype(np.int64)
+
+    names = np.array(list(spec.items))
+    prices = np.array(list(spec.items.values()))
+    item_codes = rng.integers(0, len(names), rows)
+    quantity = rng.integers(1, spec.max_quantity + 1, rows)
+    days = rng.integers(0, DAYS, rows)
+
+    values: dict[str, np.ndarray] = {
+        TRANSACTION_ID: np.char.add("TXN_", ids.astype(str)),
+        "Item": names[item_codes],
+        "Quantity": quantity.astype(str),
+        "Price Per Unit": prices[item_codes].astype(str),
+        "Total Spent": (quantity * prices[item_codes]).astype(str),
+        "Payment Method": np.array(spec.payment_methods)[
+            rng.integers(0, len(spec.payment_methods), rows)
+        ],
+        "Location": np.array(spec.locations)[rng.integers(0, len(spec.locations), rows)],
+        "Transaction Date": np.datetime_as_string(FIRST_DATE + days, unit="D"),
+    }
+    if spec.extra_columns:
+        values["Customer ID"] = np.char.add("CUST_", rng.integers(1, 26, rows).astype(str))
+        values["Discount Applied"] = rng.choice(np.array(["True", "False"]), rows)
+
+    for col, column in values.items():
+        column = column.astype(object)
+        if col == TRANSACTION_ID:
+            values[col] = column
+            continue
+        if type_error_rate and COLUMN_TYPES.get(col, "str") != "str":
+            errors = rng.random(rows) < type_error_rate
+            column[errors] = rng.choice(TYPE_ERROR_VALUES, errors.sum())
+        if null_rate:
+            column[rng.random(rows) < null_rate] = ""
+        values[col] = column
+
+    return pd.DataFrame(values)
+
+
+def generate_sales_csv(
+    path: str | Path,
+    rows: int,
+    profile: str = "cafe",
+    null_rate: float = 0.0,
+    duplicate_rate: float = 0.0,
+    type_error_rate: float = 0.0,
+    seed: int = 0,
+    block_rows: int = BLOCK_ROWS,
+) -> Path:
+    """
+    Escribe un CSV sintético de ventas bloque a bloque.
+
+    Los parámetros son los de generate_sales_frame; block_rows es el número de filas que se
+    generan y escriben de cada vez.
+
+    :return: Ruta del archivo escrito.
+    :rtype: Path
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+
+    mode = "w"
+    for start in range(0, max(rows, 1), block_rows):
+        block = generate_sales_frame(
+            min(block_rows, rows - start),
+            profile,
+            null_rate=null_rate,
+            duplicate_rate=duplicate_rate,
+            type_error_rate=type_error_rate,
+            seed=rng,
+            start=start,
+        )
+        block.to_csv(path, mode=mode, header=mode == "w", index=False)
+        mode = "a"
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--rows", type=lambda value: int(float(value)), default=100_000)
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="cafe")
+    parser.add_argument("--null-rate", type=float, default=0.01)
+    parser.add_argument("--duplicate-rate", type=float, default=0.01)
+    parser.add_argument("--type-error-rate", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    path = generate_sales_csv(
+        args.path,
+        args.rows,
+        args.profile,
+        null_rate=args.null_rate,
+        duplicate_rate=args.duplicate_rate,
+        type_error_rate=args.type_error_rate,
+        seed=args.seed,
+    )
+    print(f"{args.rows} filas escritas en {path} ({path.stat().st_size / 1024 / 1024:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,59 @@
+import argparse
 import logging
 from pathlib import Path
 
-from src.module.pipelines import DataPipelineOrchestrator
+from src.module.pipelines import DataPipelineOrchestrator, run_batch
 from src.module.reports.logging_config import setup_logging
 
 logger= logging.getLogger(__name__)
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pipeline de limpieza de CSV")
+    parser.add_argument(
+        "input",
+        nargs="?",
+        default=None,
+        help="CSV a procesar, o directorio / patrón glob para procesar un lote "
+             "(por defecto examples/ventas_cafe.csv)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Número de procesos en modo lote"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Mide tiempo, CPU, memoria y filas/s de cada etapa y lo guarda en "
+             "generated/<nombre>_profile.json",
+    )
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
     setup_logging("INFO", "app_log.txt")
     logger.info("Inicio del pipeline")
 
     base_dir = Path(__file__).resolve().parent
 
-    path = base_dir / "examples" / "ventas_cafe.csv"
+    path = Path(args.input) if args.input else base_dir / "examples" / "ventas_cafe.csv"
     config_path = base_dir / "src" / "module" / "data_models" / "config.json"
 
-    pipeline = DataPipelineOrchestrator(path, config_path, base_dir)
+    if path.is_dir() or any(char in str(path) for char in "*?["):
+        summary = run_batch(
+            path, config_path, base_dir, workers=args.workers, profile=args.profile
+        )
+        print(
+            f"{len(summary.files)} archivos procesados, {len(summary.failures)} fallidos "
+            f"en {summary.seconds:.2f} s. Resumen en generated/batch_summary.json"
+        )
+        return
+
+    pipeline = DataPipelineOrchestrator(path, config_path, base_dir, profile=args.profile)
     pipeline.run()
 
+    if args.profile:
+        profile_path = base_dir / "generated" / f"{pipeline.name}_profile.json"
+        print(profile_path.with_suffix(".txt").read_text(encoding="utf-8"))
+        print(f"Perfil guardado en {profile_path}")
+
 if __name__ == "__main__":
     main()
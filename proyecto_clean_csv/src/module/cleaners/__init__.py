@@ -3,13 +3,18 @@ from .cleaners import (
     drop_null_rows,
     fill_null_values,
     impute_amounts,
+    null_mask,
     remove_duplicate_rows,
 )
+from .imputation import GroupImputer, ImputationRule
 
 __all__ = [
+    "GroupImputer",
+    "ImputationRule",
     "apply_schema_types",
     "drop_null_rows",
     "fill_null_values",
     "impute_amounts",
+    "null_mask",
     "remove_duplicate_rows",
 ]
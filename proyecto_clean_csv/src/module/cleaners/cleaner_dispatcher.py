@@ -1,92 +1,237 @@
+import logging
+from collections.abc import Sequence
 from typing import Any
 
 import pandas as pd
 
+from module.data_models.error_index import ErrorIndex
+from module.data_models.nulls import has_sentinels
 from module.data_models.schema import (
     COLUMN_TYPES,
     CRITICAL_COLUMNS,
     DUPLICATED_VALUES_ERROR,
     NULL_VALUES_ERROR,
     TRANSACTION_ID,
+    TYPE_ERROR,
 )
+from module.reports.memory import log_memory
+from module.reports.metrics import metrics
 
 from .cleaners import (
+    AMOUNT_COLUMNS,
+    NULL_SENTINELS,
     apply_schema_types,
     drop_null_rows,
     fill_null_values,
     impute_amounts,
     remove_duplicate_rows,
 )
+from .imputation import GroupImputer
+
+logger = logging.getLogger(__name__)
 
 
 class DataCleanerDispatcher:
     """Clase encargada de dirigir los errores detectados por el Validator."""
 
-    def __init__(self, config: dict[str, Any]) -> None:
-        """Recibe la configuración del cliente."""
-        self.config = config
+    def __init__(
+        self,
+        config: dict[str, Any],
+        force: bool = False,
+        imputer: GroupImputer | None = None,
+    ) -> None:
+        """Recibe la configuración del cliente.
 
-    def clean(self, df: pd.DataFrame, error_report: dict[str, list[str]]) -> pd.DataFrame:
+        Args:
+            config: Configuración cargada del config.json.
+            force: Si es True, cada paso habilitado se aplica sobre todas las columnas que le
+                corresponden aunque el informe no las marque. Se usa en el modo por chunks
+                para que el resultado de un chunk no dependa de los errores que contenga.
+            imputer: Motor de "imputation.rules" ya ajustado (p. ej. con el archivo
+                completo en el modo por chunks). Si es None y hay reglas, se ajusta con
+                cada DataFrame que se limpia.
+        """
+        self.config = config
+        self.force = force
+        self.imputer = imputer
+
+    def clean(
+        self,
+        df: pd.DataFrame,
+        error_report: dict[str, list[str]],
+        coerced: dict[str, pd.Series] | None = None,
+        inplace: bool = False,
+        error_index: ErrorIndex | None = None,
+    ) -> pd.DataFrame:
         """Analiza el diccionario de errores y aplica las transformaciones necesarias.
 
+        El dispatcher trabaja sobre un único DataFrame: cada limpiador se llama con
+        inplace=True y solo sustituye las columnas que toca o elimina filas sobre él, sin
+        copias intermedias entre pasos.
+
         Args:
             df: El DataFrame sucio recibido del Validator.
             error_report: Diccionario con formato {"Columna": ["ERROR_1", "ERROR_2"]}
+            coerced: Columnas ya convertidas por el FusedValidator, alineadas con df.
+            inplace: Si es True, el llamador cede df y se limpia sin copiarlo. Si es False,
+                se limpia una única copia y df queda intacto.
+            error_index: Posiciones de los errores del FusedValidator, alineadas con df. Los
+                pasos que eliminan duplicados o nulos solo revisan esas filas y lo mantienen
+                alineado al eliminarlas. Si no está alineado con df, se ignora.
 
         Returns:
             pd.DataFrame: El DataFrame limpio.
         """
-        df_clean = df.copy()
+        # En el modo por chunks se mide en DEBUG para no repetir el registro en cada chunk
+        memory_level = logging.DEBUG if self.force else logging.INFO
+        log_memory(logger, "antes de la limpieza", df, memory_level)
+
+        df_clean = df if inplace else df.copy()
+
+        validations = self.config.get("validations", {})
+        check_nulls = validations.get("validate_nulls", False)
+        if self.force:
+            error_report = self._forced_report(
+                df_clean, error_report, check_nulls, validations.get("validate_types", False)
+            )
+        if error_index is not None and not error_index.aligned(len(df_clean)):
+            error_index = None
 
         dup_config = self.config.get("duplicates", {})
         types_config = self.config.get("types", {})
         impute_config = self.config.get("imputation", {})
         nulls_config = self.config.get("nulls", {})
+        sentinels = nulls_config.get("sentinels", NULL_SENTINELS)
+
+        # 1. Conversión de columnas a numéricas antes de la imputación. Se hace antes de
+        # eliminar duplicados para que las columnas ya convertidas en la validación sigan
+        # alineadas con el DataFrame (la conversión es fila a fila, el orden no altera el
+        # resultado)
+        if types_config.get("apply", False):
+            df_clean = apply_schema_types(
+                df_clean, COLUMN_TYPES, error_report, coerced, inplace=True
+            )
 
-        # 1. Eliminar elementos duplicados de "Transaction ID"
+        # 2. Eliminar elementos duplicados de "Transaction ID"
         if dup_config.get("apply", False):
             if (
                 TRANSACTION_ID in error_report
                 and DUPLICATED_VALUES_ERROR in error_report[TRANSACTION_ID]
             ):
                 df_clean = remove_duplicate_rows(
-                    df_clean, columns=[TRANSACTION_ID], keep=dup_config.get("keep", "first")
+                    df_clean,
+                    columns=[TRANSACTION_ID],
+                    keep=dup_config.get("keep", "first"),
+                    inplace=True,
+                    error_index=error_index,
                 )
 
-        # 2. Conversión de columnas a numéricas antes de la imputación
-        if types_config.get("apply", False):
-            df_clean = apply_schema_types(df_clean, COLUMN_TYPES, error_report)
-
         # 3. Imputar valores faltantes en "Quantity", "Price Per Unit" y "Total Spent"
         if impute_config.get("apply_amounts", False):
-            df_clean = impute_amounts(df_clean)
-
-        # 4. Manejo de valores nulos restantes según la estrategia definida
-        critical_to_drop = [
-            col
-            for col in error_report
-            if NULL_VALUES_ERROR in error_report[col] and col in CRITICAL_COLUMNS
-        ]
-
-        # 4.1 Drop nulos en columnas críticas
-        if critical_to_drop:
-            df_clean = drop_null_rows(df_clean, columns=critical_to_drop)
+            df_clean = self._impute_amounts(df_clean, memory_level)
+
+        # 3.1 Imputar por grupos según "imputation.rules". Si se rellena alguna de las
+        # columnas de importes, se vuelven a aplicar las relaciones entre ellas
+        imputer = self.imputer or GroupImputer.from_config(self.config)
+        if imputer is not None:
+            if self.imputer is None:
+                imputer.fit(df_clean)
+            recovered: dict[str, int] = {}
+            df_clean = imputer.apply(df_clean, inplace=True, recovered=recovered)
+            metrics.count("impute_rules", recovered)
+            logger.log(memory_level, "Valores imputados por grupos: %s", recovered)
+            if impute_config.get("apply_amounts", False) and any(
+                recovered.get(col) for col in AMOUNT_COLUMNS
+            ):
+                df_clean = self._impute_amounts(df_clean, memory_level)
+
+        # 4. Manejo de valores nulos restantes según la estrategia definida. Se revisan las
+        # columnas que tienen nulos en el archivo, las que la conversión de tipos ha dejado
+        # con nulos y las que tienen textos centinela, de modo que cada fila se trata igual
+        # en memoria y por chunks, tenga o no el resto del archivo nulos en esa columna
+        allowed_cols = nulls_config.get("columns", []) if nulls_config.get("apply", False) else []
+        null_columns = self._null_columns(
+            df_clean,
+            [col for col in df_clean.columns if col in CRITICAL_COLUMNS or col in allowed_cols],
+            error_report,
+            check_nulls,
+            sentinels,
+            error_index,
+        )
+        critical_to_drop = [col for col in null_columns if col in CRITICAL_COLUMNS]
+        cols_to_fill = [col for col in null_columns if col not in CRITICAL_COLUMNS]
+
+        # 4.1 Drop nulos en columnas críticas (y centinelas a nulo en las columnas de texto)
+        if critical_to_drop or check_nulls:
+            df_clean = drop_null_rows(
+                df_clean,
+                columns=critical_to_drop,
+                inplace=True,
+                sentinels=sentinels,
+                error_index=error_index,
+            )
 
         # 4.2 Fill nulos opcionales autorizados por el JSON
-        if nulls_config.get("apply", False):
-            allowed_cols = nulls_config.get("columns", [])
-            cols_to_fill = [
-                col
-                for col in error_report
-                if NULL_VALUES_ERROR in error_report.get(col, [])
-                and col in allowed_cols
-                and col not in CRITICAL_COLUMNS
-            ]
-            if cols_to_fill:
-                df_clean = fill_null_values(
-                    df_clean,
-                    columns=cols_to_fill,
-                    fill_value=nulls_config.get("fill_value", "UNKNOWN"),
-                )
-
+        if cols_to_fill:
+            df_clean = fill_null_values(
+                df_clean,
+                columns=cols_to_fill,
+                fill_value=nulls_config.get("fill_value", "UNKNOWN"),
+                inplace=True,
+                sentinels=sentinels,
+                error_index=error_index,
+            )
+
+        log_memory(logger, "después de la limpieza", df_clean, memory_level)
         return df_clean
+
+    @staticmethod
+    def _impute_amounts(df: pd.DataFrame, level: int) -> pd.DataFrame:
+        recovered: dict[str, int] = {}
+        df = impute_amounts(df, inplace=True, recovered=recovered)
+        metrics.count("impute_amounts", recovered)
+        logger.log(level, "Valores recuperados por imputación: %s", recovered)
+        return df
+
+    @staticmethod
+    def _null_columns(
+        df: pd.DataFrame,
+        candidates: list[str],
+        error_report: dict[str, list[str]],
+        check_nulls: bool,
+        sentinels: Sequence[str],
+        error_index: ErrorIndex | None,
+    ) -> list[str]:
+        """
+        Columnas de candidates en las que hay que buscar nulos: las marcadas con NULL_VALUES
+        y, si se validan los nulos, también las que tienen TYPE_ERROR (la conversión deja
+        nulos los valores inválidos) o algún texto centinela.
+        """
+        columns = []
+        for col in candidates:
+            errors = error_report.get(col, [])
+            if NULL_VALUES_ERROR in errors or (
+                check_nulls
+                and (TYPE_ERROR in errors or has_sentinels(df[col], sentinels, error_index))
+            ):
+                columns.append(col)
+        return columns
+
+    @staticmethod
+    def _forced_report(
+        df: pd.DataFrame,
+        error_report: dict[str, list[str]],
+        nulls: bool,
+        types: bool,
+    ) -> dict[str, list[str]]:
+        """Marca todas las columnas con nulos y las columnas tipadas con error de tipo, si se
+        validan los nulos y los tipos respectivamente."""
+        forced: dict[str, list[str]] = {}
+        for col in df.columns:
+            errors = list(error_report.get(col, []))
+            if nulls and NULL_VALUES_ERROR not in errors:
+                errors.append(NULL_VALUES_ERROR)
+            if types and COLUMN_TYPES.get(col, "str") != "str" and TYPE_ERROR not in errors:
+                errors.append(TYPE_ERROR)
+            forced[col] = errors
+        return forced
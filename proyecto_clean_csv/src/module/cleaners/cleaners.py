@@ -1,16 +1,80 @@
+from collections.abc import Sequence
 from typing import Any, Literal
 
 import numpy as np
 import pandas as pd
 
+from module.data_models.coercion import coerce_column
+from module.data_models.error_index import SENTINEL_VALUES, ErrorIndex
+from module.data_models.nulls import is_null, is_text
+from module.data_models.schema import DUPLICATED_VALUES_ERROR, NULL_SENTINELS, NULL_VALUES_ERROR
 from module.reports import track_changes, track_dtype_changes
 
+AMOUNT_COLUMNS = ["Quantity", "Price Per Unit", "Total Spent"]
+
+
+def null_mask(
+    df: pd.DataFrame,
+    columns: list[str] | None = None,
+    sentinels: Sequence[str] = NULL_SENTINELS,
+    error_index: ErrorIndex | None = None,
+) -> np.ndarray:
+    """
+    Máscara de filas con algún nulo o texto centinela en las columnas indicadas.
+
+    Solo recorre las columnas del subconjunto y busca centinelas únicamente en las columnas
+    de texto, de modo que las columnas ya convertidas a número o fecha solo se revisan con
+    isna(). En las columnas de texto que están en error_index solo se revisan las filas
+    donde la validación encontró nulos o centinelas.
+
+    :param df: DataFrame a revisar.
+    :type df: pd.DataFrame
+    :param columns: Columnas a revisar. Si es None, se revisan todas.
+    :type columns: list[str] | None
+    :param sentinels: Valores de texto que cuentan como nulos.
+    :type sentinels: Sequence[str]
+    :param error_index: Posiciones de los errores de la validación, alineadas con df.
+    :type error_index: ErrorIndex | None
+    :return: Array booleano con True en las filas que tienen algún nulo.
+    :rtype: np.ndarray
+    """
+    mask = np.zeros(len(df), dtype=bool)
+    for col in df.columns if columns is None else columns:
+        column = df[col]
+        rows = _null_candidates(column, sentinels, error_index)
+        if rows is not None:
+            mask[rows[is_null(column.iloc[rows], sentinels)]] = True
+            continue
+        mask |= is_null(column, sentinels)
+    return mask
+
+
+def _null_candidates(
+    column: pd.Series, sentinels: Sequence[str], error_index: ErrorIndex | None
+) -> np.ndarray | None:
+    """
+    Filas de una columna de texto que pueden ser nulas según error_index, o None si hay
+    que revisar la columna entera (columna no indexada o ya convertida de tipo, porque la
+    conversión convierte en nulos los valores inválidos).
+    """
+    errors = [NULL_VALUES_ERROR, SENTINEL_VALUES] if sentinels else [NULL_VALUES_ERROR]
+    if (
+        error_index is None
+        or not error_index.aligned(len(column))
+        or not is_text(column)
+        or not error_index.covers(column.name, errors)
+    ):
+        return None
+    return error_index.union(column.name, errors)
+
 
 @track_changes
 def remove_duplicate_rows(
     df: pd.DataFrame,
     columns: list[str] | None = None,
     keep: Literal["first", "last", False] = "first",
+    inplace: bool = False,
+    error_index: ErrorIndex | None = None,
 ) -> pd.DataFrame:
     """Elimina filas duplicadas basándose en un subconjunto de columnas.
 
@@ -20,13 +84,36 @@ def remove_duplicate_rows(
                      Si es None, considera duplicada solo si TODA la fila es idéntica.
         keep: Qué duplicado mantener.
               'first' (la primera aparición), 'last' (la última), False (elimina todas).
+        inplace: Si es True, modifica df en lugar de crear un DataFrame nuevo.
+        error_index: Posiciones de los errores de la validación, alineadas con df. Con una
+            sola columna clave indexada, solo se comparan las filas con claves repetidas; el
+            índice se actualiza tras eliminar las filas.
     """
-    return df.drop_duplicates(subset=columns, keep=keep).reset_index(drop=True)
+    if (
+        error_index is not None
+        and columns is not None
+        and len(columns) == 1
+        and error_index.aligned(len(df))
+        and error_index.covers(columns[0], [DUPLICATED_VALUES_ERROR])
+    ):
+        rows = error_index.get(columns[0], DUPLICATED_VALUES_ERROR)
+        repeated = df[columns[0]].iloc[rows].duplicated(keep=keep).to_numpy()
+        return _drop_positions(df, rows[repeated], inplace, error_index)
+
+    if inplace:
+        df.drop_duplicates(subset=columns, keep=keep, inplace=True, ignore_index=True)
+        return df
+    return df.drop_duplicates(subset=columns, keep=keep, ignore_index=True)
 
 
 @track_changes
 def fill_null_values(
-    df: pd.DataFrame, columns: list[str] | None = None, fill_value: Any = "UNKNOWN"
+    df: pd.DataFrame,
+    columns: list[str] | None = None,
+    fill_value: Any = "UNKNOWN",
+    inplace: bool = False,
+    sentinels: Sequence[str] = (),
+    error_index: ErrorIndex | None = None,
 ) -> pd.DataFrame:
     """Rellena los valores nulos con el valor especificado.
 
@@ -34,96 +121,246 @@ def fill_null_values(
         df: El DataFrame.
         columns: Lista de columnas donde aplicar el relleno. Si es None, aplica a todo el DF.
         fill_value: El valor que se insertará en los huecos.
+        inplace: Si es True, modifica df en lugar de trabajar sobre una copia.
+        sentinels: Textos que también se sustituyen por fill_value en las columnas de texto.
+        error_index: Posiciones de los errores de la validación, alineadas con df. En las
+            columnas de texto indexadas solo se revisan las filas con nulos o centinelas.
     """
-    df_clean = df.copy()
+    df_clean = df if inplace else df.copy()
 
-    if columns:
-        df_clean[columns] = df_clean[columns].fillna(fill_value)
-    else:
-        df_clean = df_clean.fillna(fill_value)
+    for col in df_clean.columns if not columns else columns:
+        column = df_clean[col]
+        rows = _null_candidates(column, sentinels, error_index)
+        if rows is None:
+            missing = is_null(column, sentinels)
+        else:
+            missing = np.zeros(len(column), dtype=bool)
+            missing[rows[is_null(column.iloc[rows], sentinels)]] = True
+        if missing.any():
+            if (
+                isinstance(column.dtype, pd.CategoricalDtype)
+                and fill_value not in column.cat.categories
+            ):
+                column = column.cat.add_categories([fill_value])
+            df_clean[col] = column.mask(missing, fill_value)
 
     return df_clean
 
 
 @track_changes
-def impute_amounts(df: pd.DataFrame) -> pd.DataFrame:
+def impute_amounts(
+    df: pd.DataFrame,
+    inplace: bool = False,
+    recovered: dict[str, int] | None = None,
+) -> pd.DataFrame:
     """
     Rellena los valores faltantes en las columnas "Quantity", "Price Per Unit" y "Total Spent"
     utilizando las relaciones matemáticas entre ellas.
     Si un valor no se puede calcular, se deja como NaN.
 
+    Las máscaras de nulos se calculan una sola vez y las relaciones se resuelven con NumPy
+    solo sobre las filas afectadas (con algún nulo, o una cantidad o un precio a 0, que
+    también se consideran inválidos). Cada columna se reescribe una vez, y solo si cambia.
+    En una columna entera, las cantidades calculadas que no son números enteros quedan
+    como nulas.
+
     :param df: El DataFrame a procesar.
     :rtype: pd.DataFrame
+    :param inplace: Si es True, modifica df en lugar de trabajar sobre una copia.
+    :type inplace: bool
+    :param recovered: Si se indica, se suman en él los valores recuperados de cada columna.
+    :type recovered: dict[str, int] | None
     :return: El DataFrame con los valores imputados.
     :rtype: pd.DataFrame
     """
     if df is None:
         raise ValueError("DataFrame cannot be None")
 
-    df_clean = df.copy()
-    cols = ["Quantity", "Price Per Unit", "Total Spent"]
-
-    for col in cols:
-        if col not in df_clean.columns:
+    for col in AMOUNT_COLUMNS:
+        if col not in df.columns:
             raise ValueError(f"Column '{col}' not found in DataFrame")
 
-    df_clean["Total Spent"] = df_clean["Total Spent"].fillna(
-        df_clean["Quantity"] * df_clean["Price Per Unit"]
-    )
-    df_clean["Quantity"] = (
-        df_clean["Quantity"]
-        .fillna(df_clean["Total Spent"] / df_clean["Price Per Unit"])
-        .replace(0, np.nan)
-    )
-    df_clean["Price Per Unit"] = (
-        df_clean["Price Per Unit"]
-        .fillna(df_clean["Total Spent"] / df_clean["Quantity"])
-        .replace(0, np.nan)
-    )
+    # Solo se sustituyen columnas completas: basta una copia superficial
+    df_clean = df if inplace else df.copy(deep=False)
+    columns = [df_clean[col] for col in AMOUNT_COLUMNS]
+    # Como en la aritmética de pandas, si alguna columna admite nulos (Int64, Float64) las
+    # columnas float64 pasan a Float64, de modo que el tipo final no depende de los datos
+    if any(isinstance(column.dtype, pd.api.extensions.ExtensionDtype) for column in columns):
+        for i, (col, column) in enumerate(zip(AMOUNT_COLUMNS, columns, strict=True)):
+            if isinstance(column.dtype, np.dtype) and column.dtype.kind == "f":
+                columns[i] = df_clean[col] = column.astype("Float64")
+    missing = [column.isna().to_numpy() for column in columns]
+    zeros = [(column == 0).to_numpy(dtype=bool, na_value=False) for column in columns[:2]]
+
+    rows = np.flatnonzero(np.logical_or.reduce(missing + zeros))
+    if not rows.size:
+        return df_clean
+
+    before = [
+        column.array.take(rows).to_numpy(dtype=np.float64, na_value=np.nan)
+        for column in columns
+    ]
+    # np.where devuelve arrays nuevos: before no se modifica
+    quantity, price, total = before
+
+    total = np.where(np.isnan(total), quantity * price, total)
+    quantity = np.where(np.isnan(quantity), _divide(total, price), quantity)
+    if pd.api.types.is_integer_dtype(columns[0].dtype):
+        quantity[~np.isclose(quantity, np.round(quantity))] = np.nan
+        quantity = np.round(quantity)
+    quantity[quantity == 0] = np.nan
+    price = np.where(np.isnan(price), _divide(total, quantity), price)
+    price[price == 0] = np.nan
+
+    for col, column, was_missing, old, new in zip(
+        AMOUNT_COLUMNS, columns, missing, before, [quantity, price, total], strict=True
+    ):
+        if recovered is not None:
+            count = int((was_missing[rows] & ~np.isnan(new)).sum())
+            recovered[col] = recovered.get(col, 0) + count
+        if not np.array_equal(old, new, equal_nan=True):
+            df_clean[col] = _with_values(column, rows, new)
 
     return df_clean
 
 
+def _divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Divide elemento a elemento; las divisiones entre 0 quedan como NaN."""
+    result = np.full(len(numerator), np.nan)
+    np.divide(numerator, denominator, out=result, where=denominator != 0)
+    return result
+
+
+def _with_values(column: pd.Series, rows: np.ndarray, values: np.ndarray) -> pd.Series:
+    """Copia de column con values (NaN como nulo) en las posiciones rows, en su mismo tipo."""
+    if isinstance(column.dtype, np.dtype):
+        dtype = column.dtype
+        # Una columna entera de NumPy no admite NaN ni decimales: pasa a float64
+        if dtype.kind in "iub" and not np.array_equal(values, np.round(values)):
+            dtype = np.float64
+        array = column.to_numpy(dtype=dtype, copy=True)
+        array[rows] = values
+    else:
+        array = column.array.copy()
+        # Int64 y Float64 convierten directamente los NaN en nulos
+        if not isinstance(array, (pd.arrays.IntegerArray, pd.arrays.FloatingArray)):
+            values = pd.array(values, dtype=column.dtype)
+        array[rows] = values
+    return pd.Series(array, index=column.index, name=column.name, copy=False)
+
+
 @track_changes
-def drop_null_rows(df: pd.DataFrame, columns: list[str] | None = None) -> pd.DataFrame:
-    """Elimina las filas que contienen valores nulos.
+def drop_null_rows(
+    df: pd.DataFrame,
+    columns: list[str] | None = None,
+    inplace: bool = False,
+    sentinels: Sequence[str] = NULL_SENTINELS,
+    error_index: ErrorIndex | None = None,
+) -> pd.DataFrame:
+    """Elimina las filas que contienen valores nulos o textos centinela.
+
+    La máscara se construye solo con las columnas indicadas (ver null_mask) y las filas se
+    filtran de una sola vez. Después, los textos centinela que queden en cualquier columna
+    de texto pasan a ser nulos, columna a columna y solo en las columnas que los contienen.
 
     Args:
         df: El DataFrame.
         columns: Si se proporciona, solo busca nulos en estas columnas.
                         Si es None, revisa todas las columnas de la fila.
+        inplace: Si es True, modifica df en lugar de crear un DataFrame nuevo.
+        sentinels: Textos que cuentan como nulos, por defecto NULL_SENTINELS.
+        error_index: Posiciones de los errores de la validación, alineadas con df (ver
+            null_mask). Se actualiza tras eliminar las filas.
     """
-    return df.replace(['UNKNOWN', 'ERROR'], np.nan).dropna(subset=columns).reset_index(drop=True)
+    drop = null_mask(df, columns, sentinels, error_index)
+    df_clean = _drop_positions(df, np.flatnonzero(drop), inplace, error_index)
+    if sentinels:
+        _nullify_sentinels(df_clean, sentinels, error_index)
+    return df_clean
+
+
+def _nullify_sentinels(
+    df: pd.DataFrame, sentinels: Sequence[str], error_index: ErrorIndex | None
+) -> None:
+    """
+    Sustituye por nulos los textos centinela de las columnas de texto de df. En las columnas
+    que están en error_index solo se revisan las filas donde la validación los encontró.
+    """
+    for col in df.columns:
+        column = df[col]
+        if not is_text(column):
+            continue
+        if (
+            error_index is not None
+            and error_index.aligned(len(column))
+            and error_index.covers(col, [SENTINEL_VALUES])
+        ):
+            rows = error_index.get(col, SENTINEL_VALUES)
+            if not len(rows):
+                continue
+            found = np.zeros(len(column), dtype=bool)
+            found[rows] = column.iloc[rows].isin(sentinels).to_numpy(dtype=bool)
+        else:
+            found = column.isin(sentinels).to_numpy(dtype=bool)
+        if found.any():
+            df[col] = column.mask(found)
+
+
+def _drop_positions(
+    df: pd.DataFrame,
+    positions: np.ndarray,
+    inplace: bool,
+    error_index: ErrorIndex | None = None,
+) -> pd.DataFrame:
+    """Elimina las filas de las posiciones indicadas, reinicia el índice y actualiza error_index."""
+    if not len(positions):
+        return df if inplace else df.reset_index(drop=True)
+
+    if error_index is not None and error_index.aligned(len(df)):
+        error_index.drop(positions)
+
+    if inplace:
+        df.drop(index=df.index[positions], inplace=True)
+        df.reset_index(drop=True, inplace=True)
+        return df
+    keep = np.ones(len(df), dtype=bool)
+    keep[positions] = False
+    return df.take(np.flatnonzero(keep)).reset_index(drop=True)
 
 
 @track_dtype_changes
 def apply_schema_types(
-    df: pd.DataFrame, column_types: dict[str, Any], error_report: dict[str, list[str]]
+    df: pd.DataFrame,
+    column_types: dict[str, Any],
+    error_report: dict[str, list[str]],
+    coerced: dict[str, pd.Series] | None = None,
+    inplace: bool = False,
 ) -> pd.DataFrame:
     """Fuerza los tipos de datos basándose en el diccionario inyectado.
 
     Resuelve fechas y permite usar el tipo Int64.
+
+    Args:
+        coerced: Columnas ya convertidas durante la validación. Se reutilizan en lugar de
+            volver a parsearlas siempre que estén alineadas con el DataFrame.
+        inplace: Si es True, sustituye las columnas en df en lugar de trabajar sobre una copia.
+
+    Raises:
+        ValueError: Si una columna no se puede convertir a un dtype que no es del esquema.
+        TypeError: Si una columna no se puede convertir a un dtype que no es del esquema.
     """
-    df_clean = df.copy()
+    df_clean = df if inplace else df.copy()
+    coerced = coerced or {}
 
     cols_with_error = [col for col, errors in error_report.items() if "TYPE_ERROR" in errors]
 
     for col in cols_with_error:
         if col in column_types:
-            dtype = column_types[col]
-
-            if dtype in ["datetime", "datetime64[ns]"]:
-                df_clean[col] = pd.to_datetime(df_clean[col], errors="coerce")
-            elif dtype in ["int", "Int64"]:
-                df_clean[col] = pd.to_numeric(df_clean[col], errors="coerce")
-                df_clean[col] = df_clean[col].astype("Int64")
-            elif dtype in ["float", "Float64"]:
-                df_clean[col] = pd.to_numeric(df_clean[col], errors="coerce")
-                df_clean[col] = df_clean[col].astype("Float64")
-            else:
-                try:
-                    df_clean[col] = df_clean[col].astype(dtype)
-                except (ValueError, TypeError):
-                    pass
+            cached = coerced.get(col)
+            if cached is not None and cached.index.equals(df_clean.index):
+                df_clean[col] = cached
+                continue
+
+            df_clean[col] = coerce_column(df_clean[col], column_types[col])
 
     return df_clean
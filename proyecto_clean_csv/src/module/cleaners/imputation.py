@@ -0,0 +1,284 @@
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from module.data_models.coercion import SCHEMA_TYPES, coerce_column
+from module.data_models.nulls import is_null, is_text
+from module.data_models.schema import COLUMN_TYPES, NULL_SENTINELS
+
+from .cleaners import _with_values
+
+MEDIAN = "median"
+MODE = "mode"
+STATISTICS = (MEDIAN, MODE)
+
+_VALUE = "__value__"
+_COUNT = "__count__"
+
+
+@dataclass(frozen=True)
+class ImputationRule:
+    """
+    Regla de "imputation.rules": rellena los nulos de column con un estadístico (median o
+    mode) de las filas de su mismo grupo (las columnas de by).
+    """
+
+    column: str
+    by: tuple[str, ...]
+    statistic: str
+
+    @classmethod
+    def from_config(cls, rule: dict[str, Any]) -> "ImputationRule":
+        """
+        Crea la regla a partir de su entrada en el config.json.
+
+        :param rule: {"column": ..., "by": columna o lista de columnas, "statistic": ...}.
+        :type rule: dict[str, Any]
+        :raises ValueError: Si falta la columna o el grupo, o el estadístico no existe.
+        :return: Regla.
+        :rtype: ImputationRule
+        """
+        by = rule.get("by") or ()
+        by = (by,) if isinstance(by, str) else tuple(by)
+        statistic = rule.get("statistic", MODE)
+        if not rule.get("column") or not by:
+            raise ValueError(f"La regla de imputación necesita 'column' y 'by': {rule}")
+        if statistic not in STATISTICS:
+            raise ValueError(
+                f"Estadístico de imputación desconocido '{statistic}', se esperaba uno de "
+                f"{list(STATISTICS)}"
+            )
+        if rule["column"] in by:
+            raise ValueError(f"La regla de imputación agrupa '{rule['column']}' por sí misma")
+        return cls(rule["column"], by, statistic)
+
+
+class GroupImputer:
+    """
+    Motor de imputación por grupos definido en "imputation.rules".
+
+    fit() recorre los datos con un único groupby por cada combinación de columnas de grupo
+    (p. ej. "Item" o "Item" + "Location") y guarda cuántas veces aparece cada valor de las
+    columnas a imputar en cada grupo. Esos recuentos se pueden acumular por chunks y dan la
+    misma mediana y moda que los datos completos. Los estadísticos de cada grupo se calculan
+    una vez a partir de los recuentos y se reutilizan hasta el siguiente fit().
+
+    apply() solo busca el estadístico de las filas con nulos (o textos centinela), de modo
+    que su coste depende de las filas a rellenar y no del tamaño del DataFrame. Las filas
+    cuyo grupo no tiene valores conocidos se quedan como estaban.
+    """
+
+    def __init__(
+        self, rules: Iterable[ImputationRule], sentinels: Sequence[str] = NULL_SENTINELS
+    ) -> None:
+        """
+        :param rules: Reglas que se aplican, en orden.
+        :type rules: Iterable[ImputationRule]
+        :param sentinels: Textos que cuentan como nulos: no se cuentan como valores y se
+                          rellenan como los nulos.
+        :type sentinels: Sequence[str]
+        """
+        self.rules = list(rules)
+        self.sentinels = tuple(sentinels)
+        self._counts: dict[ImputationRule, pd.Series] = {}
+        self._statistics: dict[ImputationRule, pd.Series] = {}
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "GroupImputer | None":
+        """
+        Crea el motor con las reglas de la configuración.
+
+        :param config: Configuración completa.
+        :type config: dict[str, Any]
+        :return: Motor de imputación, o None si "imputation.apply_rules" está deshabilitado
+                 o no hay reglas.
+        :rtype: GroupImputer | None
+        """
+        imputation = config.get("imputation", {})
+        rules = imputation.get("rules") or []
+        if not imputation.get("apply_rules", False) or not rules:
+            return None
+        sentinels = config.get("nulls", {}).get("sentinels", NULL_SENTINELS)
+        return cls([ImputationRule.from_config(rule) for rule in rules], sentinels)
+
+    @property
+    def columns(self) -> list[str]:
+        """Columnas que necesitan fit() y apply()."""
+        columns = {}
+        for rule in self.rules:
+            columns.update(dict.fromkeys((*rule.by, rule.column)))
+        return list(columns)
+
+    def fit(self, df: pd.DataFrame) -> "GroupImputer":
+        """
+        Añade los valores de df a los recuentos de cada grupo.
+
+        :param df: DataFrame (o chunk) con las columnas de las reglas.
+        :type df: pd.DataFrame
+        :return: El propio motor.
+        :rtype: GroupImputer
+        """
+        by_groups: dict[tuple[str, ...], list[ImputationRule]] = {}
+        for rule in self.rules:
+            by_groups.setdefault(rule.by, []).append(rule)
+
+        for by, rules in by_groups.items():
+            keys = {col: self._known(df[col]) for col in by}
+            frame = pd.DataFrame(
+                {
+                    **keys,
+                    **{
+                        _target(i): self._known(self._typed(df[rule.column]))
+                        for i, rule in enumerate(rules)
+                    },
+                },
+                index=df.index,
+            )
+            # Un único groupby por grupo de columnas; las filas sin grupo se descartan
+            grouped = frame.groupby(list(by), observed=True, sort=False, dropna=True)
+            for i, rule in enumerate(rules):
+                counts = grouped[_target(i)].value_counts()
+                counts.index = counts.index.set_names([*by, _VALUE])
+                counts = _plain_index(counts)
+                previous = self._counts.get(rule)
+                self._counts[rule] = (
+                    counts if previous is None else previous.add(counts, fill_value=0)
+                )
+
+        self._statistics.clear()
+        return self
+
+    def statistics(self, rule: ImputationRule) -> pd.Series:
+        """
+        Estadístico de cada grupo de una regla, calculado una vez tras cada fit().
+
+        :param rule: Regla.
+        :type rule: ImputationRule
+        :return: Serie con el valor de cada grupo, indexada por las columnas de by.
+        :rtype: pd.Series
+        """
+        statistics = self._statistics.get(rule)
+        if statistics is None:
+            counts = self._counts.get(rule)
+            if counts is None or counts.empty:
+                index = pd.MultiIndex.from_tuples([], names=list(rule.by))
+                statistics = pd.Series([], index=index, dtype=object)
+            elif rule.statistic == MEDIAN:
+                statistics = _median(counts, list(rule.by))
+            else:
+                statistics = _mode(counts, list(rule.by))
+            self._statistics[rule] = statistics
+        return statistics
+
+    def apply(
+        self, df: pd.DataFrame, inplace: bool = False, recovered: dict[str, int] | None = None
+    ) -> pd.DataFrame:
+        """
+        Rellena los nulos de las columnas de las reglas con el estadístico de su grupo.
+
+        :param df: DataFrame a rellenar.
+        :type df: pd.DataFrame
+        :param inplace: Si es True, modifica df en lugar de trabajar sobre una copia.
+        :type inplace: bool
+        :param recovered: Si se indica, se suman en él los valores rellenados de cada columna.
+        :type recovered: dict[str, int] | None
+        :return: DataFrame con los valores imputados.
+        :rtype: pd.DataFrame
+        """
+        # Solo se sustituyen columnas completas: basta una copia superficial
+        df_clean = df if inplace else df.copy(deep=False)
+
+        for rule in self.rules:
+            column = df_clean[rule.column]
+            rows = np.flatnonzero(is_null(column, self.sentinels))
+            filled = 0
+            if rows.size:
+                statistics = self.statistics(rule)
+                keys = pd.MultiIndex.from_arrays(
+                    [np.asarray(df_clean[col].iloc[rows], dtype=object) for col in rule.by]
+                )
+                positions = statistics.index.get_indexer(keys)
+                found = positions >= 0
+                rows, values = rows[found], statistics.to_numpy()[positions[found]]
+                filled = len(rows)
+                if filled:
+                    df_clean[rule.column] = _fill(column, rows, values)
+            if recovered is not None:
+                recovered[rule.column] = recovered.get(rule.column, 0) + filled
+
+        return df_clean
+
+    def _known(self, column: pd.Series) -> pd.Series:
+        """Columna con los textos centinela como nulos, para no contarlos como valores."""
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            column = column.astype(column.cat.categories.dtype)
+        if self.sentinels and is_text(column):
+            column = column.mask(column.isin(self.sentinels))
+        return column
+
+    @staticmethod
+    def _typed(column: pd.Series) -> pd.Series:
+        """Convierte al tipo del esquema una columna numérica leída como texto."""
+        dtype = COLUMN_TYPES.get(column.name)
+        if dtype in SCHEMA_TYPES and is_text(column):
+            return coerce_column(column, dtype)
+        return column
+
+
+def _target(i: int) -> str:
+    return f"__target_{i}__"
+
+
+def _plain_index(counts: pd.Series) -> pd.Series:
+    """Recuentos con índices de tipo object, que se alinean igual chunk a chunk."""
+    counts.index = pd.MultiIndex.from_arrays(
+        [level.astype(object) for level in (
+            counts.index.get_level_values(i) for i in range(counts.index.nlevels)
+        )],
+        names=counts.index.names,
+    )
+    return counts
+
+
+def _sorted_counts(counts: pd.Series, by: list[str]) -> pd.DataFrame:
+    return counts.rename(_COUNT).reset_index().sort_values([*by, _VALUE], kind="stable")
+
+
+def _mode(counts: pd.Series, by: list[str]) -> pd.Series:
+    """Valor más frecuente de cada grupo; en caso de empate, el menor."""
+    frame = _sorted_counts(counts, by)
+    first = frame.sort_values(_COUNT, ascending=False, kind="stable").drop_duplicates(by)
+    return pd.Series(first[_VALUE].to_numpy(), index=pd.MultiIndex.from_frame(first[by]))
+
+
+def _median(counts: pd.Series, by: list[str]) -> pd.Series:
+    """Mediana de cada grupo a partir de cuántas veces aparece cada valor."""
+    frame = _sorted_counts(counts, by)
+    frame[_VALUE] = frame[_VALUE].astype(np.float64)
+    grouped = frame.groupby(by, sort=False)[_COUNT]
+    seen = grouped.cumsum()
+    total = grouped.transform("sum")
+    # Valores en las posiciones (n - 1) // 2 y n // 2 de cada grupo ordenado
+    lower = frame[seen > (total - 1) // 2].groupby(by, sort=False)[_VALUE].first()
+    upper = frame[seen > total // 2].groupby(by, sort=False)[_VALUE].first()
+    median = (lower + upper) / 2
+    return pd.Series(
+        median.to_numpy(), index=pd.MultiIndex.from_frame(median.index.to_frame(index=False))
+    )
+
+
+def _fill(column: pd.Series, rows: np.ndarray, values: np.ndarray) -> pd.Series:
+    """Copia de column con values en las posiciones rows."""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        new = pd.Index(pd.unique(values)).difference(column.cat.categories)
+        if len(new):
+            column = column.cat.add_categories(new)
+    elif pd.api.types.is_integer_dtype(column.dtype):
+        # La mediana de una columna entera puede caer entre dos valores
+        values = np.round(values.astype(np.float64))
+    elif pd.api.types.is_numeric_dtype(column.dtype):
+        values = values.astype(np.float64)
+    return _with_values(column, rows, values)
@@ -0,0 +1,44 @@
+from collections.abc import Sequence
+from typing import Any
+
+import pandas as pd
+
+from module.data_models.dates import parse_dates
+from module.data_models.schema import DATE_FORMATS
+
+DATETIME_TYPES = ("datetime", "datetime64[ns]")
+INT_TYPES = ("int", "Int64")
+FLOAT_TYPES = ("float", "Float64")
+SCHEMA_TYPES = DATETIME_TYPES + INT_TYPES + FLOAT_TYPES
+
+
+def coerce_column(
+    column: pd.Series, dtype: Any, formats: Sequence[str] | None = None
+) -> pd.Series:
+    """
+    Convierte una columna al tipo del esquema. Los valores no convertibles quedan como nulos.
+
+    Fechas a datetime, enteros a Int64 y decimales a Float64, tipos que admiten nulos. Las
+    fechas se parsean con formatos explícitos (ver dates.DateParser).
+
+    :param column: Columna a convertir.
+    :type column: pd.Series
+    :param dtype: Tipo del esquema ("datetime", "int", "float" o un dtype de pandas).
+    :type dtype: Any
+    :param formats: Formatos esperados de una columna de fechas; por defecto, los de
+                    DATE_FORMATS para el nombre de la columna.
+    :type formats: Sequence[str] | None
+    :raises ValueError: Si la columna no se puede convertir al dtype indicado.
+    :raises TypeError: Si la columna no se puede convertir al dtype indicado.
+    :return: Columna convertida.
+    :rtype: pd.Series
+    """
+    if dtype in DATETIME_TYPES:
+        if formats is None:
+            formats = DATE_FORMATS.get(column.name)
+        return parse_dates(column, formats)
+    if dtype in INT_TYPES:
+        return pd.to_numeric(column, errors="coerce").astype("Int64")
+    if dtype in FLOAT_TYPES:
+        return pd.to_numeric(column, errors="coerce").astype("Float64")
+    return column.astype(dtype)
@@ -0,0 +1,200 @@
+from collections.abc import Sequence
+from functools import cache
+
+import numpy as np
+import pandas as pd
+
+# Formatos que se prueban al inferir el de una columna, en orden de preferencia. Las fechas
+# ambiguas (01/02/2023) se leen con el mes primero, como hace pandas al inferir el formato;
+# si los datos usan el día primero hay que declararlo en DATE_FORMATS del esquema.
+DATE_FORMAT_CANDIDATES = [
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y/%m/%d",
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+    "%d-%m-%Y",
+    "%d.%m.%Y",
+    "%m/%d/%Y %H:%M",
+    "%d/%m/%Y %H:%M",
+    "%Y%m%d",
+    "ISO8601",
+]
+
+# Textos distintos con los que se elige el formato de una columna
+SAMPLE_SIZE = 200
+# Textos distintos cuya fecha se recuerda entre llamadas (por columna)
+MAX_CACHED_DATES = 500_000
+
+# Textos que pueden ser una fecha en un formato no previsto: un año de cuatro cifras o tres
+# grupos de cifras. El resto ("ERROR", "5") no se pasan a dateutil, que acepta casi cualquier
+# número como un día del mes actual
+DATE_LIKE = r"\d{4}|\d{1,2}\D+\d{1,2}\D+\d{2}"
+
+# Tipo que devuelve pd.to_datetime al parsear texto (datetime64[us] en pandas 3)
+DATETIME_DTYPE = pd.to_datetime(pd.Series(["2000-01-01"])).dtype
+NAT = np.iinfo(np.int64).min
+
+
+class DateParser:
+    """
+    Convierte texto a fechas con formatos explícitos en lugar de inferirlos elemento a elemento.
+
+    Solo se parsea cada texto distinto una vez: los resultados se recuerdan entre llamadas
+    (p. ej. entre los chunks de un archivo), hasta MAX_CACHED_DATES textos. Los textos nuevos
+    se prueban con los formatos declarados y después con los inferidos de una muestra; solo
+    los que no encajan en ningún formato pasan por el parseo genérico de pandas (dateutil),
+    que es mucho más lento. Los que tampoco se pueden parsear quedan como NaT.
+    """
+
+    def __init__(
+        self, formats: Sequence[str] = (), max_cached: int = MAX_CACHED_DATES
+    ) -> None:
+        """
+        :param formats: Formatos esperados de la columna, que se prueban antes de inferir.
+        :type formats: Sequence[str]
+        :param max_cached: Textos distintos cuya fecha se recuerda.
+        :type max_cached: int
+        """
+        self.formats = list(formats)
+        self.max_cached = max_cached
+        self._cache: dict[str, int] = {}
+
+    def parse(self, column: pd.Series) -> pd.Series:
+        """
+        Convierte una columna a fechas; los valores no convertibles quedan como NaT.
+
+        :param column: Columna de texto.
+        :type column: pd.Series
+        :return: Columna datetime64 con el mismo índice y nombre.
+        :rtype: pd.Series
+        """
+        if pd.api.types.is_datetime64_any_dtype(column.dtype):
+            return column
+        if not (
+            pd.api.types.is_string_dtype(column.dtype)
+            or isinstance(column.dtype, pd.CategoricalDtype)
+        ):
+            return pd.to_datetime(column, errors="coerce")
+
+        codes, uniques = pd.factorize(column)
+        keys = [str(value) for value in uniques.tolist()]
+        cache = self._cache
+        cached = [cache.get(key) for key in keys]
+        missing = [i for i, value in enumerate(cached) if value is None]
+        if missing:
+            parsed = self._parse_new([keys[i] for i in missing])
+            for i, value in zip(missing, parsed.tolist()):
+                cached[i] = value
+            if len(cache) + len(missing) > self.max_cached:
+                cache.clear()
+            cache.update(zip((keys[i] for i in missing), parsed.tolist()))
+
+        # Los nulos tienen el código -1: toman el NAT que se añade al final
+        values = np.asarray([*cached, NAT], dtype=np.int64)[codes]
+        return pd.Series(values.view(DATETIME_DTYPE), index=column.index, name=column.name)
+
+    def _parse_new(self, keys: list[str]) -> np.ndarray:
+        """Fechas (enteros de DATETIME_DTYPE, NAT si no se pueden parsear) de textos nuevos."""
+        texts = pd.Series(keys, dtype="str")
+        result = np.full(len(keys), NAT, dtype=np.int64)
+        pending = np.arange(len(keys))
+
+        for fmt in self.formats:
+            pending = _parse_pending(texts, fmt, result, pending)
+            if not pending.size:
+                return result
+
+        # Formatos nuevos de la muestra de lo que no encaja: se recuerdan para los chunks siguientes
+        while pending.size:
+            fmt = infer_date_format(texts.iloc[pending], exclude=self.formats)
+            if fmt is None:
+                break
+            self.formats.append(fmt)
+            pending = _parse_pending(texts, fmt, result, pending)
+
+        if pending.size:
+            date_like = texts.iloc[pending].str.contains(DATE_LIKE).to_numpy(dtype=bool)
+            _parse_pending(texts, "mixed", result, pending[date_like])
+        return result
+
+
+def infer_date_format(
+    values: pd.Series,
+    candidates: Sequence[str] = DATE_FORMAT_CANDIDATES,
+    sample_size: int = SAMPLE_SIZE,
+    exclude: Sequence[str] = (),
+) -> str | None:
+    """
+    Elige el formato que parsea más valores de una muestra.
+
+    :param values: Textos (preferiblemente distintos) de la columna.
+    :type values: pd.Series
+    :param candidates: Formatos que se prueban, en orden de preferencia en caso de empate.
+    :type candidates: Sequence[str]
+    :param sample_size: Valores de la muestra.
+    :type sample_size: int
+    :param exclude: Formatos que ya se han probado.
+    :type exclude: Sequence[str]
+    :return: Mejor formato, o None si ninguno parsea algún valor.
+    :rtype: str | None
+    """
+    sample = values.dropna().iloc[:sample_size]
+    best, best_count = None, 0
+    for fmt in candidates:
+        if fmt in exclude:
+            continue
+        count = int(pd.to_datetime(sample, format=fmt, errors="coerce").notna().sum())
+        if count > best_count:
+            best, best_count = fmt, count
+    return best
+
+
+@cache
+def date_parser(column: str | None, formats: tuple[str, ...] = ()) -> DateParser:
+    """
+    Parser compartido de una columna. Cada columna tiene el suyo porque los formatos
+    inferidos (y, con ellos, las fechas recordadas) dependen de sus datos.
+
+    :param column: Nombre de la columna.
+    :type column: str | None
+    :param formats: Formatos declarados en el esquema.
+    :type formats: tuple[str, ...]
+    :return: Parser de la columna.
+    :rtype: DateParser
+    """
+    return DateParser(formats)
+
+
+def parse_dates(column: pd.Series, formats: Sequence[str] | None = None) -> pd.Series:
+    """
+    Convierte una columna de texto a fechas con el parser compartido de la columna.
+
+    :param column: Columna de texto.
+    :type column: pd.Series
+    :param formats: Formatos esperados de la columna.
+    :type formats: Sequence[str] | None
+    :return: Columna datetime64; los valores no convertibles quedan como NaT.
+    :rtype: pd.Series
+    """
+    return date_parser(column.name, tuple(formats or ())).parse(column)
+
+
+def _parse_pending(
+    texts: pd.Series, fmt: str, result: np.ndarray, pending: np.ndarray
+) -> np.ndarray:
+    """Parsea con fmt los textos pendientes, guarda los que encajan y devuelve el resto."""
+    try:
+        parsed = pd.to_datetime(texts.iloc[pending], format=fmt, errors="coerce")
+    except (ValueError, TypeError):
+        # p. ej. zonas horarias distintas con format="mixed"
+        return pending
+    if not pd.api.types.is_datetime64_any_dtype(parsed.dtype):
+        return pending
+    if getattr(parsed.dtype, "tz", None) is not None:
+        parsed = parsed.dt.tz_convert(None)
+
+    ok = parsed.notna().to_numpy()
+    result[pending[ok]] = parsed.to_numpy()[ok].astype(DATETIME_DTYPE).view(np.int64)
+    return pending[~ok]
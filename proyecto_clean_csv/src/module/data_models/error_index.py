@@ -0,0 +1,109 @@
+from collections.abc import Iterable
+
+import numpy as np
+
+# Posiciones de textos centinela ("UNKNOWN", "ERROR"). No es un error del informe de
+# validación, pero los limpiadores de nulos los tratan como nulos
+SENTINEL_VALUES = "SENTINEL_VALUES"
+
+
+class ErrorIndex:
+    """
+    Posiciones de las filas afectadas por cada error, por columna.
+
+    La validación guarda, para cada columna que recorre entera, un array ordenado con las
+    posiciones de las filas de cada error (NULL_VALUES, DUPLICATED_VALUES, TYPE_ERROR y
+    SENTINEL_VALUES). Los limpiadores revisan solo esas filas en lugar de la columna
+    completa. Cuando un limpiador elimina filas, drop() desplaza las posiciones para que el
+    índice siga alineado con el DataFrame.
+
+    Las posiciones son candidatas: los limpiadores vuelven a comprobar el valor de esas filas,
+    así que un paso anterior que corrija una fila no deja el índice inválido. Las columnas o
+    errores que no están en el índice (p. ej. columnas validadas solo por muestreo) se
+    revisan enteros.
+    """
+
+    def __init__(self, rows: int = 0) -> None:
+        """
+        :param rows: Filas del DataFrame validado.
+        :type rows: int
+        """
+        self.rows = rows
+        self._dtype = np.int32 if rows < np.iinfo(np.int32).max else np.int64
+        self._positions: dict[str, dict[str, np.ndarray]] = {}
+
+    def covers(self, column: str, errors: Iterable[str]) -> bool:
+        """
+        Indica si el índice tiene las posiciones de todos los errores de una columna.
+
+        :param column: Columna.
+        :type column: str
+        :param errors: Tipos de error que se necesitan.
+        :type errors: Iterable[str]
+        :return: True si la columna se recorrió entera buscando esos errores.
+        :rtype: bool
+        """
+        recorded = self._positions.get(column)
+        return recorded is not None and all(error in recorded for error in errors)
+
+    def add(self, column: str, positions: dict[str, np.ndarray]) -> None:
+        """
+        Registra las posiciones de los errores de una columna recorrida entera.
+
+        :param column: Columna.
+        :type column: str
+        :param positions: {error: posiciones ordenadas} de cada error comprobado, aunque no
+                          tenga filas (un error que falta se considera no comprobado).
+        :type positions: dict[str, np.ndarray]
+        """
+        self._positions[column] = {
+            error: np.asarray(rows, dtype=self._dtype) for error, rows in positions.items()
+        }
+
+    def get(self, column: str, error: str) -> np.ndarray:
+        """
+        Posiciones de las filas con un error en una columna.
+
+        :param column: Columna del índice.
+        :type column: str
+        :param error: Tipo de error.
+        :type error: str
+        :return: Posiciones ordenadas (vacío si no hay filas con el error o no se comprobó).
+        :rtype: np.ndarray
+        """
+        return self._positions.get(column, {}).get(error, np.empty(0, dtype=self._dtype))
+
+    def union(self, column: str, errors: Iterable[str]) -> np.ndarray:
+        """
+        Posiciones de las filas con alguno de los errores en una columna.
+
+        :param column: Columna del índice.
+        :type column: str
+        :param errors: Tipos de error.
+        :type errors: Iterable[str]
+        :return: Posiciones ordenadas y sin repetir.
+        :rtype: np.ndarray
+        """
+        arrays = [self.get(column, error) for error in errors]
+        return np.unique(np.concatenate(arrays)) if arrays else np.empty(0, self._dtype)
+
+    def drop(self, positions: np.ndarray) -> None:
+        """
+        Actualiza el índice tras eliminar filas del DataFrame (y reiniciar su índice).
+
+        :param positions: Posiciones ordenadas de las filas eliminadas.
+        :type positions: np.ndarray
+        """
+        positions = np.asarray(positions)
+        if not positions.size:
+            return
+        for errors in self._positions.values():
+            for error, rows in errors.items():
+                kept = rows[~np.isin(rows, positions, assume_unique=True)]
+                # Cada fila baja tantas posiciones como filas eliminadas tiene delante
+                errors[error] = (kept - np.searchsorted(positions, kept)).astype(self._dtype)
+        self.rows -= len(positions)
+
+    def aligned(self, rows: int) -> bool:
+        """Indica si el índice corresponde a un DataFrame de rows filas."""
+        return self.rows == rows
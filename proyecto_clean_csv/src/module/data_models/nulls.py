@@ -0,0 +1,68 @@
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+
+from module.data_models.error_index import SENTINEL_VALUES, ErrorIndex
+
+
+def is_text(column: pd.Series) -> bool:
+    """
+    Indica si una columna guarda texto (str, object o categórica), es decir, si puede tener
+    textos centinela y todavía no se ha convertido al tipo del esquema.
+
+    :param column: Columna.
+    :type column: pd.Series
+    :return: True si la columna es de texto.
+    :rtype: bool
+    """
+    return (
+        pd.api.types.is_string_dtype(column)
+        or column.dtype == object
+        or isinstance(column.dtype, pd.CategoricalDtype)
+    )
+
+
+def is_null(column: pd.Series, sentinels: Sequence[str]) -> np.ndarray:
+    """
+    Máscara de los nulos de una columna, contando como nulos los textos centinela de las
+    columnas de texto.
+
+    :param column: Columna.
+    :type column: pd.Series
+    :param sentinels: Valores de texto que cuentan como nulos.
+    :type sentinels: Sequence[str]
+    :return: Array booleano con True en los valores nulos.
+    :rtype: np.ndarray
+    """
+    missing = column.isna().to_numpy()
+    if sentinels and is_text(column):
+        missing = missing | column.isin(sentinels).to_numpy(dtype=bool)
+    return missing
+
+
+def has_sentinels(
+    column: pd.Series, sentinels: Sequence[str], error_index: ErrorIndex | None = None
+) -> bool:
+    """
+    Indica si una columna de texto contiene algún texto centinela. Si la columna está en
+    error_index, basta con ver si la validación encontró alguno.
+
+    :param column: Columna.
+    :type column: pd.Series
+    :param sentinels: Valores de texto que cuentan como nulos.
+    :type sentinels: Sequence[str]
+    :param error_index: Posiciones de los errores de la validación, alineadas con la columna.
+    :type error_index: ErrorIndex | None
+    :return: True si hay algún texto centinela.
+    :rtype: bool
+    """
+    if not sentinels or not is_text(column):
+        return False
+    if (
+        error_index is not None
+        and error_index.aligned(len(column))
+        and error_index.covers(column.name, [SENTINEL_VALUES])
+    ):
+        return len(error_index.get(column.name, SENTINEL_VALUES)) > 0
+    return bool(column.isin(sentinels).any())
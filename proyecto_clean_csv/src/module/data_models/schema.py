@@ -5,6 +5,9 @@ DUPLICATED_VALUES_ERROR = "DUPLICATED_VALUES"
 NULL_VALUES_ERROR = "NULL_VALUES"
 TYPE_ERROR = "TYPE_ERROR"
 
+# Textos que se tratan como nulos además de NaN (configurables en "nulls.sentinels")
+NULL_SENTINELS = ("UNKNOWN", "ERROR")
+
 COLUMN_TYPES = {
     "Transaction ID": "str",
     "Item": "str",
@@ -16,6 +19,12 @@ COLUMN_TYPES = {
     "Transaction Date": "datetime"
 }
 
+# Formatos esperados de las columnas de fecha. Se prueban antes de inferir el formato de los
+# datos, así que deciden cómo se leen las fechas ambiguas (p. ej. "%d/%m/%Y" para 01/02/2023)
+DATE_FORMATS: dict[str, list[str]] = {
+    "Transaction Date": ["%Y-%m-%d"]
+}
+
 CRITICAL_COLUMNS = [
     TRANSACTION_ID,
     "Item",
@@ -25,6 +34,17 @@ CRITICAL_COLUMNS = [
     "Transaction Date"
 ]
 
+# Columnas de baja cardinalidad que se guardan como categóricas en el modo compacto
+CATEGORICAL_COLUMNS = [
+    "Item",
+    "Payment Method",
+    "Location"
+]
+
+# Categorías ordenadas de las columnas derivadas
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+YEAR_THIRDS = ["T1", "T2", "T3"]
+
 NUMERIC_COLUMNS = [
     "Quantity",
     "Price Per Unit",
@@ -1,5 +1,8 @@
+from .batch import BatchSummary, run_batch
 from .orchestrator import DataPipelineOrchestrator
 
 __all__ = [
+    "BatchSummary",
     "DataPipelineOrchestrator",
+    "run_batch",
 ]
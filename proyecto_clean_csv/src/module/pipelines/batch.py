@@ -0,0 +1,206 @@
+import glob
+import json
+import logging
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from module.read import base_name
+
+from .orchestrator import DataPipelineOrchestrator
+
+logger = logging.getLogger(__name__)
+
+CSV_PATTERN = "*.csv*"
+
+# Configuración compartida por todas las tareas de un worker (se carga una vez por worker)
+_worker_config: dict[str, Any] = {}
+
+
+@dataclass
+class FileResult:
+    """Resultado del pipeline sobre un archivo del lote."""
+
+    path: str
+    status: str
+    rows_in: int = 0
+    rows_out: int = 0
+    seconds: float = 0.0
+    error: str | None = None
+
+
+@dataclass
+class BatchSummary:
+    """Resumen consolidado de la ejecución de un lote de archivos."""
+
+    files: list[FileResult] = field(default_factory=list)
+    seconds: float = 0.0
+    workers: int = 1
+
+    @property
+    def failures(self) -> list[FileResult]:
+        return [result for result in self.files if result.status != "ok"]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "files": [asdict(result) for result in self.files],
+            "total_files": len(self.files),
+            "failed_files": len(self.failures),
+            "rows_in": sum(result.rows_in for result in self.files),
+            "rows_out": sum(result.rows_out for result in self.files),
+            "seconds": self.seconds,
+            "workers": self.workers,
+        }
+
+
+def resolve_inputs(inputs: str | Path) -> list[Path]:
+    """
+    Devuelve los CSV a procesar, ordenados por ruta.
+
+    :param inputs: Directorio (se buscan los archivos "*.csv*") o patrón glob.
+    :type inputs: str | Path
+    :return: Lista de rutas de los archivos encontrados.
+    :rtype: list[Path]
+    """
+    inputs = Path(inputs)
+    if inputs.is_dir():
+        return sorted(path for path in inputs.glob(CSV_PATTERN) if path.is_file())
+    return sorted(Path(path) for path in glob.glob(str(inputs)) if Path(path).is_file())
+
+
+def run_batch(
+    inputs: str | Path,
+    config_path: str | Path,
+    base_dir: str | Path,
+    workers: int | None = None,
+    profile: bool = False,
+) -> BatchSummary:
+    """
+    Ejecuta un orquestador por archivo en un pool de procesos.
+
+    El config.json se parsea una sola vez y se comparte con cada worker al arrancar. Los
+    fallos de un archivo no detienen el lote: se registran en el resumen, que se guarda en
+    generated/batch_summary.json. Los archivos cuyas salidas coincidirían con las de otro
+    archivo del lote no se procesan y constan como fallidos (ver _unique_outputs).
+
+    :param inputs: Directorio o patrón glob con los CSV a procesar.
+    :type inputs: str | Path
+    :param config_path: Ruta del archivo de configuración JSON.
+    :type config_path: str | Path
+    :param base_dir: Ruta base del proyecto para generar archivos de salida.
+    :type base_dir: str | Path
+    :param workers: Número de procesos. Por defecto "execution.workers" del config.json o
+                    el número de núcleos.
+    :type workers: int | None
+    :param profile: Si es True, cada archivo guarda su perfil en generated/<nombre>_profile.json.
+    :type profile: bool
+    :return: Resumen del lote con filas, tiempos y fallos de cada archivo.
+    :rtype: BatchSummary
+    """
+    with Path(config_path).open() as file:
+        config = json.load(file)
+
+    # Los archivos ya se procesan en paralelo: cada uno se lee con un solo proceso
+    execution = config.setdefault("execution", {})
+    execution["read_workers"] = execution.get("read_workers") or 1
+
+    paths, rejected = _unique_outputs(resolve_inputs(inputs))
+    workers = workers or config.get("execution", {}).get("workers") or os.cpu_count() or 1
+    workers = max(1, min(workers, len(paths)))
+    logger.info("Lote de %d archivos con %d workers.", len(paths), workers)
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(config,)
+    ) as executor:
+        results = list(
+            executor.map(
+                _run_file, paths, [Path(base_dir)] * len(paths), [profile] * len(paths)
+            )
+        )
+
+    summary = BatchSummary(
+        files=sorted(results + rejected, key=lambda result: Path(result.path)),
+        seconds=time.perf_counter() - start,
+        workers=workers,
+    )
+
+    for result in summary.failures:
+        logger.error("Fallo en '%s': %s", result.path, result.error)
+    logger.info(
+        "Lote finalizado: %d archivos, %d fallidos, %d filas leídas, %d filas exportadas, "
+        "%.2f segundos.",
+        len(summary.files),
+        len(summary.failures),
+        sum(result.rows_in for result in summary.files),
+        sum(result.rows_out for result in summary.files),
+        summary.seconds,
+    )
+
+    generated_dir = Path(base_dir) / "generated"
+    generated_dir.mkdir(exist_ok=True)
+    with (generated_dir / "batch_summary.json").open("w", encoding="utf-8") as file:
+        json.dump(summary.to_dict(), file, indent=2, ensure_ascii=False)
+
+    return summary
+
+
+def _unique_outputs(paths: list[Path]) -> tuple[list[Path], list[FileResult]]:
+    """
+    Separa los archivos que generarían las mismas salidas que otro archivo del lote.
+
+    Las salidas (generated/<nombre>_clean.*, gráficos, perfil...) se nombran con base_name,
+    así que "a/ventas.csv" y "b/ventas.csv", o "ventas.csv" y "ventas.csv.gz", se
+    sobrescribirían entre sí. Se procesa el primero por orden de ruta y el resto se rechaza.
+
+    :param paths: Archivos del lote, ordenados por ruta.
+    :type paths: list[Path]
+    :return: Archivos a procesar y resultados de los archivos rechazados.
+    :rtype: tuple[list[Path], list[FileResult]]
+    """
+    owners: dict[str, Path] = {}
+    unique: list[Path] = []
+    rejected: list[FileResult] = []
+    for path in paths:
+        owner = owners.setdefault(base_name(path), path)
+        if owner == path:
+            unique.append(path)
+        else:
+            rejected.append(
+                FileResult(
+                    path=str(path),
+                    status="error",
+                    error=f"Sus salidas sobrescribirían las de '{owner}'",
+                )
+            )
+    return unique, rejected
+
+
+def _init_worker(config: dict[str, Any]) -> None:
+    global _worker_config
+    _worker_config = config
+
+
+def _run_file(path: Path, base_dir: Path, profile: bool = False) -> FileResult:
+    start = time.perf_counter()
+    try:
+        pipeline = DataPipelineOrchestrator(path, _worker_config, base_dir, profile=profile)
+        pipeline.run()
+        return FileResult(
+            path=str(path),
+            status="ok",
+            rows_in=pipeline.rows_in,
+            rows_out=pipeline.rows_out,
+            seconds=time.perf_counter() - start,
+        )
+    except Exception as e:
+        return FileResult(
+            path=str(path),
+            status="error",
+            seconds=time.perf_counter() - start,
+            error="".join(traceback.format_exception_only(e)).strip(),
+        )
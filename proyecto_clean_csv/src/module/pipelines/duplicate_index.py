@@ -0,0 +1,270 @@
+import os
+import sqlite3
+import tempfile
+from collections.abc import Iterator
+from itertools import islice
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Clave con la que se agrupan los identificadores nulos (drop_duplicates los trata como iguales)
+NA_KEY = "\x00<NA>"
+
+# Identificadores que se guardan en un diccionario antes de pasar a un índice en disco
+MAX_MEMORY_KEYS = 2_000_000
+# Filas por sentencia al escribir o consultar el índice en disco
+SQL_BATCH = 50_000
+# Segundos que se espera a que otro proceso libere un índice persistente
+LOCK_TIMEOUT = 60.0
+
+
+class DuplicateIndex:
+    """
+    Conjunto de identificadores con el número de veces que se han visto.
+
+    Mientras hay pocos identificadores distintos se guardan en un diccionario; al superar
+    max_memory_keys se vuelcan a una tabla SQLite temporal ordenada por clave (un B-tree en
+    disco), de modo que la memoria no depende de la cardinalidad de la columna.
+
+    Con path el índice es siempre un archivo SQLite persistente, que sirve de histórico
+    entre ejecuciones. Los cambios se confirman con commit(); close() sin commit() los
+    descarta, así una ejecución fallida no deja sus identificadores en el histórico.
+
+    Con source, cada identificador se guarda junto al archivo del que procede y las
+    consultas solo cuentan los de otros archivos: volver a procesar un archivo no convierte
+    sus propias transacciones en duplicados. Como las consultas no ven los identificadores
+    propios, los añadidos se acumulan en memoria y commit() los escribe en una única
+    transacción corta, de modo que varios procesos pueden compartir el histórico sin
+    bloquearse durante toda la ejecución.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        max_memory_keys: int = MAX_MEMORY_KEYS,
+        source: str | None = None,
+    ) -> None:
+        """
+        :param path: Archivo SQLite persistente. Si es None, el índice es temporal.
+        :type path: str | Path | None
+        :param max_memory_keys: Claves distintas en memoria antes de pasar a disco.
+        :type max_memory_keys: int
+        :param source: Archivo al que pertenecen los identificadores que se añaden (solo en
+                       un índice persistente).
+        :type source: str | None
+        """
+        if source is not None and path is None:
+            raise ValueError("source requires a persistent index (path)")
+        self.path = Path(path) if path is not None else None
+        self.max_memory_keys = max_memory_keys
+        self.source = source
+        self._counts: dict[str, int] | None = {}
+        self._pending: dict[str, int] | None = {} if source is not None else None
+        self._db: sqlite3.Connection | None = None
+        self._spill_path: str | None = None
+        if self.path is not None:
+            self._open_db(self.path, persistent=True)
+
+    @property
+    def on_disk(self) -> bool:
+        return self._db is not None
+
+    def __len__(self) -> int:
+        if self._counts is not None:
+            return len(self._counts)
+        return self._db.execute("SELECT COUNT(DISTINCT key) FROM keys").fetchone()[0]
+
+    def add(self, keys: pd.Series) -> None:
+        """
+        Suma las apariciones de cada identificador.
+
+        :param keys: Identificadores (los nulos cuentan como un mismo identificador).
+        :type keys: pd.Series
+        """
+        self._merge(index_keys(keys).value_counts())
+
+    def counts(self, keys: pd.Series) -> np.ndarray:
+        """
+        Número de apariciones registradas de cada identificador (0 si no se ha visto).
+
+        :param keys: Identificadores a consultar.
+        :type keys: pd.Series
+        :return: Array de enteros alineado con keys.
+        :rtype: np.ndarray
+        """
+        keys = index_keys(keys)
+        codes, uniques = pd.factorize(keys)
+        if self._counts is not None:
+            counts = self._counts
+            found = np.fromiter(
+                (counts.get(key, 0) for key in uniques), dtype=np.int64, count=len(uniques)
+            )
+        else:
+            found = self._lookup(uniques)
+        return found[codes]
+
+    def contains(self, keys: pd.Series) -> np.ndarray:
+        """
+        Indica qué identificadores ya están en el índice.
+
+        :param keys: Identificadores a consultar.
+        :type keys: pd.Series
+        :return: Array booleano alineado con keys.
+        :rtype: np.ndarray
+        """
+        return self.counts(keys) > 0
+
+    def items(self, batch_size: int = SQL_BATCH) -> Iterator[pd.Series]:
+        """
+        Recorre el índice por lotes, en orden de clave si está en disco.
+
+        :param batch_size: Identificadores por lote.
+        :type batch_size: int
+        :yield: Series {identificador: apariciones}.
+        :rtype: Iterator[pd.Series]
+        """
+        if self._counts is not None:
+            pairs = iter(self._counts.items())
+        else:
+            pairs = self._db.execute(
+                "SELECT key, SUM(count) FROM keys GROUP BY key ORDER BY key"
+            )
+        while batch := list(islice(pairs, batch_size)):
+            keys, counts = zip(*batch)
+            yield pd.Series(counts, index=keys, dtype="int64")
+
+    def update(self, other: "DuplicateIndex") -> None:
+        """
+        Suma al índice todos los identificadores de otro índice.
+
+        :param other: Índice cuyos recuentos se añaden.
+        :type other: DuplicateIndex
+        """
+        for batch in other.items():
+            self._merge(batch)
+
+    def clear_source(self) -> None:
+        """
+        Olvida los identificadores de source (p. ej. al volver a procesar el archivo entero).
+        El borrado se confirma enseguida para no mantener bloqueado el histórico.
+        """
+        if self.source is not None:
+            self._pending.clear()
+            self._db.execute("DELETE FROM keys WHERE source = ?", (self.source,))
+            self._db.commit()
+
+    def commit(self) -> None:
+        """Confirma los cambios del índice persistente."""
+        if self._db is None:
+            return
+        if self._pending:
+            pending, self._pending = self._pending, {}
+            self._upsert(iter(pending.items()))
+        self._db.commit()
+
+    def close(self) -> None:
+        """Cierra el índice; los cambios no confirmados de un índice persistente se pierden."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        self._pending = None
+        if self._spill_path is not None:
+            os.unlink(self._spill_path)
+            self._spill_path = None
+        self._counts = None
+
+    def __enter__(self) -> "DuplicateIndex":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _merge(self, occurrences: pd.Series) -> None:
+        pairs = zip(occurrences.index, occurrences.to_numpy().tolist())
+        if self._pending is not None:
+            pending = self._pending
+            for key, count in pairs:
+                pending[key] = pending.get(key, 0) + count
+            return
+        if self._counts is None:
+            self._upsert(pairs)
+            return
+
+        counts = self._counts
+        for key, count in pairs:
+            counts[key] = counts.get(key, 0) + count
+        if len(counts) > self.max_memory_keys:
+            self._spill()
+
+    def _open_db(self, path: str | Path, persistent: bool) -> None:
+        db = sqlite3.connect(path, timeout=LOCK_TIMEOUT)
+        if persistent:
+            # WAL: las consultas no esperan a que otro proceso termine de escribir. Las
+            # escrituras siguen siendo de una en una, por eso se confirman en transacciones
+            # cortas (clear_source() y commit())
+            db.execute("PRAGMA journal_mode=WAL")
+        else:
+            db.execute("PRAGMA journal_mode=OFF")
+            db.execute("PRAGMA synchronous=OFF")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS keys (key TEXT NOT NULL, source TEXT NOT NULL, "
+            "count INTEGER NOT NULL, PRIMARY KEY (key, source)) WITHOUT ROWID"
+        )
+        db.execute("CREATE TEMP TABLE probe (key TEXT PRIMARY KEY) WITHOUT ROWID")
+        db.commit()
+        self._db = db
+        self._counts = None
+
+    def _spill(self) -> None:
+        """Pasa los identificadores del diccionario a una tabla SQLite temporal."""
+        counts = self._counts
+        fd, self._spill_path = tempfile.mkstemp(prefix="duplicates_", suffix=".sqlite")
+        os.close(fd)
+        self._open_db(self._spill_path, persistent=False)
+        self._upsert(iter(counts.items()))
+
+    def _upsert(self, pairs: Iterator[tuple[str, int]]) -> None:
+        source = self.source or ""
+        while batch := list(islice(pairs, SQL_BATCH)):
+            self._db.executemany(
+                "INSERT INTO keys (key, source, count) VALUES (?, ?, ?) "
+                "ON CONFLICT (key, source) DO UPDATE SET count = count + excluded.count",
+                ((key, source, count) for key, count in batch),
+            )
+
+    def _lookup(self, uniques: np.ndarray) -> np.ndarray:
+        """Recuentos de las claves (distintas) consultando la tabla con una tabla auxiliar."""
+        found: dict[str, int] = {}
+        query = "SELECT key, SUM(count) FROM keys JOIN probe USING (key)"
+        params: tuple[str, ...] = ()
+        if self.source is not None:
+            query += " WHERE source != ?"
+            params = (self.source,)
+        query += " GROUP BY key"
+        for start in range(0, len(uniques), SQL_BATCH):
+            self._db.executemany(
+                "INSERT INTO probe (key) VALUES (?)",
+                ((key,) for key in uniques[start:start + SQL_BATCH]),
+            )
+            found.update(self._db.execute(query, params))
+            self._db.execute("DELETE FROM probe")
+        if self._pending is not None:
+            # Cierra la transacción de la consulta (no hay escrituras sin confirmar): una
+            # lectura abierta impediría escribir después si otro proceso confirma entretanto
+            self._db.commit()
+        return np.fromiter(
+            (found.get(key, 0) for key in uniques), dtype=np.int64, count=len(uniques)
+        )
+
+
+def index_keys(column: pd.Series) -> pd.Series:
+    """
+    Normaliza una columna de identificadores como texto, con los nulos en NA_KEY.
+
+    :param column: Columna de identificadores.
+    :type column: pd.Series
+    :return: Serie de texto sin nulos.
+    :rtype: pd.Series
+    """
+    return column.astype("str").fillna(NA_KEY)
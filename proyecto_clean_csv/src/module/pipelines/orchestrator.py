@@ -1,137 +1,730 @@
 import json
 import logging
-from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
 
 import pandas as pd
 
+from module.cleaners import GroupImputer
 from module.cleaners.cleaner_dispatcher import DataCleanerDispatcher
-from module.read import get_csv_reader
-from module.reports import csv_exporter
-from module.reports.plot_generator import BarPlot
-from module.transforms import add_category_column, add_weekday_column, add_year_third_column
-from module.validators import DuplicateValidator, NullValidator, TypeValidator, Validator
+from module.data_models.error_index import ErrorIndex
+from module.data_models.schema import DUPLICATED_VALUES_ERROR, TRANSACTION_ID
+from module.read import ReaderCSV, ReaderCSVMmap, base_name, get_csv_reader, plan_csv_read
+from module.read.csv_reader_selector import CHUNKED_STRATEGY
+from module.reports import Exporter, get_exporter
+from module.reports.exporters import CSV_FORMAT
+from module.reports.metrics import metrics
+from module.reports.plot_generator import BarPlot, plot_filename
+from module.reports.profiler import profiler
+from module.transforms import default_pipeline
+from module.validators import ColumnConfidence, FusedValidator
+from module.validators.sampling import CONFIDENCE_LEVEL
+
+from .duplicate_index import MAX_MEMORY_KEYS, DuplicateIndex
+from .result_cache import (
+    DEFAULT_MAX_BYTES,
+    CacheEntry,
+    CacheLookup,
+    ResultCache,
+    encode_plot_counts,
+)
+from .state import DuplicateTracker, ErrorSummary, PlotCounter
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CHUNK_SIZE = 100_000
+DEFAULT_CACHE_DIR = ".cache"
+
+# Estrategias de las ejecuciones que reutilizan la caché de resultados
+CACHE_STRATEGY = "cache"
+INCREMENTAL_STRATEGY = "incremental"
+
+PLOTS = [
+    {"column": "Category", "title": "Categorías", "xlabel": "Categoría", "ylabel": "Cantidad"},
+    {
+        "column": "Year third",
+        "title": "Tercio del año",
+        "xlabel": "Tercio del Año",
+        "ylabel": "Cantidad",
+    },
+    {
+        "column": "Weekday",
+        "title": "Día de la Semana",
+        "xlabel": "Día de la Semana",
+        "ylabel": "Cantidad",
+    },
+]
+
 class DataPipelineOrchestrator:
-    def __init__(self, path: str | Path, config_path: str | Path, base_dir: str | Path) -> None:
+    def __init__(
+        self,
+        path: str | Path,
+        config_path: str | Path | dict,
+        base_dir: str | Path,
+        profile: bool = False,
+    ) -> None:
         """
         Orquestador del pipeline
 
         :param path: Ruta del archivo CSV a procesar.
-        :param config_path: Ruta del archivo de configuración JSON.
+        :param config_path: Ruta del archivo de configuración JSON, o la configuración ya
+                            cargada (p. ej. compartida entre los workers de un lote).
         :param base_dir: Ruta base del proyecto para generar archivos de salida.
+        :param profile: Si es True, mide cada etapa, limpiador y transformación y guarda el
+                        perfil en generated/<nombre>_profile.json y una tabla en .txt.
         """
+        self.profile = profile
         self.path = Path(path)
-        self.name: str = self.path.stem
+        # "ventas.csv.gz" genera las mismas salidas que "ventas.csv"
+        self.name: str = base_name(self.path)
         self._base_dir = Path(base_dir)
         self.config = self._load_config(config_path)
+        self._reader: ReaderCSV | None = None
+        # Modo compacto: columnas de baja cardinalidad categóricas desde la lectura
+        self._compact: bool = self.config.get("types", {}).get("compact", False)
+        self._coerced: dict[str, pd.Series] = {}
+        # Posiciones de las filas de cada error de la última validación
+        self._error_index: ErrorIndex | None = None
+        # Motor de "imputation.rules", ajustado con todas las filas leídas del archivo
+        self._imputer: GroupImputer | None = None
+        # Columnas cuyo informe de validación por muestreo no es concluyente
+        self._inconclusive: list[str] = []
+        self._transforms = default_pipeline(self._compact)
+        self.rows_in = 0
+        self.rows_out = 0
+        # Filas descartadas porque su "Transaction ID" ya se entregó en una ejecución anterior
+        self.redelivered = 0
+        self.errors: dict[str, list[str]] = {}
+        self._history: DuplicateIndex | None = None
+        # Identificadores del archivo que se guardan en la caché para ampliarlo después
+        self._ids: DuplicateIndex | None = None
+        self._plot_counts: dict[str, pd.Series] = {}
 
-    def _load_config(self, config_path: str | Path) -> dict:
+    def _load_config(self, config_path: str | Path | dict) -> dict:
         """Lee el archivo config.json y lo convierte en un diccionario."""
+        if isinstance(config_path, dict):
+            return config_path
+
         config_path = Path(config_path)
 
         with Path(config_path).open() as file:
             return json.load(file)
 
     def run(self) -> None:
-        df = self._read_file()
-        df = self._process(df)
-        self._report(df)
+        metrics.reset()
+        metrics.enabled = self.config.get("metrics", {}).get("enabled", False)
+
+        if self.profile:
+            profiler.start()
+        self.rows_in = self.rows_out = self.redelivered = 0
+        self.errors = {}
+        self._history = self._duplicate_history()
+        cache = self._result_cache()
+        lookup: CacheLookup | None = None
+        try:
+            if cache is not None:
+                with profiler.stage("cache_lookup"):
+                    lookup = cache.lookup(self.path, self.name, self.config)
+
+            if lookup is not None and lookup.entry is not None and self._restore(
+                cache, lookup.entry
+            ):
+                strategy = CACHE_STRATEGY
+            else:
+                strategy = self._execute(cache, lookup)
+
+            # El histórico solo se actualiza si la ejecución termina sin errores
+            if self._history is not None:
+                self._history.commit()
+                if self.redelivered:
+                    logger.info(
+                        "Se han eliminado %d filas ya entregadas en ejecuciones anteriores.",
+                        self.redelivered,
+                    )
+        finally:
+            if self._history is not None:
+                self._history.close()
+                self._history = None
+            if self._ids is not None:
+                self._ids.close()
+                self._ids = None
+            if lookup is not None:
+                cache.discard(lookup)
+            if self.profile:
+                profiler.stop()
+
+        if self.profile:
+            self._export_profile(strategy)
+
+        if metrics.enabled:
+            path = metrics.export_json(self._base_dir / "generated" / f"{self.name}_metrics.json")
+            logger.info("Métricas del pipeline guardadas en '%s'.", path)
+
+    def _execute(self, cache: ResultCache | None, lookup: CacheLookup | None) -> str:
+        """
+        Ejecuta el pipeline y, si la caché está habilitada, guarda sus salidas.
+
+        Si la caché tiene las salidas de una versión anterior del archivo a la que solo se
+        le han añadido filas, se procesan únicamente las filas nuevas.
+
+        :return: Estrategia de la ejecución.
+        :rtype: str
+        """
+        mode = self.config.get("execution", {}).get("mode", "auto")
+        previous = None
+        if lookup is not None:
+            if lookup.previous is not None and self._appends_to(lookup.previous):
+                previous = lookup.previous
+            cache.stage(lookup, previous)
+            if self._removes_duplicates():
+                self._ids = DuplicateIndex(lookup.ids_path)
+
+        if previous is not None:
+            strategy = INCREMENTAL_STRATEGY
+            with profiler.stage("total") as total:
+                self._run_incremental(cache, previous)
+                total.rows = self.rows_in
+        else:
+            with profiler.stage("plan_csv_read"):
+                plan = plan_csv_read(
+                    self.path,
+                    compact=self._compact,
+                    workers=self.config.get("execution", {}).get("read_workers"),
+                )
+            self._reader = plan.reader()
+            chunked = mode == "chunked" or (
+                mode == "auto" and plan.strategy == CHUNKED_STRATEGY
+            )
+            strategy = "chunked" if chunked else plan.strategy
+
+            with profiler.stage("total") as total:
+                if chunked:
+                    self._run_chunked()
+                else:
+                    with profiler.stage("_read_file") as stage:
+                        df = self._read_file()
+                        stage.rows = self.rows_in = len(df)
+                    self._imputer = self._group_imputer(lambda columns: [df])
+                    if self._history is not None:
+                        df = self._drop_redelivered(df)
+                        self._history.add(df[TRANSACTION_ID])
+                    if self._ids is not None:
+                        self._ids.add(df[TRANSACTION_ID])
+                    df = self._process(df)
+                    self.rows_out = len(df)
+                    self._report(df)
+                    if lookup is not None:
+                        counter = PlotCounter([spec["column"] for spec in PLOTS])
+                        counter.update(df)
+                        self._plot_counts = counter.counts()
+                total.rows = self.rows_in
+
+        if lookup is not None:
+            with profiler.stage("cache_store"):
+                self._store(cache, lookup)
+        return strategy
+
+    def _run_chunked(self, previous: CacheEntry | None = None) -> None:
+        """
+        Ejecuta el pipeline por chunks de tamaño fijo.
+
+        Cada chunk se valida, limpia y transforma por separado y se añade al archivo limpio.
+        Lo que depende del fichero completo (duplicados de "Transaction ID", recuentos de
+        los gráficos y resumen de errores) se mantiene en objetos de estado pequeños, de
+        modo que la memoria depende del tamaño del chunk y no del tamaño del fichero.
+
+        :param previous: Ejecución en caché de la parte ya procesada del archivo. Su estado
+                         es el punto de partida y las filas se añaden a su salida.
+        """
+        chunk_size = self.config.get("execution", {}).get("chunk_size", DEFAULT_CHUNK_SIZE)
+        reader = self._reader or get_csv_reader(self.path, compact=self._compact)
+
+        duplicates = self._duplicate_tracker(reader, chunk_size, appending=previous is not None)
+        plot_counter = PlotCounter([spec["column"] for spec in PLOTS])
+        error_summary = ErrorSummary()
+        if previous is not None:
+            plot_counter.merge(previous.plot_counts())
+            error_summary.update(previous.errors)
+        self._imputer = self._group_imputer(
+            lambda columns: reader.iter_batches(self.path, chunk_size, columns=columns)
+        )
+        dispatcher = DataCleanerDispatcher(self.config, force=True, imputer=self._imputer)
+
+        try:
+            with self._exporter(append=previous is not None) as exporter:
+                columns: list[str] | None = None
+                written = False
+                chunks = self._profiled(reader.iter_batches(self.path, chunk_size), "_read_file")
+                for chunk in chunks:
+                    self.rows_in += len(chunk)
+                    columns = list(chunk.columns)
+                    if self._history is not None:
+                        chunk = self._drop_redelivered(chunk)
+                    if duplicates is not None:
+                        chunk = duplicates.filter(chunk)
+                    if chunk.empty:
+                        continue
+
+                    with profiler.stage("_validacion") as stage:
+                        stage.rows = len(chunk)
+                        errors = self._validacion(chunk, log=False)
+                    error_summary.update(errors)
+
+                    with profiler.stage("_limpieza") as stage:
+                        stage.rows = len(chunk)
+                        chunk = dispatcher.clean(
+                            chunk,
+                            errors,
+                            self._take_coerced(),
+                            inplace=True,
+                            error_index=self._take_error_index(),
+                        )
+                    with profiler.stage("_transformacion") as stage:
+                        stage.rows = len(chunk)
+                        chunk = self._transformacion(chunk, log=False)
+
+                    with profiler.stage("exporter") as stage:
+                        stage.rows = len(chunk)
+                        exporter.write(chunk)
+                    written = True
+                    self.rows_out += len(chunk)
+                    plot_counter.update(chunk)
+
+                # Si se han descartado todas las filas, la salida solo lleva la cabecera
+                if not written and previous is None and columns is not None:
+                    exporter.write(self._empty_output(columns))
+
+            if duplicates is not None and self._history is not None:
+                self._history.update(duplicates.index)
+            if duplicates is not None and self._ids not in (None, duplicates.index):
+                self._ids.update(duplicates.index)
+        finally:
+            # Los índices de duplicados pueden haber pasado a un archivo temporal
+            if duplicates is not None:
+                duplicates.close()
+
+        if duplicates is not None and duplicates.removed:
+            logger.info("Se han eliminado %d filas duplicadas.", duplicates.removed)
+        if (duplicates is not None and duplicates.removed) or self.redelivered:
+            error_summary.update({TRANSACTION_ID: [DUPLICATED_VALUES_ERROR]})
+
+        self.errors = error_summary.as_dict()
+        self._log_errors(self.errors)
+        self._transforms.log_timings()
+        self._plot_counts = plot_counter.counts()
+        with profiler.stage("_generate_plots"):
+            self._generate_plots(counts=self._plot_counts)
+
+    def _empty_output(self, columns: list[str]) -> pd.DataFrame:
+        """DataFrame sin filas con las columnas leídas y las que añaden las transformaciones."""
+        derived = [
+            col
+            for transform in self._transforms.transforms
+            for col in transform.outputs
+            if col not in columns
+        ]
+        return pd.DataFrame(columns=[*columns, *derived])
+
+    def _run_incremental(self, cache: ResultCache, previous: CacheEntry) -> None:
+        """
+        Procesa solo las filas añadidas al archivo desde la ejecución guardada en caché.
+
+        Se restauran las salidas anteriores y las filas nuevas se procesan por chunks a
+        partir del byte donde terminaba el archivo, con el estado de la ejecución anterior.
+        """
+        cache.restore(previous, self._base_dir / "generated")
+        self.rows_in, self.rows_out = previous.rows_in, previous.rows_out
+        self._reader = self._tail_reader(previous)
+        logger.info(
+            "'%s' solo tiene filas nuevas desde la última ejecución: se procesan a partir "
+            "del byte %d.",
+            self.path.name,
+            previous.input_size,
+        )
+        self._run_chunked(previous)
+
+    def _result_cache(self) -> ResultCache | None:
+        """
+        Caché de resultados de la sección "cache" del config, si está habilitada.
+
+        Una ruta relativa se resuelve desde base_dir. Con un histórico de duplicados
+        (duplicates.index_path) la caché no se usa: las salidas dependen también de los
+        archivos procesados antes.
+        """
+        cache_config = self.config.get("cache", {})
+        if not cache_config.get("enabled", False):
+            return None
+        if self._history is not None:
+            logger.info("La caché de resultados no se usa con un histórico de duplicados.")
+            return None
+
+        directory = Path(cache_config.get("dir") or DEFAULT_CACHE_DIR)
+        if not directory.is_absolute():
+            directory = self._base_dir / directory
+        return ResultCache(directory, cache_config.get("max_bytes") or DEFAULT_MAX_BYTES)
+
+    def _restore(self, cache: ResultCache, entry: CacheEntry) -> bool:
+        """Copia a generated/ las salidas de la caché; False si la entrada ya no existe."""
+        with profiler.stage("cache_restore"):
+            try:
+                cache.restore(entry, self._base_dir / "generated")
+            except FileNotFoundError:
+                # Otro proceso ha eliminado la entrada por tamaño
+                return False
+        self.rows_in, self.rows_out = entry.rows_in, entry.rows_out
+        self.errors = entry.errors
+        logger.info(
+            "'%s' no ha cambiado desde la última ejecución: salidas recuperadas de la caché.",
+            self.path.name,
+        )
+        return True
+
+    def _store(self, cache: ResultCache, lookup: CacheLookup) -> None:
+        """Guarda en la caché la salida limpia, los gráficos y el estado de la ejecución."""
+        if self._ids is not None:
+            self._ids.commit()
+            self._ids.close()
+            self._ids = None
+        output = self._exporter().path
+        if not output.exists():
+            logger.warning(
+                "No se guarda '%s' en la caché: no se ha generado su salida.", self.path.name
+            )
+            return
+        plots_dir = self._base_dir / "generated" / "plots"
+        plots = [plots_dir / plot_filename(self.name, spec["column"]) for spec in PLOTS]
+        files = [output] + [plot for plot in plots if plot.exists()]
+        state = {
+            "rows_in": self.rows_in,
+            "rows_out": self.rows_out,
+            "errors": self.errors,
+            "plot_counts": encode_plot_counts(self._plot_counts),
+        }
+        cache.store(lookup, self._base_dir / "generated", files, state)
+
+    def _appends_to(self, previous: CacheEntry) -> bool:
+        """
+        Indica si las filas nuevas se pueden añadir a la salida de la ejecución anterior.
+
+        Solo se añaden filas a un CSV y sin "imputation.rules". Con keep='last' o keep=False
+        una fila nueva que repite un "Transaction ID" anterior cambia filas ya exportadas,
+        así que entonces se procesa el archivo completo.
+        """
+        if self.config.get("export", {}).get("format", CSV_FORMAT) != CSV_FORMAT:
+            return False
+        # Los estadísticos de los grupos dependen de todas las filas del archivo
+        if GroupImputer.from_config(self.config) is not None:
+            return False
+        if (
+            not self._removes_duplicates()
+            or self.config.get("duplicates", {}).get("keep", "first") == "first"
+        ):
+            return True
+        if previous.ids_path is None:
+            return False
+
+        chunk_size = self.config.get("execution", {}).get("chunk_size", DEFAULT_CHUNK_SIZE)
+        reader = self._tail_reader(previous)
+        with DuplicateIndex(previous.ids_path) as ids:
+            for batch in reader.iter_batches(self.path, chunk_size, columns=[TRANSACTION_ID]):
+                if ids.contains(batch[TRANSACTION_ID]).any():
+                    logger.info(
+                        "Las filas nuevas de '%s' repiten transacciones anteriores: se procesa "
+                        "el archivo completo.",
+                        self.path.name,
+                    )
+                    return False
+        return True
+
+    def _tail_reader(self, previous: CacheEntry) -> ReaderCSVMmap:
+        """Lector de las filas posteriores al final del archivo en la ejecución anterior."""
+        return ReaderCSVMmap(
+            workers=self.config.get("execution", {}).get("read_workers"),
+            compact=self._compact,
+            start=previous.input_size,
+        )
+
+    @staticmethod
+    def _profiled(batches: Iterator[pd.DataFrame], name: str) -> Iterator[pd.DataFrame]:
+        """Mide como etapa name la lectura de cada lote del iterador."""
+        while True:
+            with profiler.stage(name) as stage:
+                batch = next(batches, None)
+                stage.rows = 0 if batch is None else len(batch)
+            if batch is None:
+                return
+            yield batch
+
+    def _export_profile(self, mode: str) -> None:
+        """Guarda el perfil de la ejecución y registra la tabla en el log."""
+        json_path, table_path = profiler.export(
+            self._base_dir / "generated" / f"{self.name}_profile.json",
+            file=str(self.path),
+            mode=mode,
+            rows_in=self.rows_in,
+            rows_out=self.rows_out,
+        )
+        logger.info(
+            "Perfil de la ejecución guardado en '%s' y '%s':\n%s",
+            json_path,
+            table_path,
+            profiler.table(),
+        )
+
+    def _duplicate_tracker(
+        self, reader: ReaderCSV, chunk_size: int, appending: bool = False
+    ) -> DuplicateTracker | None:
+        """
+        Prepara el estado de duplicados del modo por chunks, si está habilitado.
+
+        Al añadir filas a una ejecución anterior con keep='first', los identificadores ya
+        procesados (copiados de la caché) cuentan como vistos.
+        """
+        if not self._removes_duplicates():
+            return None
+
+        dup_config = self.config.get("duplicates", {})
+        keep = dup_config.get("keep", "first")
+        key_batches = (
+            reader.iter_batches(self.path, chunk_size, columns=[TRANSACTION_ID])
+            if keep != "first"
+            else []
+        )
+        return DuplicateTracker.from_key_batches(
+            TRANSACTION_ID,
+            keep,
+            key_batches,
+            dup_config.get("max_memory_keys") or MAX_MEMORY_KEYS,
+            seen=self._ids if appending and keep == "first" else None,
+        )
+
+    def _group_imputer(
+        self, batches: Callable[[list[str]], Iterable[pd.DataFrame]]
+    ) -> GroupImputer | None:
+        """
+        Prepara el motor de "imputation.rules", si está habilitado.
+
+        Los estadísticos de los grupos se calculan con todas las filas leídas, antes de
+        eliminar duplicados o filas con nulos, de modo que son los mismos en memoria y por
+        chunks. En el modo por chunks supone una lectura previa de las columnas de las reglas.
+
+        :param batches: Devuelve los DataFrames con las columnas indicadas.
+        :type batches: Callable[[list[str]], Iterable[pd.DataFrame]]
+        :return: Motor ajustado, o None si no hay reglas.
+        :rtype: GroupImputer | None
+        """
+        imputer = GroupImputer.from_config(self.config)
+        if imputer is None:
+            return None
+        with profiler.stage("imputation_fit") as stage:
+            for batch in batches(imputer.columns):
+                stage.rows += len(batch)
+                imputer.fit(batch)
+        return imputer
+
+    def _removes_duplicates(self) -> bool:
+        return bool(
+            self.config.get("duplicates", {}).get("apply", False)
+            and self.config.get("validations", {}).get("validate_duplicates", False)
+        )
+
+    def _duplicate_history(self) -> DuplicateIndex | None:
+        """
+        Abre el histórico de "Transaction ID" de "duplicates.index_path", si está configurado.
+
+        Una ruta relativa se resuelve desde base_dir, de modo que todos los archivos de un
+        lote comparten el mismo histórico. Cada archivo solo se compara con los
+        identificadores de los demás: volver a procesarlo no elimina sus filas.
+        """
+        index_path = self.config.get("duplicates", {}).get("index_path")
+        if not index_path or not self._removes_duplicates():
+            return None
+
+        index_path = Path(index_path)
+        if not index_path.is_absolute():
+            index_path = self._base_dir / index_path
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        history = DuplicateIndex(index_path, source=self.name)
+        # El archivo se procesa entero: sus identificadores anteriores se sustituyen
+        history.clear_source()
+        return history
+
+    def _drop_redelivered(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Elimina las filas cuyo "Transaction ID" ya se entregó en una ejecución anterior.
+
+        Con keep='last' la fila nueva sustituye a la anterior, que ya está exportada: se
+        conserva y solo se registra.
+        """
+        redelivered = self._history.contains(df[TRANSACTION_ID])
+        count = int(redelivered.sum())
+        if not count:
+            return df
+
+        if self.config.get("duplicates", {}).get("keep", "first") == "last":
+            logger.info(
+                "%d filas repiten transacciones de ejecuciones anteriores y se conservan "
+                "(keep='last').",
+                count,
+            )
+            return df
+
+        self.redelivered += count
+        return df[~redelivered].reset_index(drop=True)
+
+    def _exporter(self, append: bool = False) -> Exporter:
+        """Exportador del formato configurado en "export" para generated/<nombre>_clean.*."""
+        return get_exporter(self._base_dir / "generated", self.name, self.config, append)
 
     def _read_file(self) -> pd.DataFrame:
-        reader = get_csv_reader(self.path)
+        reader = self._reader or get_csv_reader(self.path, compact=self._compact)
         return reader.read(self.path)
 
     def _process(self, df: pd.DataFrame) -> pd.DataFrame:
-        errors_dict = self._validacion(df)
-        df = self._limpieza(df, errors_dict)
-        df = self._transformacion(df)
+        with profiler.stage("_validacion") as stage:
+            stage.rows = len(df)
+            errors_dict = self._validacion(df)
+        # Igual que el resumen del modo por chunks: se guarda con la ejecución en la caché
+        self.errors = errors_dict
+        with profiler.stage("_limpieza") as stage:
+            stage.rows = len(df)
+            df = self._limpieza(df, errors_dict)
+        with profiler.stage("_transformacion") as stage:
+            stage.rows = len(df)
+            df = self._transformacion(df)
         return df
 
     def _report(self, df: pd.DataFrame) -> pd.DataFrame:
-        csv_exporter(self, df)
-        self._generate_plots(df)
+        with profiler.stage("exporter") as stage, self._exporter() as exporter:
+            stage.rows = len(df)
+            exporter.write(df)
+        with profiler.stage("_generate_plots") as stage:
+            stage.rows = len(df)
+            self._generate_plots(df)
         return df
 
 
-    def _validacion(self, df: pd.DataFrame) -> dict[str, list[str]]:
+    def _validacion(self, df: pd.DataFrame, log: bool = True) -> dict[str, list[str]]:
         """
         Realiza la validación del DataFrame utilizando los validadores definidos.
         Si el DataFrame está vacío, devuelve un error indicando que no contiene filas.
 
         :param df: DataFrame de pandas a validar.
         :type df: pd.DataFrame
+        :param log: Si es False no se registran los errores (el modo por chunks los resume).
+        :type log: bool
         :return: Diccionario con los errores encontrados de cada columna.
         :rtype: dict[str, list[str]]
         """
         if df.empty:
             return {"__dataframe__": ["El DataFrame no contiene filas"]}
 
-        validators: list[Validator]= [
-            NullValidator(),
-            DuplicateValidator(),
-            TypeValidator(),
+        # Un único recorrido por columna para nulos, duplicados y tipos
+        validator = FusedValidator()
+        all_errors = validator.validate(df, self.config)
+        self._coerced = validator.coerced
+        self._error_index = validator.error_index
+        self._inconclusive = [
+            col for col, confidence in validator.confidence.items() if not confidence.conclusive
         ]
 
-        all_errors: dict[str, list] = defaultdict(list)
-
-        for validator in validators:
-            errors = validator.validate(df, self.config)
+        if log:
+            self._log_errors(all_errors)
+            self._log_confidence(validator.confidence)
 
-            for column, error_list in errors.items():
-                all_errors[column].extend(error_list)
+        return all_errors
 
-        if all_errors:
+    def _log_errors(self, errors: dict[str, list]) -> None:
+        if errors:
             logger.info(
                 "Errores de validación encontrados:\n%s",
-                json.dumps(all_errors, indent=2, ensure_ascii=False)
+                json.dumps(errors, indent=2, ensure_ascii=False)
             )
 
-        return dict(all_errors)
+    def _log_confidence(self, confidence: dict[str, ColumnConfidence]) -> None:
+        """Registra la fiabilidad del informe de cada columna validada por muestreo."""
+        if not confidence:
+            return
+        sample = next(iter(confidence.values()))
+        lines = [
+            f"  - {col}: "
+            + (
+                "informe exacto"
+                if column.conclusive
+                else f"sin errores en la muestra, como mucho un {column.max_error_rate:.4%} "
+                f"de filas con errores ({CONFIDENCE_LEVEL:.0%} de confianza)"
+            )
+            for col, column in confidence.items()
+        ]
+        logger.info(
+            "Validación por muestreo de %d de %d filas:\n%s",
+            sample.sampled,
+            sample.rows,
+            "\n".join(lines),
+        )
 
-    def _transformacion(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = add_year_third_column(df)
-        df = add_weekday_column(df)
-        df = add_category_column(df)
-        return df
+    def _transformacion(self, df: pd.DataFrame, log: bool = True) -> pd.DataFrame:
+        """
+        Añade las columnas derivadas (Year third, Weekday y Category) en una sola pasada.
+
+        :param df: DataFrame limpio.
+        :type df: pd.DataFrame
+        :param log: Si es False no se registran los tiempos (el modo por chunks los resume).
+        :type log: bool
+        :return: DataFrame con las columnas nuevas.
+        :rtype: pd.DataFrame
+        """
+        return self._transforms.run(df, log=log)
 
     def _limpieza(self, df: pd.DataFrame, error_report: dict[str, list]) -> pd.DataFrame:
-        dispatcher = DataCleanerDispatcher(self.config)
-        return dispatcher.clean(df, error_report)
+        # Si el muestreo no descarta errores en alguna columna, cada limpiador se aplica
+        # sobre todas sus columnas, como en el modo por chunks
+        dispatcher = DataCleanerDispatcher(
+            self.config, force=bool(self._inconclusive), imputer=self._imputer
+        )
+        # El DataFrame leído no se usa después de limpiarlo: se cede sin copiarlo
+        return dispatcher.clean(
+            df,
+            error_report,
+            self._take_coerced(),
+            inplace=True,
+            error_index=self._take_error_index(),
+        )
+
+    def _take_coerced(self) -> dict[str, pd.Series]:
+        """Entrega las columnas convertidas en la validación y libera la referencia."""
+        coerced, self._coerced = self._coerced, {}
+        return coerced
+
+    def _take_error_index(self) -> ErrorIndex | None:
+        """Entrega el índice de errores de la validación y libera la referencia."""
+        error_index, self._error_index = self._error_index, None
+        return error_index
 
-    def _generate_plots(self, df: pd.DataFrame):
+    def _generate_plots(
+        self, df: pd.DataFrame | None = None, counts: dict[str, pd.Series] | None = None
+    ):
+        """
+        Genera los gráficos de barras definidos en PLOTS.
+
+        :param df: DataFrame limpio (modo en memoria).
+        :param counts: Recuentos acumulados por columna (modo por chunks).
+        """
         plots = [
             BarPlot(
                 df,
                 self._base_dir,
                 f"{self.name}",
-                column="Category",
-                title="Categorías",
-                xlabel="Categoría",
-                ylabel="Cantidad"
-            ),
-            BarPlot(
-                df, self._base_dir,
-                f"{self.name}",
-                column="Year third",
-                title="Tercio del año",
-                xlabel="Tercio del Año",
-                ylabel="Cantidad"
-            ),
-            BarPlot(
-                df,
-                self._base_dir,
-                f"{self.name}",
-                column="Weekday",
-                title="Día de la Semana",
-                xlabel="Día de la Semana",
-                ylabel="Cantidad"
-            ),
+                # Una columna sin recuentos no tiene filas: su gráfico anterior se elimina
+                counts=(
+                    counts.get(spec["column"], pd.Series(dtype="int64"))
+                    if counts is not None
+                    else None
+                ),
+                **spec,
+            )
+            for spec in PLOTS
         ]
 
-
         for plot in plots:
             plot.plot()
-
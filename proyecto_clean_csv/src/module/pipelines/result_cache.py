@@ -0,0 +1,435 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from module.read.compression import detect_compression
+
+logger = logging.getLogger(__name__)
+
+MANIFEST = "manifest.json"
+IDS_FILE = "ids.sqlite"
+FILES_DIR = "files"
+
+# Bloque de lectura al calcular el hash del archivo de entrada
+HASH_BLOCK = 1024 * 1024  # 1MB
+# Tamaño máximo por defecto de la carpeta de la caché
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024  # 1GB
+
+# Secciones del config que no cambian las salidas: cómo se ejecuta, no qué se calcula
+IGNORED_CONFIG_KEYS = ("execution", "metrics", "cache")
+
+MODULE_DIR = Path(__file__).resolve().parents[1]
+
+
+@dataclass
+class CacheEntry:
+    """Salidas guardadas de una ejecución y el estado necesario para ampliarlas."""
+
+    directory: Path
+    manifest: dict[str, Any]
+
+    @property
+    def input_size(self) -> int:
+        return self.manifest["input"]["size"]
+
+    @property
+    def files(self) -> list[str]:
+        """Rutas de las salidas relativas a la carpeta generated/."""
+        return self.manifest["files"]
+
+    @property
+    def ids_path(self) -> Path | None:
+        """Índice de "Transaction ID" de la entrada, si se eliminan duplicados."""
+        path = self.directory / IDS_FILE
+        return path if path.exists() else None
+
+    @property
+    def rows_in(self) -> int:
+        return self.manifest["rows_in"]
+
+    @property
+    def rows_out(self) -> int:
+        return self.manifest["rows_out"]
+
+    @property
+    def errors(self) -> dict[str, list[str]]:
+        return self.manifest["errors"]
+
+    def plot_counts(self) -> dict[str, pd.Series]:
+        """Recuentos de los gráficos con el formato de PlotCounter.counts()."""
+        return {
+            col: pd.Series(
+                [count for _, count in pairs],
+                index=[value for value, _ in pairs],
+                name="count",
+                dtype="int64",
+            )
+            for col, pairs in self.manifest["plot_counts"].items()
+        }
+
+
+@dataclass
+class CacheLookup:
+    """
+    Resultado de buscar un archivo en la caché.
+
+        - entry: salidas de exactamente esta entrada, config y versión del código.
+        - previous: salidas de una versión anterior del archivo de la que el actual solo
+          añade filas al final (se pueden procesar solo las nuevas).
+    """
+
+    key: str
+    name: str
+    input: dict[str, Any]
+    config_hash: str
+    entry: CacheEntry | None = None
+    previous: CacheEntry | None = None
+    staging: Path | None = field(default=None, repr=False)
+
+    @property
+    def ids_path(self) -> Path:
+        """Índice de "Transaction ID" que la ejecución deja en su carpeta temporal."""
+        return self.staging / IDS_FILE
+
+
+class ResultCache:
+    """
+    Caché de las salidas del pipeline en una carpeta con tamaño limitado.
+
+    La clave de cada entrada combina el hash del contenido del archivo de entrada, el hash
+    del config (sin las secciones que solo cambian cómo se ejecuta) y la versión del código
+    del paquete module. Si el archivo no ha cambiado de tamaño ni de fecha de modificación
+    se reutiliza el hash guardado sin volver a leerlo.
+
+    Cuando la carpeta supera max_bytes se eliminan las entradas usadas hace más tiempo (LRU).
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """
+        :param directory: Carpeta de la caché; se crea si no existe.
+        :type directory: str | Path
+        :param max_bytes: Tamaño máximo de la carpeta en bytes.
+        :type max_bytes: int
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._entries = self.directory / "entries"
+        self._staging = self.directory / "staging"
+
+    def lookup(self, path: str | Path, name: str, config: dict[str, Any]) -> CacheLookup:
+        """
+        Busca las salidas de un archivo con un config dado.
+
+        :param path: Archivo de entrada.
+        :type path: str | Path
+        :param name: Nombre base de las salidas (forma parte de la clave, como el contenido).
+        :type name: str
+        :param config: Configuración completa del pipeline.
+        :type config: dict[str, Any]
+        :return: Clave de la ejecución y, si existen, la entrada exacta o una anterior
+                 ampliable.
+        :rtype: CacheLookup
+        """
+        path = Path(path).resolve()
+        stat = path.stat()
+        config_digest = config_hash(config)
+        version = code_version()
+        manifests = list(self._manifests())
+
+        # Mismo archivo sin modificar: el hash guardado sigue siendo válido
+        digest = next(
+            (
+                entry.manifest["input"]["digest"]
+                for entry in manifests
+                if entry.manifest["input"]["path"] == str(path)
+                and entry.manifest["input"]["size"] == stat.st_size
+                and entry.manifest["input"]["mtime_ns"] == stat.st_mtime_ns
+            ),
+            None,
+        )
+
+        # Versiones anteriores del mismo archivo, más cortas, que podrían ser un prefijo
+        candidates = [
+            entry
+            for entry in manifests
+            if entry.manifest["input"]["path"] == str(path)
+            and entry.manifest["name"] == name
+            and entry.manifest["config_hash"] == config_digest
+            and entry.manifest["code_version"] == version
+            and entry.manifest["input"]["ends_with_newline"]
+            and entry.input_size < stat.st_size
+        ]
+        prefixes: dict[int, str] = {}
+        if digest is None:
+            digest, prefixes = file_digest(path, [entry.input_size for entry in candidates])
+
+        key = hashlib.sha256(f"{digest}:{name}:{config_digest}:{version}".encode()).hexdigest()
+        result = CacheLookup(
+            key=key,
+            name=name,
+            input={
+                "path": str(path),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "digest": digest,
+                "ends_with_newline": _ends_with_newline(path),
+            },
+            config_hash=config_digest,
+        )
+
+        entry = self._load(self._entries / key)
+        if entry is not None:
+            self._touch(entry)
+            result.entry = entry
+            return result
+
+        # Solo se amplían archivos sin comprimir: las filas nuevas se leen desde su posición
+        if detect_compression(path) is None:
+            appendable = [
+                entry
+                for entry in candidates
+                if prefixes.get(entry.input_size) == entry.manifest["input"]["digest"]
+            ]
+            if appendable:
+                result.previous = max(appendable, key=lambda entry: entry.input_size)
+        return result
+
+    def stage(self, lookup: CacheLookup, base: CacheEntry | None = None) -> Path:
+        """
+        Crea la carpeta temporal donde la ejecución deja su estado antes de guardarse.
+
+        :param lookup: Búsqueda de la ejecución en curso.
+        :type lookup: CacheLookup
+        :param base: Entrada que la ejecución amplía; se parte de una copia de su índice.
+        :type base: CacheEntry | None
+        :return: Carpeta temporal de la entrada.
+        :rtype: Path
+        """
+        self._staging.mkdir(parents=True, exist_ok=True)
+        lookup.staging = Path(tempfile.mkdtemp(prefix=f"{lookup.key[:12]}_", dir=self._staging))
+        if base is not None and base.ids_path is not None:
+            shutil.copy2(base.ids_path, lookup.ids_path)
+        return lookup.staging
+
+    def store(
+        self,
+        lookup: CacheLookup,
+        generated_dir: str | Path,
+        files: list[Path],
+        state: dict[str, Any],
+    ) -> CacheEntry:
+        """
+        Guarda las salidas de la ejecución y elimina las entradas menos usadas si la
+        carpeta supera max_bytes.
+
+        :param lookup: Búsqueda de la ejecución, con su carpeta temporal (ver stage()).
+        :type lookup: CacheLookup
+        :param generated_dir: Carpeta generated/ de la que cuelgan las salidas.
+        :type generated_dir: str | Path
+        :param files: Salidas que se guardan.
+        :type files: list[Path]
+        :param state: Filas, errores y recuentos de los gráficos de la ejecución.
+        :type state: dict[str, Any]
+        :return: Entrada guardada.
+        :rtype: CacheEntry
+        """
+        staging = lookup.staging or self.stage(lookup)
+        generated_dir = Path(generated_dir)
+        relative = [str(Path(file).relative_to(generated_dir)) for file in files]
+        for file, name in zip(files, relative):
+            target = staging / FILES_DIR / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(file, target)
+
+        now = time.time()
+        manifest = {
+            "key": lookup.key,
+            "name": lookup.name,
+            "input": lookup.input,
+            "config_hash": lookup.config_hash,
+            "code_version": code_version(),
+            "files": relative,
+            "created": now,
+            "last_used": now,
+            **state,
+        }
+        (staging / MANIFEST).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+        target = self._entries / lookup.key
+        self._entries.mkdir(parents=True, exist_ok=True)
+        try:
+            staging.rename(target)
+        except OSError:
+            # Otro proceso ha guardado la misma entrada mientras tanto
+            shutil.rmtree(staging, ignore_errors=True)
+        lookup.staging = None
+
+        self.evict(keep=lookup.key)
+        return CacheEntry(target, manifest)
+
+    def discard(self, lookup: CacheLookup) -> None:
+        """Elimina la carpeta temporal de una ejecución que no ha terminado."""
+        if lookup.staging is not None:
+            shutil.rmtree(lookup.staging, ignore_errors=True)
+            lookup.staging = None
+
+    def restore(self, entry: CacheEntry, generated_dir: str | Path) -> list[Path]:
+        """
+        Copia las salidas de una entrada a la carpeta generated/.
+
+        :param entry: Entrada de la caché.
+        :type entry: CacheEntry
+        :param generated_dir: Carpeta generated/ de destino.
+        :type generated_dir: str | Path
+        :return: Rutas de las salidas restauradas.
+        :rtype: list[Path]
+        """
+        restored = []
+        for name in entry.files:
+            target = Path(generated_dir) / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(entry.directory / FILES_DIR / name, target)
+            restored.append(target)
+        return restored
+
+    def evict(self, keep: str | None = None) -> int:
+        """
+        Elimina las entradas usadas hace más tiempo hasta que la carpeta cabe en max_bytes.
+
+        :param keep: Clave que no se elimina aunque sea la más antigua (la recién guardada).
+        :type keep: str | None
+        :return: Número de entradas eliminadas.
+        :rtype: int
+        """
+        entries = sorted(self._manifests(), key=lambda entry: entry.manifest["last_used"])
+        sizes = {entry.directory: _tree_size(entry.directory) for entry in entries}
+        total = sum(sizes.values())
+        removed = 0
+        for entry in entries:
+            if total <= self.max_bytes:
+                break
+            if entry.manifest["key"] == keep:
+                continue
+            shutil.rmtree(entry.directory, ignore_errors=True)
+            total -= sizes[entry.directory]
+            removed += 1
+        if removed:
+            logger.info("Caché: %d entradas antiguas eliminadas por tamaño.", removed)
+        return removed
+
+    def _manifests(self) -> list[CacheEntry]:
+        if not self._entries.exists():
+            return []
+        entries = (self._load(directory) for directory in self._entries.iterdir())
+        return [entry for entry in entries if entry is not None]
+
+    @staticmethod
+    def _load(directory: Path) -> CacheEntry | None:
+        try:
+            manifest = json.loads((directory / MANIFEST).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return CacheEntry(directory, manifest)
+
+    @staticmethod
+    def _touch(entry: CacheEntry) -> None:
+        entry.manifest["last_used"] = time.time()
+        path = entry.directory / MANIFEST
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(entry.manifest, indent=2), encoding="utf-8")
+        os.replace(temporary, path)
+
+
+def encode_plot_counts(counts: dict[str, pd.Series]) -> dict[str, list[list[Any]]]:
+    """
+    Recuentos de los gráficos como pares [valor, recuento], que JSON guarda sin perder el
+    tipo de los valores (una clave de un objeto JSON siempre es texto).
+
+    :param counts: Recuentos con el formato de PlotCounter.counts().
+    :type counts: dict[str, pd.Series]
+    :return: {columna: [[valor, recuento], ...]}.
+    :rtype: dict[str, list[list[Any]]]
+    """
+    return {
+        col: [list(pair) for pair in zip(series.index.tolist(), series.tolist())]
+        for col, series in counts.items()
+    }
+
+
+def file_digest(path: str | Path, prefixes: list[int] = ()) -> tuple[str, dict[int, str]]:
+    """
+    Hash BLAKE2b del contenido del archivo, leyéndolo una sola vez.
+
+    :param path: Archivo.
+    :type path: str | Path
+    :param prefixes: Tamaños de los prefijos del archivo cuyo hash también se calcula.
+    :type prefixes: list[int]
+    :return: Hash del archivo completo y {tamaño: hash} de cada prefijo.
+    :rtype: tuple[str, dict[int, str]]
+    """
+    digest = hashlib.blake2b()
+    pending = sorted(set(prefixes))
+    found: dict[int, str] = {}
+    position = 0
+    with open(path, "rb") as fichero:
+        while block := fichero.read(HASH_BLOCK):
+            # Se parte el bloque en cada prefijo para tomar el hash justo en su final
+            while pending and position + len(block) >= pending[0]:
+                cut = pending.pop(0) - position
+                digest.update(block[:cut])
+                found[position + cut] = digest.hexdigest()
+                block = block[cut:]
+                position += cut
+            digest.update(block)
+            position += len(block)
+    return digest.hexdigest(), found
+
+
+def config_hash(config: dict[str, Any]) -> str:
+    """
+    Hash de las secciones del config que determinan las salidas.
+
+    :param config: Configuración completa del pipeline.
+    :type config: dict[str, Any]
+    :return: Hash SHA-256 en hexadecimal.
+    :rtype: str
+    """
+    relevant = {key: value for key, value in config.items() if key not in IGNORED_CONFIG_KEYS}
+    return hashlib.sha256(json.dumps(relevant, sort_keys=True).encode()).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def code_version() -> str:
+    """
+    Versión del código: hash de los fuentes del paquete module y la versión de pandas.
+
+    :return: Hash SHA-256 en hexadecimal.
+    :rtype: str
+    """
+    digest = hashlib.sha256(pd.__version__.encode())
+    for source in sorted(MODULE_DIR.rglob("*.py")):
+        digest.update(str(source.relative_to(MODULE_DIR)).encode())
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def _ends_with_newline(path: Path) -> bool:
+    with open(path, "rb") as fichero:
+        if fichero.seek(0, os.SEEK_END) == 0:
+            return False
+        fichero.seek(-1, os.SEEK_END)
+        return fichero.read(1) == b"\n"
+
+
+def _tree_size(directory: Path) -> int:
+    return sum(file.stat().st_size for file in directory.rglob("*") if file.is_file())
@@ -0,0 +1,169 @@
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+from .duplicate_index import MAX_MEMORY_KEYS, DuplicateIndex, index_keys
+
+
+class DuplicateTracker:
+    """
+    Estado de duplicados que se conserva entre chunks.
+
+    Reproduce la semántica de ``drop_duplicates(subset=[column], keep=keep)`` sobre el fichero
+    completo aunque los datos lleguen por trozos:
+        - 'first': basta con el índice de identificadores ya vistos.
+        - 'last' y False: necesitan el número total de apariciones de cada identificador,
+          que se obtiene con una pasada previa que solo lee la columna clave.
+
+    Los identificadores se guardan en DuplicateIndex, que pasa a disco si hay demasiados
+    distintos, así que la memoria no depende del tamaño del fichero ni de su cardinalidad.
+    """
+
+    def __init__(
+        self,
+        column: str,
+        keep: Literal["first", "last", False] = "first",
+        counts: DuplicateIndex | None = None,
+        max_memory_keys: int = MAX_MEMORY_KEYS,
+        seen: DuplicateIndex | None = None,
+    ) -> None:
+        """
+        :param seen: Identificadores de filas anteriores al primer chunk (p. ej. las ya
+                     procesadas de un archivo al que solo se le han añadido filas). El
+                     tracker añade a este índice los que va viendo, pero no lo cierra.
+        """
+        if keep not in ("first", "last", False):
+            raise ValueError(f"Valor de keep no soportado: {keep}")
+        if keep != "first" and counts is None:
+            raise ValueError("keep='last' o keep=False necesitan el recuento previo de claves")
+
+        self.column = column
+        self.keep = keep
+        self.removed = 0
+        self._owns_seen = seen is None
+        self._seen = DuplicateIndex(max_memory_keys=max_memory_keys) if seen is None else seen
+        self._total = counts
+
+    @classmethod
+    def from_key_batches(
+        cls,
+        column: str,
+        keep: Literal["first", "last", False],
+        batches: Iterable[pd.DataFrame],
+        max_memory_keys: int = MAX_MEMORY_KEYS,
+        seen: DuplicateIndex | None = None,
+    ) -> "DuplicateTracker":
+        """
+        Construye el estado a partir de una pasada previa sobre la columna clave.
+
+        :param column: Columna que identifica cada fila.
+        :param keep: Estrategia de conservación de duplicados.
+        :param batches: Chunks que contienen, al menos, la columna clave.
+        :param max_memory_keys: Identificadores distintos en memoria antes de pasar a disco.
+        :param seen: Identificadores de filas anteriores al primer chunk.
+        :return: Estado listo para filtrar los chunks en orden.
+        :rtype: DuplicateTracker
+        """
+        counts = None
+        if keep != "first":
+            counts = DuplicateIndex(max_memory_keys=max_memory_keys)
+            for batch in batches:
+                counts.add(batch[column])
+        return cls(column, keep, counts, max_memory_keys, seen)
+
+    @property
+    def index(self) -> DuplicateIndex:
+        """Identificadores del fichero: los vistos hasta ahora, o todos si hubo pasada previa."""
+        return self._seen if self._total is None else self._total
+
+    def filter(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        Elimina del chunk las filas duplicadas respecto a todo el fichero.
+
+        Los chunks deben recibirse en el mismo orden en el que aparecen en el fichero.
+
+        :param chunk: Chunk de datos.
+        :return: Chunk sin los duplicados descartados por la estrategia.
+        :rtype: pd.DataFrame
+        """
+        keys = index_keys(chunk[self.column])
+
+        if self.keep == "first":
+            mask = ~keys.duplicated(keep="first").to_numpy() & ~self._seen.contains(keys)
+            self._seen.add(keys[mask])
+        elif self.keep == "last":
+            in_chunk = keys.map(keys.value_counts()).to_numpy()
+            remaining = self._total.counts(keys) - self._seen.counts(keys)
+            later_in_chunk = keys.groupby(keys).cumcount(ascending=False).to_numpy()
+            mask = (later_in_chunk == 0) & (remaining == in_chunk)
+            self._seen.add(keys)
+        else:
+            mask = self._total.counts(keys) == 1
+
+        mask = np.asarray(mask, dtype=bool)
+        self.removed += int((~mask).sum())
+        return chunk[mask].reset_index(drop=True)
+
+    def close(self) -> None:
+        """Libera los índices (y sus archivos temporales, si han pasado a disco)."""
+        if self._owns_seen:
+            self._seen.close()
+        if self._total is not None:
+            self._total.close()
+
+
+class PlotCounter:
+    """Acumula entre chunks los recuentos de las columnas que se representan en los gráficos."""
+
+    def __init__(self, columns: list[str]) -> None:
+        self.columns = columns
+        self._counts: dict[str, Counter] = {col: Counter() for col in columns}
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        for col in self.columns:
+            if col in chunk.columns:
+                counts = chunk[col].value_counts()
+                self._counts[col].update(counts[counts > 0].to_dict())
+
+    def merge(self, counts: dict[str, pd.Series]) -> None:
+        """
+        Suma recuentos ya calculados (p. ej. los de una ejecución anterior guardada en caché).
+
+        :param counts: Recuentos con el formato de counts().
+        :type counts: dict[str, pd.Series]
+        """
+        for col, series in counts.items():
+            if col in self._counts:
+                self._counts[col].update(series.to_dict())
+
+    def counts(self) -> dict[str, pd.Series]:
+        """
+        Devuelve los recuentos acumulados con el mismo formato que ``value_counts``.
+
+        :return: Diccionario {columna: Serie de recuentos ordenada de mayor a menor}.
+        :rtype: dict[str, pd.Series]
+        """
+        return {
+            col: pd.Series(dict(counter.most_common()), name="count", dtype="int64")
+            for col, counter in self._counts.items()
+            if counter
+        }
+
+
+class ErrorSummary:
+    """Unión de los informes de validación de todos los chunks."""
+
+    def __init__(self) -> None:
+        self._errors: dict[str, list[str]] = defaultdict(list)
+
+    def update(self, errors: dict[str, list[str]]) -> None:
+        for column, error_list in errors.items():
+            for error in error_list:
+                if error not in self._errors[column]:
+                    self._errors[column].append(error)
+
+    def as_dict(self) -> dict[str, list[str]]:
+        return dict(self._errors)
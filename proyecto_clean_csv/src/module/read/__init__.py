@@ -1,7 +1,14 @@
-from .csv_reader_selector import get_csv_reader
-from .reader import ReaderCSV
+from .compression import base_name, detect_compression, open_compressed
+from .csv_reader_selector import ReadPlan, get_csv_reader, plan_csv_read
+from .reader import ReaderCSV, ReaderCSVMmap
 
 __all__ = [
+    "base_name",
+    "detect_compression",
+    "open_compressed",
     "ReaderCSV",
+    "ReaderCSVMmap",
+    "ReadPlan",
     "get_csv_reader",
+    "plan_csv_read",
 ]
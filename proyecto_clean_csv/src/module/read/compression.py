@@ -0,0 +1,215 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+import zipfile
+import zlib
+from pathlib import Path
+from typing import IO, Any
+
+# Sufijo de archivo -> método de compresión (los mismos nombres que usa pandas)
+COMPRESSIONS = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".zst": "zstd",
+    ".zip": "zip",
+}
+SUFFIXES = {method: suffix for suffix, method in COMPRESSIONS.items()}
+
+# Ratio de compresión típico de un CSV, si no se puede medir con una muestra
+COMPRESSION_RATIOS = {
+    "gzip": 5.0,
+    "bz2": 6.0,
+    "xz": 7.0,
+    "zstd": 5.0,
+    "zip": 5.0,
+}
+
+# Nivel por defecto al escribir: gzip.open usa 9, que es mucho más lento y apenas comprime más
+DEFAULT_LEVELS = {"gzip": 6, "bz2": 9, "xz": 6, "zstd": 3}
+
+# Bytes comprimidos que se descomprimen para medir el ratio del archivo
+SAMPLE_COMPRESSED_BYTES = 1024 * 1024  # 1MB
+# Diferencia relativa máxima entre ISIZE y la estimación por muestra para fiarse de ISIZE
+ISIZE_TOLERANCE = 0.2
+
+
+def detect_compression(path: str | Path) -> str | None:
+    """
+    Método de compresión según el sufijo del archivo ("ventas.csv.gz" -> "gzip").
+
+    :param path: Ruta del archivo.
+    :type path: str | Path
+    :return: Método de compresión o None si el archivo no está comprimido.
+    :rtype: str | None
+    """
+    return COMPRESSIONS.get(Path(path).suffix.lower())
+
+
+def base_name(path: str | Path) -> str:
+    """Nombre del archivo sin extensión ni sufijo de compresión ("ventas.csv.gz" -> "ventas")."""
+    path = Path(path)
+    if detect_compression(path) is not None:
+        path = Path(path.stem)
+    return path.stem
+
+
+def open_compressed(
+    path: str | Path,
+    mode: str = "rt",
+    compression: str | None = None,
+    level: int | None = None,
+) -> IO[Any]:
+    """
+    Abre un archivo descomprimiendo (o comprimiendo) al vuelo, sin cargarlo entero.
+
+    En modo texto se usa UTF-8 y newline="", como necesita el módulo csv.
+
+    :param path: Ruta del archivo.
+    :type path: str | Path
+    :param mode: "rt", "rb", "wt", "wb", "at" o "ab". Al añadir a un archivo comprimido se
+                 escribe un flujo nuevo a continuación del existente.
+    :type mode: str
+    :param compression: Método de COMPRESSIONS, o None para deducirlo del sufijo.
+    :type compression: str | None
+    :param level: Nivel de compresión al escribir; por defecto DEFAULT_LEVELS.
+    :type level: int | None
+    :raises ValueError: Si el método no existe o no admite el modo.
+    :raises ImportError: Si el método es "zstd" y no está instalado zstandard.
+    :return: Objeto archivo.
+    :rtype: IO[Any]
+    """
+    compression = compression or detect_compression(path)
+    writing = mode[0] in "wa"
+    binary_mode = mode[0] + "b"
+    if writing and level is None and compression is not None:
+        level = DEFAULT_LEVELS.get(compression)
+
+    if compression is None:
+        raw = open(path, binary_mode)
+    elif compression == "gzip":
+        raw = gzip.open(path, binary_mode, compresslevel=level) if writing else gzip.open(path)
+    elif compression == "bz2":
+        raw = bz2.open(path, binary_mode, compresslevel=level) if writing else bz2.open(path)
+    elif compression == "xz":
+        raw = lzma.open(path, binary_mode, preset=level) if writing else lzma.open(path)
+    elif compression == "zstd":
+        zstandard = _zstandard()
+        if writing:
+            raw = zstandard.open(path, binary_mode, cctx=zstandard.ZstdCompressor(level=level))
+        else:
+            raw = zstandard.open(path, binary_mode)
+    elif compression == "zip":
+        if writing:
+            raise ValueError("No se pueden escribir archivos zip, usa gzip, bz2, xz o zstd")
+        raw = _open_zip_member(path)
+    else:
+        raise ValueError(
+            f"Compresión desconocida '{compression}', se esperaba una de {sorted(SUFFIXES)}"
+        )
+
+    if "b" in mode:
+        return raw
+    return io.TextIOWrapper(raw, encoding="utf-8", newline="")
+
+
+def estimate_uncompressed_size(path: str | Path, compression: str | None = None) -> int:
+    """
+    Estima el tamaño del archivo descomprimido sin descomprimirlo entero.
+
+        - zip: el tamaño exacto que guarda el índice del archivo.
+        - resto: se descomprime SAMPLE_COMPRESSED_BYTES del principio y se aplica el ratio
+          medido al tamaño total (si el archivo es menor que la muestra, el tamaño es exacto).
+        - gzip: además se lee el campo ISIZE del final (tamaño descomprimido módulo 2^32) y se
+          usa si es coherente con la muestra; no lo es si el archivo tiene varios miembros.
+
+    :param path: Ruta del archivo.
+    :type path: str | Path
+    :param compression: Método de compresión, o None para deducirlo del sufijo.
+    :type compression: str | None
+    :return: Bytes estimados del archivo descomprimido.
+    :rtype: int
+    """
+    file_size = os.path.getsize(path)
+    compression = compression or detect_compression(path)
+    if compression is None:
+        return file_size
+
+    try:
+        if compression == "zip":
+            with zipfile.ZipFile(path) as archive:
+                return archive.infolist()[0].file_size
+
+        sampled = _sampled_size(path, compression, file_size)
+        if compression == "gzip" and file_size > SAMPLE_COMPRESSED_BYTES:
+            isize = _gzip_isize(path, sampled)
+            if isize is not None:
+                return isize
+        return sampled
+    except (OSError, EOFError, ValueError, ImportError, IndexError, zlib.error, lzma.LZMAError):
+        return int(file_size * COMPRESSION_RATIOS.get(compression, 1.0))
+
+
+def _sampled_size(path: str | Path, compression: str, file_size: int) -> int:
+    with open(path, "rb") as fichero:
+        data = fichero.read(SAMPLE_COMPRESSED_BYTES)
+    if not data:
+        return 0
+
+    output = 0
+    pending = data
+    while pending:
+        decompressor = _decompressor(compression)
+        output += len(decompressor.decompress(pending))
+        # Los archivos con varios miembros (gzip, bz2, xz) continúan en unused_data
+        finished = getattr(decompressor, "eof", False)
+        pending = getattr(decompressor, "unused_data", b"") if finished else b""
+
+    if len(data) >= file_size:
+        return output
+    return int(file_size * output / len(data))
+
+
+def _decompressor(compression: str) -> Any:
+    if compression == "gzip":
+        return zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    if compression == "bz2":
+        return bz2.BZ2Decompressor()
+    if compression == "xz":
+        return lzma.LZMADecompressor()
+    if compression == "zstd":
+        return _zstandard().ZstdDecompressor().decompressobj()
+    raise ValueError(f"Compresión desconocida '{compression}'")
+
+
+def _gzip_isize(path: str | Path, sampled: int) -> int | None:
+    """Tamaño según ISIZE, con el múltiplo de 2^32 más cercano a la estimación por muestra."""
+    with open(path, "rb") as fichero:
+        fichero.seek(-4, os.SEEK_END)
+        isize = int.from_bytes(fichero.read(4), "little")
+
+    wraps = round((sampled - isize) / 2**32)
+    size = isize + max(wraps, 0) * 2**32
+    # Con varios miembros ISIZE solo cuenta el último: se descarta si no se parece a la muestra
+    if sampled and abs(size - sampled) / sampled < ISIZE_TOLERANCE:
+        return size
+    return None
+
+
+def _open_zip_member(path: str | Path) -> IO[bytes]:
+    # El miembro abierto sigue siendo legible después de cerrar el ZipFile
+    with zipfile.ZipFile(path) as archive:
+        members = archive.namelist()
+        if len(members) != 1:
+            raise ValueError(f"El archivo zip '{Path(path).name}' debe contener un único CSV")
+        return archive.open(members[0])
+
+
+def _zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("La compresión 'zstd' necesita el paquete zstandard") from e
+    return zstandard
@@ -1,22 +1,243 @@
+import io
+import logging
 import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
 
-from .reader import ReaderCSV, ReaderCSVGenerator, ReaderCSVPandas
+import pandas as pd
 
-SIZE_THRESHOLD = 2 * 1024 * 1024  # 2MB
+from .compression import detect_compression, estimate_uncompressed_size, open_compressed
+from .reader import (
+    SNIFF_BYTES,
+    ReaderCSV,
+    ReaderCSVGenerator,
+    ReaderCSVMmap,
+    ReaderCSVPandas,
+    schema_dtypes,
+    sniff_delimiter,
+)
 
-def get_csv_reader(path: str) -> ReaderCSV:
+logger = logging.getLogger(__name__)
+
+MEMORY_STRATEGY = "memory"
+MMAP_STRATEGY = "mmap"
+PARALLEL_STRATEGY = "parallel"
+CHUNKED_STRATEGY = "chunked"
+
+# Fracción de la RAM disponible que puede ocupar el pipeline en memoria
+MEMORY_FRACTION = 0.5
+# Copias del DataFrame que llegan a convivir durante validación, limpieza y transformación
+PIPELINE_COPIES = 3
+# A partir de este tamaño, si cabe en memoria, se lee con memory_map para evitar copias de E/S
+MMAP_THRESHOLD = 256 * 1024 * 1024  # 256MB
+# A partir de este tamaño, con varios núcleos, los rangos del archivo se parsean en paralelo
+PARALLEL_THRESHOLD = 1024 * 1024 * 1024  # 1GB
+# Valor por defecto si no hay información del sistema
+DEFAULT_AVAILABLE_MEMORY = 2 * 1024 * 1024 * 1024  # 2GB
+
+# Estimaciones usadas cuando no se puede leer una muestra del archivo
+DEFAULT_ROW_WIDTH = 64.0
+DEFAULT_MEMORY_EXPANSION = 4.0
+
+
+@dataclass(frozen=True)
+class ReadPlan:
+    """Decisión de lectura de un archivo CSV y los datos en los que se basa."""
+
+    strategy: str
+    reason: str
+    file_size: int
+    estimated_size: int
+    estimated_rows: int
+    estimated_memory: int
+    available_memory: int
+    compression: str | None = None
+    compact: bool = False
+    workers: int = 1
+
+    def reader(self) -> ReaderCSV:
+        """
+        Devuelve el lector que corresponde a la estrategia.
+
+        En la estrategia chunked, un archivo sin comprimir con varios procesos disponibles
+        se lee por lotes con ReaderCSVMmap, que parsea los rangos en paralelo.
+        """
+        if self.strategy == MEMORY_STRATEGY:
+            return ReaderCSVPandas(compact=self.compact)
+        if self.strategy == MMAP_STRATEGY:
+            return ReaderCSVPandas(memory_map=True, compact=self.compact)
+        if self.strategy == PARALLEL_STRATEGY or (
+            self.compression is None and self.workers > 1
+        ):
+            return ReaderCSVMmap(workers=self.workers, compact=self.compact)
+        return ReaderCSVGenerator(compact=self.compact)
+
+
+def get_csv_reader(path: str, compact: bool = False, workers: int | None = None) -> ReaderCSV:
     """
-    Detecta la forma en la que se debe leer el fichero CSV según su tamaño.
-    Seleciona Pandas o generador.
+    Detecta la forma en la que se debe leer el fichero CSV.
+    Seleciona lectura en memoria, con memory_map, en paralelo o por lotes.
 
     :param path: Ruta del archivo CSV.
     :type path: str
+    :param compact: Si es True, el lector guarda como categóricas las columnas de baja
+                    cardinalidad.
+    :type compact: bool
+    :param workers: Procesos para leer en paralelo. Por defecto, los núcleos disponibles.
+    :type workers: int | None
     :return: Clase del lector seleccionada
     :rtype: ReaderCSV
     """
-    size = os.path.getsize(path)
+    return plan_csv_read(path, compact, workers).reader()
 
-    if size < SIZE_THRESHOLD:
-        return ReaderCSVPandas()
+
+def plan_csv_read(
+    path: str | Path, compact: bool = False, workers: int | None = None
+) -> ReadPlan:
+    """
+    Decide cómo leer el CSV a partir del tamaño del archivo, la compresión, la RAM disponible
+    y una muestra de la cabecera, de la que se mide el ancho medio de fila, cuánto ocupa en
+    memoria una vez parseada y la velocidad de parseo.
+
+        - memory: el DataFrame (y sus copias del pipeline) cabe en la RAM disponible.
+        - mmap: cabe en memoria pero el archivo es grande y no está comprimido.
+        - parallel: como mmap, pero el archivo supera PARALLEL_THRESHOLD y hay más de un
+          proceso: se parsean rangos del archivo en paralelo con ReaderCSVMmap.
+        - chunked: no cabe en memoria, se debe leer y procesar por lotes.
+
+    :param path: Ruta del archivo CSV.
+    :type path: str | Path
+    :param compact: Si es True, se estima (y después se lee) con las columnas de baja
+                    cardinalidad como categóricas.
+    :type compact: bool
+    :param workers: Procesos para leer en paralelo. Por defecto, los núcleos disponibles.
+    :type workers: int | None
+    :return: Plan de lectura con la estrategia elegida y su motivo.
+    :rtype: ReadPlan
+    """
+    file_size = os.path.getsize(path)
+    compression = detect_compression(path)
+
+    # El tamaño en disco de un archivo comprimido no sirve para estimar la memoria
+    estimated_size = estimate_uncompressed_size(path, compression)
+    row_width, expansion, throughput = _measure_sample(path, compression, compact)
+    estimated_rows = int(estimated_size / row_width)
+    estimated_memory = int(estimated_size * expansion)
+    available = available_memory()
+    budget = int(available * MEMORY_FRACTION)
+    needed = estimated_memory * PIPELINE_COPIES
+    workers = max(1, workers or os.cpu_count() or 1)
+
+    if needed > budget:
+        strategy = CHUNKED_STRATEGY
+        reason = (
+            f"se estiman {_mb(needed)} MB para el pipeline en memoria y el límite es "
+            f"{_mb(budget)} MB ({MEMORY_FRACTION:.0%} de {_mb(available)} MB disponibles)"
+        )
+    elif compression is None and file_size >= PARALLEL_THRESHOLD and workers > 1:
+        strategy = PARALLEL_STRATEGY
+        reason = (
+            f"cabe en memoria ({_mb(needed)} de {_mb(budget)} MB) y el archivo sin comprimir "
+            f"supera {_mb(PARALLEL_THRESHOLD)} MB con {workers} procesos disponibles"
+        )
+    elif compression is None and file_size >= MMAP_THRESHOLD:
+        strategy = MMAP_STRATEGY
+        reason = (
+            f"cabe en memoria ({_mb(needed)} de {_mb(budget)} MB) y el archivo sin comprimir "
+            f"supera {_mb(MMAP_THRESHOLD)} MB"
+        )
     else:
-        return ReaderCSVGenerator()
+        strategy = MEMORY_STRATEGY
+        reason = f"cabe en memoria ({_mb(needed)} de {_mb(budget)} MB)"
+
+    plan = ReadPlan(
+        strategy=strategy,
+        reason=reason,
+        file_size=file_size,
+        estimated_size=estimated_size,
+        estimated_rows=estimated_rows,
+        estimated_memory=estimated_memory,
+        available_memory=available,
+        compression=compression,
+        compact=compact,
+        workers=workers,
+    )
+
+    logger.info(
+        "Lectura de '%s': estrategia '%s' porque %s. Tamaño %d MB (descomprimido ~%d MB, "
+        "compresión: %s), ~%d filas de %.0f bytes, lectura estimada %.1f s.",
+        path,
+        strategy,
+        reason,
+        _mb(file_size),
+        _mb(estimated_size),
+        compression or "ninguna",
+        estimated_rows,
+        row_width,
+        estimated_size / throughput if throughput else float("nan"),
+    )
+    return plan
+
+
+def available_memory() -> int:
+    """
+    RAM disponible en bytes según /proc/meminfo o sysconf.
+
+    :return: Bytes disponibles, o DEFAULT_AVAILABLE_MEMORY si el sistema no lo informa.
+    :rtype: int
+    """
+    try:
+        with open("/proc/meminfo", encoding="utf-8") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, OSError, ValueError):
+        return DEFAULT_AVAILABLE_MEMORY
+
+
+def _measure_sample(
+    path: str | Path, compression: str | None, compact: bool = False
+) -> tuple[float, float, float]:
+    """
+    Parsea una muestra de la cabecera del archivo.
+
+    :return: Ancho medio de fila en bytes, bytes en memoria por byte de CSV y velocidad de
+             parseo en bytes por segundo (0 si no se ha podido medir).
+    :rtype: tuple[float, float, float]
+    """
+    try:
+        # Los archivos comprimidos se descomprimen al vuelo: solo se lee la muestra
+        with open_compressed(path, compression=compression) as fichero:
+            sample = fichero.read(SNIFF_BYTES)
+    except (OSError, EOFError, UnicodeDecodeError, ValueError, ImportError):
+        return DEFAULT_ROW_WIDTH, DEFAULT_MEMORY_EXPANSION, 0.0
+
+    if len(sample) == SNIFF_BYTES and "\n" in sample:
+        sample = sample[: sample.rindex("\n")]
+
+    delimiter = sniff_delimiter(path)
+    start = time.perf_counter()
+    try:
+        df = pd.read_csv(io.StringIO(sample), sep=delimiter, dtype=schema_dtypes(compact))
+    except (ValueError, pd.errors.ParserError, pd.errors.EmptyDataError):
+        return DEFAULT_ROW_WIDTH, DEFAULT_MEMORY_EXPANSION, 0.0
+    duration = time.perf_counter() - start
+
+    if df.empty:
+        return DEFAULT_ROW_WIDTH, DEFAULT_MEMORY_EXPANSION, 0.0
+
+    sample_bytes = len(sample.encode("utf-8"))
+    row_width = sample_bytes / len(df)
+    expansion = df.memory_usage(deep=True).sum() / sample_bytes
+    throughput = sample_bytes / duration if duration > 0 else 0.0
+    return row_width, expansion, throughput
+
+
+def _mb(size: float) -> int:
+    return int(size / (1024 * 1024))
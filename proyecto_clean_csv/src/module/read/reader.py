@@ -1,8 +1,81 @@
 import csv
+import io
+import mmap
+import os
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from importlib.util import find_spec
+from itertools import islice, zip_longest
 from typing import Protocol
 
+import numpy as np
 import pandas as pd
 
+from module.data_models.schema import CATEGORICAL_COLUMNS, COLUMN_TYPES
+
+from .compression import open_compressed
+
+SNIFF_BYTES = 64 * 1024  # 64KB
+DELIMITERS = ",;\t|"
+BATCH_SIZE = 100_000
+# Tamaño máximo de cada rango de bytes que parsea un proceso de ReaderCSVMmap
+RANGE_BYTES = 64 * 1024 * 1024  # 64MB
+
+# Textos que se interpretan como nulos, igual que hace pd.read_csv por defecto
+NA_VALUES = frozenset({"", "NA", "N/A", "n/a", "NaN", "nan", "null", "NULL", "None", "<NA>"})
+
+
+def sniff_delimiter(path: str) -> str:
+    """
+    Detecta el delimitador del CSV a partir de una muestra de la cabecera del archivo.
+    Si el archivo está comprimido solo se descomprime la muestra.
+
+    :param path: Ruta del archivo CSV.
+    :type path: str
+    :return: Delimitador detectado o "," si la muestra no es concluyente.
+    :rtype: str
+    """
+    with open_compressed(path) as fichero:
+        sample = fichero.read(SNIFF_BYTES)
+
+    # Se descarta la última línea, que puede estar cortada
+    if len(sample) == SNIFF_BYTES and "\n" in sample:
+        sample = sample[: sample.rindex("\n")]
+
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=DELIMITERS).delimiter
+    except csv.Error:
+        return ","
+
+
+def schema_dtypes(compact: bool = False) -> dict[str, str]:
+    """
+    Tipos explícitos de lectura derivados de COLUMN_TYPES.
+
+    Las columnas de texto y de fecha se leen como "str": las fechas se convierten después
+    en la validación y la limpieza. Las numéricas se dejan a la inferencia del parser porque
+    los archivos sucios traen marcas como "ERROR" que impedirían forzar el tipo.
+
+    :param compact: Si es True, las columnas de CATEGORICAL_COLUMNS se leen como "category":
+                    cada valor distinto se guarda una vez y las filas solo guardan un código.
+    :type compact: bool
+    :return: Diccionario {columna: dtype} para pd.read_csv.
+    :rtype: dict[str, str]
+    """
+    dtypes = {
+        col: "str" for col, dtype in COLUMN_TYPES.items() if dtype in ("str", "datetime")
+    }
+    if compact:
+        dtypes.update({col: "category" for col in CATEGORICAL_COLUMNS})
+    return dtypes
+
+
+def fast_engine() -> str:
+    """Devuelve "pyarrow" si está instalado y, si no, el parser en C de pandas."""
+    return "pyarrow" if find_spec("pyarrow") is not None else "c"
+
 
 class ReaderCSV(Protocol) :
     def read(self, path: str) -> pd.DataFrame:
@@ -16,11 +89,42 @@ class ReaderCSV(Protocol) :
         """
         ...
 
+    def iter_batches(
+        self, path: str, batch_size: int = BATCH_SIZE, columns: list[str] | None = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Lee un archivo CSV por lotes de tamaño fijo.
+
+        :param path: Ruta del archivo CSV.
+        :type path: str
+        :param batch_size: Número de filas de cada lote.
+        :type batch_size: int
+        :param columns: Si se indica, solo se leen estas columnas.
+        :type columns: list[str] | None
+        :yield: DataFrames de, como máximo, batch_size filas.
+        :rtype: Iterator[pd.DataFrame]
+        """
+        ...
+
 
 class ReaderCSVPandas(ReaderCSV):
     """
     Clase para leer archivos CSV usando pandas.
+
+    El delimitador se detecta una sola vez con una muestra de la cabecera y la lectura
+    completa se hace con el parser de pyarrow (si está disponible) o el de C.
     """
+    def __init__(self, memory_map: bool = False, compact: bool = False) -> None:
+        """
+        :param memory_map: Si es True, el archivo se mapea en memoria y se lee con el parser
+                           en C (pyarrow no admite memory_map).
+        :type memory_map: bool
+        :param compact: Si es True, las columnas de baja cardinalidad se leen como categóricas.
+        :type compact: bool
+        """
+        self.memory_map = memory_map
+        self.compact = compact
+
     def read(self, path: str) -> pd.DataFrame:
         """
         Lee un archivo CSV y devuelve un DataFrame de pandas.
@@ -30,27 +134,84 @@ class ReaderCSVPandas(ReaderCSV):
         :return: DataFrame de pandas con los datos del CSV.
         :rtype: pd.DataFrame
         """
+        engine = "c" if self.memory_map else fast_engine()
+        options = {
+            "sep": sniff_delimiter(path),
+            "dtype": schema_dtypes(self.compact),
+            "memory_map": self.memory_map,
+            "header": 0,
+        }
         try:
-            df = pd.read_csv(path,
-                            sep=None,
-                            engine="python",
-                            header=0)
-            return df
+            try:
+                return pd.read_csv(path, engine=engine, **options)
+            except ValueError:
+                if engine == "c":
+                    raise
+                # Con dtype explícito, pandas no puede convertir las columnas enteras con
+                # nulos que infiere pyarrow: se repite la lectura con el parser en C
+                return pd.read_csv(path, engine="c", **options)
 
         except FileNotFoundError as e:
             raise FileNotFoundError("Archivo CSV no econtrado.") from e
         except Exception as e:
             raise Exception("Error al leer el CSV") from e
 
+    def iter_batches(
+        self, path: str, batch_size: int = BATCH_SIZE, columns: list[str] | None = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Lee un archivo CSV por lotes de tamaño fijo.
+
+        :param path: Ruta del archivo CSV.
+        :type path: str
+        :param batch_size: Número de filas de cada lote.
+        :type batch_size: int
+        :param columns: Si se indica, solo se leen estas columnas.
+        :type columns: list[str] | None
+        :yield: DataFrames de, como máximo, batch_size filas.
+        :rtype: Iterator[pd.DataFrame]
+        """
+        try:
+            # pyarrow no admite lectura por trozos, se usa el parser en C
+            with pd.read_csv(path,
+                             sep=sniff_delimiter(path),
+                             engine="c",
+                             dtype=schema_dtypes(self.compact),
+                             header=0,
+                             usecols=columns,
+                             chunksize=batch_size) as chunks:
+                yield from chunks
+
+        except FileNotFoundError as e:
+            raise FileNotFoundError("Archivo CSV no econtrado.") from e
+
 
 class ReaderCSVGenerator(ReaderCSV):
     """
     Clase para leer archivos CSV usando un generador.
+
+    Las filas se leen con csv.reader y se acumulan por columnas hasta completar un lote, que
+    se convierte en un DataFrame tipado. Nunca se crea un diccionario por fila ni se mantiene
+    en memoria más de un lote de texto a la vez.
     """
+    def __init__(self, compact: bool = False, batch_size: int = BATCH_SIZE) -> None:
+        """
+        :param compact: Si es True, las columnas de baja cardinalidad se leen como categóricas.
+        :type compact: bool
+        :param batch_size: Número de filas de cada lote al leer el archivo completo.
+        :type batch_size: int
+        """
+        self.compact = compact
+        self.batch_size = batch_size
+
     def read(self, path: str) -> pd.DataFrame:
         """
         Lee un archivo CSV usando un generador y devuelve un DataFrame.
 
+        Cada lote infiere sus tipos por separado: si una columna es numérica en unos lotes y
+        texto en otros (p. ej. "ERROR" en un solo lote), esa columna se vuelve a leer como
+        texto para conservar los valores tal como estaban en el archivo.
+
         :param path: Ruta del archivo CSV.
         :type path: str
         :return: DataFrame de pandas con los datos del CSV.
@@ -58,24 +219,323 @@ class ReaderCSVGenerator(ReaderCSV):
         """
 
         try:
-            filas = self._read_generator(path)
-            return pd.DataFrame(filas)
+            batches = list(self.iter_batches(path, self.batch_size))
+            mixed = _mixed_columns(batches)
+            df = pd.concat(batches, ignore_index=True)
+            del batches
+            if mixed:
+                text = self.iter_batches(path, self.batch_size, columns=mixed, as_text=True)
+                df[mixed] = pd.concat(text, ignore_index=True)
+            if self.compact:
+                # concat no une categorías distintas entre lotes: se vuelven a agrupar
+                categorical = [col for col in CATEGORICAL_COLUMNS if col in df.columns]
+                df[categorical] = df[categorical].astype("category")
+            return df
 
         except FileNotFoundError as e:
             raise FileNotFoundError("Archivo CSV no econtrado.") from e
         except Exception as e:
             raise Exception("Error al leer el CSV") from e
 
+    def iter_batches(
+        self,
+        path: str,
+        batch_size: int = BATCH_SIZE,
+        columns: list[str] | None = None,
+        as_text: bool = False,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Generador que lee un archivo CSV y devuelve lotes tipados en forma de DataFrame.
 
-    def _read_generator(self, path: str):
+        :param path: Ruta del archivo CSV.
+        :type path: str
+        :param batch_size: Número de filas de cada lote.
+        :type batch_size: int
+        :param columns: Si se indica, solo se leen estas columnas.
+        :type columns: list[str] | None
+        :param as_text: Si es True, las columnas sin tipo en el esquema se dejan como texto
+                        en lugar de inferir si son numéricas.
+        :type as_text: bool
+        :yield: DataFrames de, como máximo, batch_size filas.
+        :rtype: Iterator[pd.DataFrame]
         """
-        Generador que lee un archivo CSV y devuelve filas en forma de diccionarios.
+        delimiter = sniff_delimiter(path)
+        dtypes = schema_dtypes(self.compact)
+        default = "str" if as_text else None
+
+        # Los archivos comprimidos se descomprimen al vuelo, por bloques
+        with open_compressed(path) as fichero:
+            lector = csv.reader(fichero, delimiter=delimiter)
+            header = next(lector, [])
+            selected = [
+                (pos, name) for pos, name in enumerate(header)
+                if columns is None or name in columns
+            ]
+
+            empty = True
+            while filas := list(islice(lector, batch_size)):
+                empty = False
+                # Se trasponen las filas a un buffer por columna (las filas cortas se rellenan)
+                buffers = list(zip_longest(*filas, fillvalue=""))
+                yield pd.DataFrame(
+                    {
+                        name: _typed_column(
+                            buffers[pos] if pos < len(buffers) else ("",) * len(filas),
+                            dtypes.get(name, default),
+                        )
+                        for pos, name in selected
+                    }
+                )
+
+            if empty:
+                yield pd.DataFrame({name: pd.Series(dtype="str") for _, name in selected})
+
+
+class ReaderCSVMmap(ReaderCSV):
+    """
+    Clase para leer archivos CSV muy grandes en paralelo.
+
+    El archivo se mapea en memoria y se divide en rangos de bytes que empiezan y terminan en
+    un salto de línea. Cada rango se parsea con el parser en C en un proceso del pool y los
+    DataFrames se devuelven en el orden del archivo. Solo admite archivos sin comprimir y
+    sin saltos de línea dentro de campos entrecomillados.
+    """
+    def __init__(
+        self,
+        workers: int | None = None,
+        compact: bool = False,
+        range_bytes: int = RANGE_BYTES,
+        start: int = 0,
+    ) -> None:
+        """
+        :param workers: Número de procesos. Por defecto, los núcleos disponibles.
+        :type workers: int | None
+        :param compact: Si es True, las columnas de baja cardinalidad se leen como categóricas.
+        :type compact: bool
+        :param range_bytes: Tamaño máximo de cada rango de bytes.
+        :type range_bytes: int
+        :param start: Posición del archivo, al principio de una línea, desde la que se leen
+                      filas (p. ej. solo las añadidas desde la última ejecución). La cabecera
+                      se lee siempre del principio.
+        :type start: int
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.compact = compact
+        self.range_bytes = range_bytes
+        self.start = start
+
+    def read(self, path: str) -> pd.DataFrame:
+        """
+        Lee el archivo completo parseando sus rangos en paralelo.
 
         :param path: Ruta del archivo CSV.
         :type path: str
-        :yield: Diccionarios con los datos de cada fila.
-        :rtype: dict
+        :return: DataFrame de pandas con los datos del CSV.
+        :rtype: pd.DataFrame
         """
-        with open(path, encoding='utf-8') as fichero:
-            lector = csv.DictReader(fichero)
-            yield from lector
+        try:
+            task, ranges = self._plan(path)
+            frames = list(self._parse(task, ranges))
+            return _concat_ranges(frames, ranges, task, self.compact)
+        except FileNotFoundError as e:
+            raise FileNotFoundError("Archivo CSV no econtrado.") from e
+        except Exception as e:
+            raise Exception("Error al leer el CSV") from e
+
+    def iter_batches(
+        self, path: str, batch_size: int = BATCH_SIZE, columns: list[str] | None = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Lee el archivo por lotes a partir de los rangos parseados en paralelo.
+
+        Los lotes no cruzan rangos: el último lote de cada rango puede tener menos filas.
+        Como mucho se parsean por adelantado dos rangos por proceso, de modo que la memoria
+        no depende del tamaño del archivo.
+
+        :param path: Ruta del archivo CSV.
+        :type path: str
+        :param batch_size: Número de filas de cada lote.
+        :type batch_size: int
+        :param columns: Si se indica, solo se leen estas columnas.
+        :type columns: list[str] | None
+        :yield: DataFrames de, como máximo, batch_size filas.
+        :rtype: Iterator[pd.DataFrame]
+        """
+        try:
+            task, ranges = self._plan(path, columns)
+            for frame in self._parse(task, ranges):
+                for start in range(0, max(len(frame), 1), batch_size):
+                    yield frame.iloc[start:start + batch_size].reset_index(drop=True)
+        except FileNotFoundError as e:
+            raise FileNotFoundError("Archivo CSV no econtrado.") from e
+
+    def _plan(
+        self, path: str, columns: list[str] | None = None
+    ) -> tuple[partial[pd.DataFrame], list[tuple[int, int]]]:
+        """Lee la cabecera y divide el resto del archivo en rangos alineados con las líneas."""
+        delimiter = sniff_delimiter(path)
+        with open(path, "rb") as fichero:
+            size = os.fstat(fichero.fileno()).st_size
+            if size == 0:
+                raise pd.errors.EmptyDataError("No columns to parse from file")
+            with mmap.mmap(fichero.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                header_end = mapped.find(b"\n")
+                header_end = size if header_end < 0 else header_end + 1
+                header_line = mapped[:header_end].decode("utf-8").rstrip("\r\n")
+                header_end = max(header_end, min(self.start, size))
+                ranges = byte_ranges(mapped, header_end, self._range_size(size - header_end))
+
+        task = partial(
+            _parse_range,
+            path,
+            header=next(csv.reader([header_line], delimiter=delimiter), []),
+            delimiter=delimiter,
+            dtypes=schema_dtypes(self.compact),
+            columns=columns,
+        )
+        # Un archivo con solo la cabecera se lee como un rango vacío
+        return task, ranges or [(header_end, header_end)]
+
+    def _parse(
+        self, task: partial[pd.DataFrame], ranges: list[tuple[int, int]]
+    ) -> Iterator[pd.DataFrame]:
+        """Parsea los rangos en el pool de procesos y los devuelve en el orden del archivo."""
+        if self.workers == 1 or len(ranges) == 1:
+            yield from (task(start, end) for start, end in ranges)
+            return
+
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(ranges))) as executor:
+            # Ventana de rangos en curso: se envía uno nuevo por cada resultado devuelto
+            positions = iter(ranges)
+            queue = deque(
+                executor.submit(task, start, end)
+                for start, end in islice(positions, 2 * self.workers)
+            )
+            while queue:
+                frame = queue.popleft().result()
+                for start, end in islice(positions, 1):
+                    queue.append(executor.submit(task, start, end))
+                yield frame
+
+    def _range_size(self, size: int) -> int:
+        # Al menos un rango por proceso para que todos trabajen en archivos medianos
+        return max(1, min(self.range_bytes, -(-size // self.workers)))
+
+
+def byte_ranges(data: mmap.mmap | bytes, start: int, range_size: int) -> list[tuple[int, int]]:
+    """
+    Divide data[start:] en rangos de unos range_size bytes que terminan en un salto de línea.
+
+    :param data: Contenido del archivo (mapeado en memoria).
+    :type data: mmap.mmap | bytes
+    :param start: Posición donde empiezan los datos (tras la cabecera).
+    :type start: int
+    :param range_size: Tamaño aproximado de cada rango.
+    :type range_size: int
+    :return: Lista de (inicio, fin) que cubre data[start:] sin solapes.
+    :rtype: list[tuple[int, int]]
+    """
+    size = len(data)
+    ranges = []
+    while start < size:
+        end = data.find(b"\n", min(start + range_size, size) - 1)
+        end = size if end < 0 else end + 1
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def _parse_range(
+    path: str,
+    start: int,
+    end: int,
+    header: list[str],
+    delimiter: str,
+    dtypes: dict[str, str],
+    columns: list[str] | None,
+) -> pd.DataFrame:
+    """Parsea el rango [start, end) del archivo con la cabecera del archivo completo."""
+    with open(path, "rb") as fichero:
+        fichero.seek(start)
+        data = fichero.read(end - start)
+    return pd.read_csv(
+        io.BytesIO(data),
+        sep=delimiter,
+        engine="c",
+        header=None,
+        names=header,
+        dtype={col: dtype for col, dtype in dtypes.items() if col in header},
+        usecols=columns,
+        # Sin low_memory el rango se infiere entero: una columna no mezcla números y texto
+        low_memory=False,
+    )
+
+
+def _concat_ranges(
+    frames: list[pd.DataFrame],
+    ranges: list[tuple[int, int]],
+    task: partial[pd.DataFrame],
+    compact: bool,
+) -> pd.DataFrame:
+    """
+    Une los DataFrames de los rangos como si el archivo se hubiera leído de una vez.
+
+    Cada rango infiere sus tipos por separado: si una columna es numérica en unos rangos y
+    texto en otros (p. ej. "ERROR" en un solo rango), esos rangos numéricos se vuelven a
+    leer como texto para conservar los valores tal como estaban en el archivo.
+    """
+    frames = list(frames)
+    for col in frames[0].columns:
+        numeric = [pd.api.types.is_numeric_dtype(frame[col]) for frame in frames]
+        if all(numeric) or not any(numeric):
+            continue
+        dtypes = {**task.keywords["dtypes"], col: "str"}
+        for i, (start, end) in enumerate(ranges):
+            if numeric[i]:
+                text = task(start, end, dtypes=dtypes, columns=[col])[col]
+                frames[i] = frames[i].assign(**{col: text})
+
+    if len(frames) == 1:
+        return frames[0]
+    df = pd.concat(frames, ignore_index=True)
+    if compact:
+        # concat no une categorías distintas entre rangos: se vuelven a agrupar
+        categorical = [col for col in CATEGORICAL_COLUMNS if col in df.columns]
+        df[categorical] = df[categorical].astype("category")
+    return df
+
+
+def _mixed_columns(frames: list[pd.DataFrame]) -> list[str]:
+    """
+    Columnas que son numéricas en unos DataFrames y texto en otros.
+    """
+    if not frames:
+        return []
+    mixed = []
+    for col in frames[0].columns:
+        numeric = [pd.api.types.is_numeric_dtype(frame[col]) for frame in frames]
+        if any(numeric) and not all(numeric):
+            mixed.append(col)
+    return mixed
+
+
+def _typed_column(values: tuple[str, ...], dtype: str | None) -> pd.Series:
+    """
+    Convierte el buffer de texto de una columna en una Serie tipada.
+
+    Las columnas con dtype explícito se dejan como texto (o categóricas); el resto se
+    convierte a numérico si todos sus valores lo permiten, igual que la inferencia de
+    pd.read_csv.
+    """
+    array = np.array(values, dtype=object)
+    array[np.isin(array, list(NA_VALUES))] = np.nan
+    column = pd.Series(array, dtype="str")
+
+    if dtype is None:
+        try:
+            return pd.to_numeric(column)
+        except (ValueError, TypeError):
+            pass
+    elif dtype == "category":
+        return column.astype("category")
+    return column
@@ -1,7 +1,16 @@
 from .clean_csv_exporter import csv_exporter
 from .decorators import track_changes, track_dtype_changes
+from .exporters import CSVExporter, Exporter, FeatherExporter, ParquetExporter, get_exporter
+from .metrics import MetricsCollector, metrics
 
 __all__ = [
+    "CSVExporter",
+    "Exporter",
+    "FeatherExporter",
+    "ParquetExporter",
+    "get_exporter",
+    "MetricsCollector",
+    "metrics",
     "track_changes",
     "csv_exporter",
     "track_dtype_changes"
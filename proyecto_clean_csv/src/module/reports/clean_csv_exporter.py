@@ -1,17 +1,19 @@
 import pandas as pd
 
+from .exporters import get_exporter
 
-def csv_exporter(_self, df: pd.DataFrame) -> None:
+
+def csv_exporter(_self, df: pd.DataFrame, mode: str = "w") -> None:
     """
     Genera un archivo CSV limpio a partir del DataFrame procesado.
 
+    Se mantiene por compatibilidad: equivale a escribir df con el exportador CSV de
+    get_exporter en generated/<nombre>_clean.csv.
+
     :param df: DataFrame limpio a exportar
+    :param mode: "w" sobrescribe el archivo con cabecera, "a" añade las filas al final sin
+                 cabecera (modo por chunks)
     """
-
     generated_dir = _self._base_dir / "generated"
-    generated_dir.mkdir(exist_ok=True)
-
-    filename = f"{_self.name}_clean.csv"
-    output_path = generated_dir / filename
-
-    df.to_csv(output_path, index=False)
+    with get_exporter(generated_dir, _self.name, {}, append=mode == "a") as exporter:
+        exporter.write(df)
@@ -1,9 +1,14 @@
+import functools
 import logging
 import time
 from collections.abc import Callable
 
 import pandas as pd
 
+from .memory import frame_memory
+from .metrics import metrics
+from .profiler import FUNCTION, profiler
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,30 +25,59 @@ def track_changes(_func: Callable | None = None, *, action: str | None = None):
 
     Además, registra el tiempo de ejecución en segundos.
 
+    Si el colector de métricas está habilitado, guarda también el tiempo, las filas y la
+    diferencia de memoria del DataFrame. Si el nivel INFO está deshabilitado y las métricas
+    también, la función se llama directamente sin medir nada.
+
     :param func: Función que puede recibir y devolver un DataFrame.
     :type func: Callable
     :return: Función envuelta que incluye el registro de cambios.
     :rtype: Callable
     """
     def decorator(func: Callable):
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            log = logger.isEnabledFor(logging.INFO)
+            # Camino rápido: sin log INFO, métricas ni perfilado no se mide nada
+            if not (log or metrics.enabled or profiler.enabled):
+                return func(*args, **kwargs)
+
             start = time.perf_counter()
 
             df_antes = next((arg for arg in args if isinstance(arg, pd.DataFrame)), None)
             filas_antes = len(df_antes) if df_antes is not None else 0
+            # Se mide antes de llamar: con inplace=True la función modifica df_antes
+            memoria_antes = frame_memory(df_antes) if df_antes is not None else 0
 
-            if action:
-                logger.info(
-                    "Se inicia la ejecución de la función '%s'. Acción: %s.", func.__name__, action
-                )
-            else:
-                logger.info("Se inicia la ejecución de la función '%s'.", func.__name__)
-            result = func(*args, **kwargs)
+            if log:
+                if action:
+                    logger.info(
+                        "Se inicia la ejecución de la función '%s'. Acción: %s.",
+                        func.__name__,
+                        action,
+                    )
+                else:
+                    logger.info("Se inicia la ejecución de la función '%s'.", func.__name__)
+            with profiler.stage(func.__name__, FUNCTION) as stage:
+                stage.rows = filas_antes
+                result = func(*args, **kwargs)
 
             duration = time.perf_counter() - start
+            is_frame = isinstance(result, pd.DataFrame)
+            filas_despues = len(result) if is_frame else 0
+
+            metrics.record(
+                func.__name__,
+                duration,
+                rows_in=filas_antes,
+                rows_out=filas_despues,
+                memory_delta=frame_memory(result) - memoria_antes if is_frame else 0,
+            )
 
-            if isinstance(result, pd.DataFrame) and filas_antes is not None:
-                filas_despues = len(result)
+            if not log:
+                return result
+
+            if is_frame:
                 diff = filas_antes - filas_despues
                 if diff > 0:
                     logger.info(
@@ -78,31 +112,55 @@ def track_dtype_changes(func: Callable) -> Callable:
     (dtypes) de las columnas de un DataFrame antes y después de ejecutar
     la función decorada.
 
-    Compara los tipos de cada columna y muestra en el log:
-        - Nombre de la columna
-        - Tipo antes de la ejecución
-        - Tipo después de la ejecución
-        :param func: Función que recibe y devuelve un DataFrame.
+    Compara los tipos de cada columna y muestra en el log, en una sola línea, las columnas
+    cuyo tipo ha cambiado con su tipo antes y después de la ejecución.
+
+    Si el nivel INFO está deshabilitado y el colector de métricas también, la función se
+    llama directamente sin medir nada.
+
+    :param func: Función que recibe y devuelve un DataFrame.
     :type func: Callable
     :return: Función envuelta que incluye el registro de cambios de tipos.
     :rtype: Callable
     """
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        df_antes = next((arg for arg in args if isinstance(arg, pd.DataFrame)), None)
-
-        tipos_antes = df_antes.dtypes.to_dict()
+        log = logger.isEnabledFor(logging.INFO)
+        if not (log or metrics.enabled or profiler.enabled):
+            return func(*args, **kwargs)
 
-        result = func(*args, **kwargs)
-
-        tipos_despues = result.dtypes.to_dict()
+        start = time.perf_counter()
+        df_antes = next((arg for arg in args if isinstance(arg, pd.DataFrame)), None)
+        # Se copia el diccionario de tipos: con inplace=True df_antes cambia en la llamada
+        tipos_antes = dict(df_antes.dtypes.items()) if df_antes is not None else {}
 
-        logger.info("Resumen de cambios de tipos en la función '%s':", func.__name__)
-        for col in tipos_despues:
-            tipo_antes = tipos_antes.get(col, "No existía")
-            tipo_despues = tipos_despues[col]
+        with profiler.stage(func.__name__, FUNCTION) as stage:
+            stage.rows = len(df_antes) if df_antes is not None else 0
+            result = func(*args, **kwargs)
 
+        duration = time.perf_counter() - start
+        cambios = {
+            col: (str(tipos_antes.get(col, "No existía")), str(tipo))
+            for col, tipo in result.dtypes.items()
+            if tipos_antes.get(col) != tipo
+        }
+
+        metrics.record(
+            func.__name__,
+            duration,
+            rows_in=len(df_antes) if df_antes is not None else 0,
+            rows_out=len(result),
+            dtype_changes=cambios,
+        )
+
+        if log:
             logger.info(
-                "Columna '%s' → Tipo antes: %s → Tipo después: %s", col, tipo_antes, tipo_despues
+                "Cambios de tipos en la función '%s': %s.",
+                func.__name__,
+                ", ".join(
+                    f"'{col}' {antes} → {despues}" for col, (antes, despues) in cambios.items()
+                )
+                or "ninguno",
             )
 
         return result
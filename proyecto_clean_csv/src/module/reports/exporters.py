@@ -0,0 +1,270 @@
+from abc import ABC, abstractmethod
+from importlib.util import find_spec
+from pathlib import Path
+from typing import IO, Any, Protocol
+
+import pandas as pd
+
+from module.read.compression import SUFFIXES, open_compressed
+
+CSV_FORMAT = "csv"
+PARQUET_FORMAT = "parquet"
+FEATHER_FORMAT = "feather"
+
+# Compresiones admitidas al escribir CSV (se escriben como un único flujo)
+CSV_COMPRESSIONS = ["gzip", "bz2", "xz", "zstd"]
+
+# Compresión por defecto de cada formato binario
+DEFAULT_COMPRESSION = {PARQUET_FORMAT: "snappy", FEATHER_FORMAT: "lz4"}
+
+
+class Exporter(Protocol):
+    """
+    Escritor del DataFrame limpio. Se escribe una o varias veces (un chunk por llamada) y se
+    cierra al terminar; también se puede usar como gestor de contexto, que abre la salida al
+    entrar aunque después no se escriba ninguna fila.
+    """
+
+    path: Path
+
+    def open(self) -> None:
+        """
+        Prepara el archivo de salida: la salida de una ejecución anterior se sustituye
+        aunque no se llegue a escribir nada.
+        """
+        ...
+
+    def write(self, df: pd.DataFrame) -> None:
+        """
+        Añade las filas del DataFrame al archivo de salida.
+
+        :param df: DataFrame limpio (completo o un chunk).
+        :type df: pd.DataFrame
+        """
+        ...
+
+    def close(self) -> None:
+        """Termina el archivo de salida."""
+        ...
+
+    def __enter__(self) -> "Exporter":
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class CSVExporter(Exporter):
+    """
+    Exporta a CSV, opcionalmente comprimido (gzip, bz2, xz o zstd).
+
+    El archivo se abre con la primera escritura, que añade la cabecera, y sigue abierto hasta
+    close(): todos los chunks van a un único flujo comprimido. Con append=True las filas se
+    añaden sin cabecera al final de un archivo existente (en los comprimidos, como un flujo
+    nuevo concatenado, que los descompresores leen como continuación del anterior).
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        compression: str | None = None,
+        level: int | None = None,
+        append: bool = False,
+    ) -> None:
+        self.path = Path(path)
+        self.compression = compression
+        self.level = level
+        self.append = append
+        self._file: IO[Any] | None = None
+        self._header = not append
+
+    def open(self) -> None:
+        if self._file is None:
+            mode = "at" if self.append else "wt"
+            self._file = open_compressed(self.path, mode, self.compression, self.level)
+
+    def write(self, df: pd.DataFrame) -> None:
+        self.open()
+        df.to_csv(self._file, index=False, header=self._header)
+        self._header = False
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class ArrowExporter(Exporter, ABC):
+    """
+    Base de los exportadores que escriben tablas de pyarrow.
+
+    El esquema se fija con la primera escritura y los chunks siguientes se convierten a él,
+    de modo que un chunk sin nulos en una columna Int64 no cambia el tipo del archivo. Las
+    columnas categóricas mantienen un único diccionario que solo crece: las categorías nuevas
+    de cada chunk se añaden al final.
+    """
+
+    def __init__(self, path: str | Path, compression: str | None = None) -> None:
+        self.path = Path(path)
+        self.compression = compression
+        self._schema = None
+        self._writer = None
+        self._categories: dict[str, list[Any]] = {}
+
+    def open(self) -> None:
+        # El escritor necesita el esquema de la primera escritura: hasta entonces basta con
+        # quitar la salida anterior
+        if self._writer is None:
+            self.path.unlink(missing_ok=True)
+
+    def write(self, df: pd.DataFrame) -> None:
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(self._stable_categories(df), preserve_index=False)
+        if self._writer is None:
+            self._schema = _wide_dictionaries(table.schema)
+            self._writer = self._open(self._schema)
+        try:
+            table = table.cast(self._schema)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+            raise ValueError(
+                f"El esquema del chunk no coincide con el de '{self.path.name}': {e}"
+            ) from e
+        self._write_table(table)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def _stable_categories(self, df: pd.DataFrame) -> pd.DataFrame:
+        columns = {}
+        for col in df.columns:
+            column = df[col]
+            if not isinstance(column.dtype, pd.CategoricalDtype):
+                continue
+            known = self._categories.setdefault(col, [])
+            seen = set(known)
+            known.extend(cat for cat in column.cat.categories if cat not in seen)
+            if list(column.cat.categories) != known:
+                columns[col] = column.cat.set_categories(known)
+        return df.assign(**columns) if columns else df
+
+    @abstractmethod
+    def _open(self, schema: Any) -> Any:
+        """Crea el escritor de pyarrow del archivo con el esquema de la primera escritura."""
+
+    def _write_table(self, table: Any) -> None:
+        self._writer.write_table(table)
+
+
+class ParquetExporter(ArrowExporter):
+    """
+    Exporta a Parquet conservando los tipos Int64, Float64, datetime y categóricos.
+
+    Cada escritura genera al menos un row group; row_group_size limita su número de filas.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        compression: str | None = None,
+        row_group_size: int | None = None,
+    ) -> None:
+        super().__init__(path, compression or DEFAULT_COMPRESSION[PARQUET_FORMAT])
+        self.row_group_size = row_group_size
+
+    def _open(self, schema: Any) -> Any:
+        import pyarrow.parquet as pq
+
+        return pq.ParquetWriter(self.path, schema, compression=self.compression)
+
+    def _write_table(self, table: Any) -> None:
+        self._writer.write_table(table, row_group_size=self.row_group_size)
+
+
+class FeatherExporter(ArrowExporter):
+    """Exporta a Feather v2 (archivo Arrow IPC), legible con pd.read_feather sin parsear."""
+
+    def __init__(self, path: str | Path, compression: str | None = None) -> None:
+        super().__init__(path, compression or DEFAULT_COMPRESSION[FEATHER_FORMAT])
+
+    def _open(self, schema: Any) -> Any:
+        import pyarrow.ipc as ipc
+
+        options = ipc.IpcWriteOptions(
+            compression=None if self.compression == "uncompressed" else self.compression,
+            # Las categorías nuevas de cada chunk se escriben como delta del diccionario
+            emit_dictionary_deltas=True,
+        )
+        return ipc.new_file(self.path, schema, options=options)
+
+
+EXPORTERS: dict[str, type[Exporter]] = {
+    CSV_FORMAT: CSVExporter,
+    PARQUET_FORMAT: ParquetExporter,
+    FEATHER_FORMAT: FeatherExporter,
+}
+
+
+def get_exporter(
+    output_dir: str | Path, name: str, config: dict[str, Any], append: bool = False
+) -> Exporter:
+    """
+    Crea el exportador configurado en la sección "export" del config.json.
+
+    :param output_dir: Carpeta de salida; se crea si no existe.
+    :type output_dir: str | Path
+    :param name: Nombre base del archivo; se escribe <name>_clean.<formato>, con el sufijo
+                 de la compresión en los CSV comprimidos (p. ej. <name>_clean.csv.gz).
+    :type name: str
+    :param config: Configuración completa del pipeline.
+    :type config: dict[str, Any]
+    :param append: Si es True, se añaden filas a la salida existente (solo en CSV).
+    :type append: bool
+    :raises ValueError: Si el formato o la compresión del CSV no existen, o si se pide
+                        append en un formato binario.
+    :raises ImportError: Si el formato necesita pyarrow y no está instalado.
+    :return: Exportador listo para escribir.
+    :rtype: Exporter
+    """
+    export = config.get("export", {})
+    fmt = export.get("format", CSV_FORMAT)
+    if fmt not in EXPORTERS:
+        raise ValueError(
+            f"Formato de exportación desconocido '{fmt}', se esperaba uno de {sorted(EXPORTERS)}"
+        )
+    if append and fmt != CSV_FORMAT:
+        raise ValueError(f"Solo se pueden añadir filas a un CSV, no a '{fmt}'")
+    if fmt != CSV_FORMAT and find_spec("pyarrow") is None:
+        raise ImportError(f"El formato de exportación '{fmt}' necesita pyarrow")
+
+    compression = export.get("compression")
+    if fmt == CSV_FORMAT and compression not in (None, *CSV_COMPRESSIONS):
+        raise ValueError(
+            f"Compresión de CSV desconocida '{compression}', se esperaba una de {CSV_COMPRESSIONS}"
+        )
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / f"{name}_clean.{fmt}"
+
+    if fmt == PARQUET_FORMAT:
+        return ParquetExporter(path, compression, export.get("row_group_size"))
+    if fmt == FEATHER_FORMAT:
+        return FeatherExporter(path, compression)
+    if compression is not None:
+        path = path.with_name(path.name + SUFFIXES[compression])
+    return CSVExporter(path, compression, export.get("compression_level"), append)
+
+
+def _wide_dictionaries(schema: Any) -> Any:
+    """Índices de 32 bits en los diccionarios para que el número de categorías pueda crecer."""
+    import pyarrow as pa
+
+    for i, field in enumerate(schema):
+        if pa.types.is_dictionary(field.type):
+            wide = pa.dictionary(pa.int32(), field.type.value_type, field.type.ordered)
+            schema = schema.set(i, field.with_type(wide))
+    return schema
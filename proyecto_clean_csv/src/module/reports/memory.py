@@ -0,0 +1,68 @@
+import logging
+import sys
+
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def frame_memory(df: pd.DataFrame) -> int:
+    """
+    Bytes que ocupa el DataFrame según pandas.
+
+    No recorre el contenido de las columnas de texto (deep=False) para que medir no cueste
+    más que la propia limpieza en DataFrames grandes.
+
+    :param df: DataFrame a medir.
+    :type df: pd.DataFrame
+    :return: Bytes ocupados por los datos y el índice.
+    :rtype: int
+    """
+    return int(df.memory_usage(index=True, deep=False).sum())
+
+
+def peak_rss() -> int | None:
+    """
+    Pico de memoria residente del proceso en bytes.
+
+    :return: Bytes del pico de RSS, o None si el sistema no lo informa.
+    :rtype: int | None
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa en KB y macOS en bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def log_memory(
+    logger: logging.Logger, stage: str, df: pd.DataFrame, level: int = logging.INFO
+) -> None:
+    """
+    Registra la memoria del DataFrame y el pico de RSS del proceso en una etapa.
+
+    Solo se mide si el nivel está habilitado en el logger.
+
+    :param logger: Logger donde se registra la medida.
+    :type logger: logging.Logger
+    :param stage: Nombre de la etapa (p. ej. "antes de la limpieza").
+    :type stage: str
+    :param df: DataFrame de la etapa.
+    :type df: pd.DataFrame
+    :param level: Nivel de logging del registro.
+    :type level: int
+    """
+    if not logger.isEnabledFor(level):
+        return
+
+    peak = peak_rss()
+    logger.log(
+        level,
+        "Memoria %s: DataFrame %.1f MB, pico de RSS del proceso %s.",
+        stage,
+        frame_memory(df) / (1024 * 1024),
+        f"{peak / (1024 * 1024):.1f} MB" if peak is not None else "no disponible",
+    )
@@ -0,0 +1,108 @@
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+
+@dataclass
+class FunctionMetrics:
+    """Métricas acumuladas de todas las llamadas a una función instrumentada."""
+
+    calls: int = 0
+    seconds: float = 0.0
+    rows_in: int = 0
+    rows_out: int = 0
+    memory_delta: int = 0
+    dtype_changes: dict[str, list[str]] = field(default_factory=dict)
+    counts: dict[str, int] = field(default_factory=dict)
+
+
+class MetricsCollector:
+    """
+    Almacén en memoria de las métricas de los decoradores y del pipeline.
+
+    Guarda datos estructurados (no textos formateados) agregados por función, de modo que el
+    coste no crece con el número de chunks. Solo registra si está habilitado.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._functions: dict[str, FunctionMetrics] = {}
+
+    def record(
+        self,
+        name: str,
+        seconds: float,
+        rows_in: int = 0,
+        rows_out: int = 0,
+        memory_delta: int = 0,
+        dtype_changes: dict[str, tuple[str, str]] | None = None,
+    ) -> None:
+        """
+        Añade una llamada a las métricas de la función.
+
+        :param name: Nombre de la función o etapa.
+        :type name: str
+        :param seconds: Duración de la llamada.
+        :type seconds: float
+        :param rows_in: Filas del DataFrame de entrada.
+        :type rows_in: int
+        :param rows_out: Filas del DataFrame de salida.
+        :type rows_out: int
+        :param memory_delta: Diferencia de bytes entre el DataFrame de salida y el de entrada.
+        :type memory_delta: int
+        :param dtype_changes: Columnas cuyo tipo ha cambiado, {columna: (antes, después)}.
+        :type dtype_changes: dict[str, tuple[str, str]] | None
+        """
+        if not self.enabled:
+            return
+
+        metrics = self._functions.setdefault(name, FunctionMetrics())
+        metrics.calls += 1
+        metrics.seconds += seconds
+        metrics.rows_in += rows_in
+        metrics.rows_out += rows_out
+        metrics.memory_delta += memory_delta
+        for column, (before, after) in (dtype_changes or {}).items():
+            metrics.dtype_changes[column] = [before, after]
+
+    def count(self, name: str, counts: dict[str, int]) -> None:
+        """
+        Suma contadores propios de una función (p. ej. valores imputados por columna).
+
+        :param name: Nombre de la función o etapa.
+        :type name: str
+        :param counts: Contadores de la llamada, {nombre: valor}.
+        :type counts: dict[str, int]
+        """
+        if not self.enabled:
+            return
+
+        totals = self._functions.setdefault(name, FunctionMetrics()).counts
+        for key, value in counts.items():
+            totals[key] = totals.get(key, 0) + value
+
+    def reset(self) -> None:
+        self._functions.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {name: asdict(metrics) for name, metrics in self._functions.items()}
+
+    def export_json(self, path: str | Path) -> Path:
+        """
+        Guarda las métricas en un archivo JSON.
+
+        :param path: Ruta del archivo.
+        :type path: str | Path
+        :return: Ruta del archivo escrito.
+        :rtype: Path
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=2, ensure_ascii=False)
+        return path
+
+
+# Colector compartido por los decoradores; el orquestador lo habilita según el config.json
+metrics = MetricsCollector()
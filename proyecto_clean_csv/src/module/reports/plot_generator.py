@@ -7,6 +7,18 @@ import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+
+def plot_filename(name: str, column: str) -> str:
+    """
+    Nombre del gráfico de una columna: lleva el nombre del archivo procesado para que los
+    archivos de un lote no sobrescriban los gráficos de los demás.
+
+    :param name: nombre base de las salidas del archivo (ej: 'ventas')
+    :param column: columna del gráfico
+    """
+    return f"{name}_{column}_plot.png"
+
+
 class BasePlot:
 
     def __init__(self, df: pd.DataFrame, base_dir: Path, name: str):
@@ -59,23 +71,36 @@ class BarPlot(BasePlot):
     :param xlabel: etiqueta del eje x
     :param ylabel: etiqueta del eje y
     :param color: color de las barras
+    :param counts: recuentos ya calculados (modo por chunks); si se indican no se usa el df
     """
-    def __init__(self, df: pd.DataFrame, base_dir: Path, name: str,
+    def __init__(self, df: pd.DataFrame | None, base_dir: Path, name: str,
                  column: str, title: str = None, xlabel: str = None,
-                 ylabel: str = None, color: str = "blue") -> None:
+                 ylabel: str = None, color: str = "blue",
+                 counts: pd.Series | None = None) -> None:
         super().__init__(df, base_dir, name)
         self.column = column
+        self.counts = counts
         self.title = title
         self.xlabel = xlabel
         self.ylabel = ylabel
         self.color = color
 
     def plot(self):
-        if self.column not in self.df.columns:
+        if self.counts is not None:
+            counts = self.counts
+        elif self.df is None or self.column not in self.df.columns:
             logger.error(f"'{self.column}' no existe en el DataFrame")
             return
-
-        counts = self.df[self.column].value_counts()
+        else:
+            counts = self.df[self.column].value_counts()
+        # Las columnas categóricas cuentan también las categorías sin filas
+        counts = counts[counts > 0]
+        filename = plot_filename(self.name, self.column)
+        if counts.empty:
+            # Sin filas no hay gráfico: no se deja el de una ejecución anterior
+            (self.plots_dir / filename).unlink(missing_ok=True)
+            logger.info(f"'{self.column}' no tiene valores: no se genera su gráfico")
+            return
         fig, ax = plt.subplots(figsize=(8, 6))
         counts.plot(kind='bar', ax=ax, color=self.color)
 
@@ -87,6 +112,4 @@ class BarPlot(BasePlot):
         ax.set_ylabel(self.ylabel or "Cantidad")
         ax.grid(axis='y', linestyle='--', alpha=0.7)
 
-        filename = f"{self.column}_plot.png"
-
         self.save_plot(fig, filename)
@@ -0,0 +1,184 @@
+import json
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .memory import peak_rss
+
+STAGE = "etapa"
+FUNCTION = "función"
+
+MB = 1024 * 1024
+
+
+@dataclass
+class StageStats:
+    """Medidas acumuladas de todas las ejecuciones de una etapa o función."""
+
+    kind: str
+    calls: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    rows: int = 0
+    tracemalloc_peak: int = 0
+    rss_peak: int = 0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "calls": self.calls,
+            "wall_seconds": round(self.wall_seconds, 6),
+            "cpu_seconds": round(self.cpu_seconds, 6),
+            "rows": self.rows,
+            "rows_per_second": round(self.rows_per_second, 1),
+            "tracemalloc_peak_mb": round(self.tracemalloc_peak / MB, 3),
+            "rss_peak_mb": round(self.rss_peak / MB, 3),
+        }
+
+
+class StageRecord:
+    """Ejecución en curso de una etapa; la etapa indica las filas que ha procesado."""
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.child_peak = 0
+
+
+class StageProfiler:
+    """
+    Perfilador de etapas del pipeline (modo --profile).
+
+    Cada etapa mide tiempo real, tiempo de CPU, pico de memoria de Python (tracemalloc),
+    pico de RSS del proceso y filas por segundo. Las etapas pueden anidarse (p. ej. los
+    limpiadores dentro de la limpieza): el pico de tracemalloc de una etapa incluye el de
+    las etapas internas. Mientras está deshabilitado, stage() no mide nada.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._stats: dict[str, StageStats] = {}
+        self._stack: list[StageRecord] = []
+        self._started_tracemalloc = False
+
+    def start(self) -> None:
+        """Vacía las medidas anteriores y empieza a perfilar."""
+        self._stats.clear()
+        self._stack.clear()
+        self.enabled = True
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self) -> None:
+        """Deja de perfilar. Las medidas se conservan hasta el siguiente start()."""
+        self.enabled = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @contextmanager
+    def stage(self, name: str, kind: str = STAGE) -> Iterator[StageRecord]:
+        """
+        Mide el bloque como una ejecución de la etapa name.
+
+        :param name: Nombre de la etapa o función.
+        :type name: str
+        :param kind: STAGE para las etapas del orquestador o FUNCTION para limpiadores y
+                     transformaciones.
+        :type kind: str
+        :yield: Registro de la ejecución, donde el bloque puede fijar las filas procesadas.
+        :rtype: Iterator[StageRecord]
+        """
+        record = StageRecord()
+        if not self.enabled:
+            yield record
+            return
+
+        # Se registra al entrar para que la tabla siga el orden de inicio de las etapas
+        stats = self._stats.setdefault(name, StageStats(kind=kind))
+
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            # El pico anterior pertenece a la etapa externa: se guarda antes de reiniciarlo
+            if self._stack:
+                self._stack[-1].child_peak = max(self._stack[-1].child_peak, peak)
+            tracemalloc.reset_peak()
+
+        self._stack.append(record)
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield record
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+            self._stack.pop()
+
+            stage_peak = 0
+            if tracing:
+                absolute_peak = max(tracemalloc.get_traced_memory()[1], record.child_peak)
+                stage_peak = max(0, absolute_peak - current)
+                if self._stack:
+                    self._stack[-1].child_peak = max(self._stack[-1].child_peak, absolute_peak)
+
+            stats.calls += 1
+            stats.wall_seconds += wall
+            stats.cpu_seconds += cpu
+            stats.rows += record.rows
+            stats.tracemalloc_peak = max(stats.tracemalloc_peak, stage_peak)
+            stats.rss_peak = max(stats.rss_peak, peak_rss() or 0)
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        return {name: stats.to_dict() for name, stats in self._stats.items()}
+
+    def table(self) -> str:
+        """
+        Tabla de texto con una fila por etapa y función, en el orden en que empezaron.
+
+        :return: Tabla lista para imprimir.
+        :rtype: str
+        """
+        header = (
+            f"{'etapa':<28}{'tipo':>9}{'llamadas':>10}{'real (s)':>11}{'cpu (s)':>10}"
+            f"{'filas':>11}{'filas/s':>13}{'tracemalloc (MB)':>18}{'RSS (MB)':>10}"
+        )
+        lines = [header, "-" * len(header)]
+        for name, stats in self._stats.items():
+            lines.append(
+                f"{name:<28}{stats.kind:>9}{stats.calls:>10}{stats.wall_seconds:>11.4f}"
+                f"{stats.cpu_seconds:>10.4f}{stats.rows:>11}{stats.rows_per_second:>13.0f}"
+                f"{stats.tracemalloc_peak / MB:>18.2f}{stats.rss_peak / MB:>10.1f}"
+            )
+        return "\n".join(lines)
+
+    def export(self, path: str | Path, **summary: Any) -> tuple[Path, Path]:
+        """
+        Guarda el perfil en JSON y la tabla en un .txt junto a él.
+
+        :param path: Ruta del archivo JSON.
+        :type path: str | Path
+        :param summary: Datos generales de la ejecución que se añaden al JSON.
+        :return: Rutas del JSON y de la tabla de texto.
+        :rtype: tuple[Path, Path]
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as file:
+            json.dump({**summary, "stages": self.to_dict()}, file, indent=2, ensure_ascii=False)
+
+        table_path = path.with_suffix(".txt")
+        table_path.write_text(self.table() + "\n", encoding="utf-8")
+        return path, table_path
+
+
+# Perfilador compartido por el orquestador, los decoradores y el pipeline de transformaciones
+profiler = StageProfiler()
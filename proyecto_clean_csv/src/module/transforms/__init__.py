@@ -1,8 +1,15 @@
+from .date_parts import DateParts, date_parts
 from .item import add_category_column
+from .pipeline import ColumnTransform, TransformPipeline, default_pipeline
 from .weekday import add_weekday_column
 from .year_third import add_year_third_column
 
 __all__ = [
+    "ColumnTransform",
+    "TransformPipeline",
+    "default_pipeline",
+    "DateParts",
+    "date_parts",
     "add_category_column",
     "add_year_third_column",
     "add_weekday_column",
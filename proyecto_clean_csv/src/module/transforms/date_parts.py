@@ -0,0 +1,74 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# Tercio del año (0, 1, 2) de cada mes; la posición 0 no es un mes válido
+YEAR_THIRD_BY_MONTH = np.array([-1, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2], dtype=np.int8)
+
+
+@dataclass(frozen=True)
+class DateParts:
+    """
+    Columna de fechas descompuesta una sola vez en partes enteras.
+
+    Las partes se calculan solo para las fechas distintas (``month`` y ``weekday``) y cada fila
+    guarda la posición de su fecha en ``codes`` (-1 si es nula), de modo que derivar una
+    columna es indexar una tabla pequeña con un array de enteros.
+    """
+
+    index: pd.Index
+    codes: np.ndarray
+    month: np.ndarray
+    weekday: np.ndarray
+
+    def weekday_codes(self) -> np.ndarray:
+        """Día de la semana de cada fila (0 = lunes) o -1 si la fecha es nula."""
+        return _lookup(self.weekday, self.codes)
+
+    def year_third_codes(self) -> np.ndarray:
+        """Tercio del año de cada fila (0 = T1) o -1 si la fecha es nula."""
+        return _lookup(YEAR_THIRD_BY_MONTH[self.month], self.codes)
+
+    def aligned_with(self, df: pd.DataFrame) -> bool:
+        return self.index.equals(df.index)
+
+
+def date_parts(df: pd.DataFrame, date_column: str = "Transaction Date") -> DateParts:
+    """
+    Descompone la columna de fechas en mes y día de la semana.
+
+    Los archivos tienen millones de filas pero pocos cientos de fechas distintas: la columna
+    se factoriza y las partes se calculan una vez por fecha distinta.
+
+    :param df: Input DataFrame.
+    :type df: pd.DataFrame
+    :param date_column: Nombre de la columna que contiene las fechas.
+                        El Default es "Transaction Date".
+    :type date_column: str
+    :raises ValueError: Si la columna no existe en el df.
+    :raises TypeError: Si la columna no es de tipo fecha.
+    :return: Partes de la fecha de cada fila.
+    :rtype: DateParts
+    """
+    if date_column not in df.columns:
+        raise ValueError(f"Column '{date_column}' not found in DataFrame")
+
+    column = df[date_column]
+    if not pd.api.types.is_datetime64_any_dtype(column):
+        raise TypeError(f"Column '{date_column}' is not a datetime column")
+
+    codes, uniques = pd.factorize(column)
+    uniques = pd.DatetimeIndex(uniques)
+
+    return DateParts(
+        index=df.index,
+        codes=codes,
+        month=uniques.month.to_numpy(dtype=np.int8),
+        weekday=uniques.weekday.to_numpy(dtype=np.int8),
+    )
+
+
+def _lookup(table: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    # Se añade -1 al final de la tabla para que el código -1 (fecha nula) siga siendo -1
+    return np.append(table, np.int8(-1))[codes]
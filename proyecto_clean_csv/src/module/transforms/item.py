@@ -10,11 +10,14 @@ def add_category_column(
     item_column: str="Item",
     category_column: str = "Category",
     default_category: str = "unknown",
+    compact: bool = False,
 ) -> pd.DataFrame:
     """
 
     Añade una columna de categoria (food/drink) en fución del producto vendido (Item)
 
+    En modo compacto la columna se crea como categórica: solo guarda un código por fila.
+
     :param df: Input DataFrame
     :type df: pd.DataFrame
     :param item_column: Nombre de la columna que contiene el Item/Nombre del producto
@@ -23,14 +26,40 @@ def add_category_column(
     :type category_column: str
     :param default_category:Categoria que se le asigna a un producto no identificado en el .map
     :type default_category: str
+    :param compact: Si es True, la columna es categórica; si no, de texto.
+    :type compact: bool
     :return: DataFrame con la nueva columna de categoria
     :rtype: pd.DataFrame
     """
     if item_column not in df.columns:
         raise ValueError(f"Column '{item_column}' not found in DataFrame")
 
-    df=df.copy()
+    # Copia superficial: solo se añade una columna, no se copian las existentes
+    df = df.copy(deep=False)
 
-    df[category_column] = df[item_column].map(ITEM_TO_CATEGORY).fillna(default_category)
+    df[category_column] = category_values(df[item_column], default_category, compact)
 
     return df
+
+
+def category_values(
+    items: pd.Series, default_category: str = "unknown", compact: bool = False
+) -> pd.api.extensions.ExtensionArray:
+    """
+    Categoría (food/drink) de cada producto, como categórica en modo compacto y como texto
+    en otro caso.
+
+    :param items: Columna con los productos.
+    :type items: pd.Series
+    :param default_category: Categoria de los productos no identificados en el .map
+    :type default_category: str
+    :param compact: Si es True, los valores se devuelven como categórica.
+    :type compact: bool
+    :return: Valores de la columna Category.
+    :rtype: pd.api.extensions.ExtensionArray
+    """
+    categories = sorted({*ITEM_TO_CATEGORY.values(), default_category})
+    # Si Item ya es categórica, map solo traduce sus categorías, no cada fila
+    mapped = items.map(ITEM_TO_CATEGORY)
+    values = pd.Categorical(mapped, categories=categories).fillna(default_category)
+    return values if compact else values.astype("str")
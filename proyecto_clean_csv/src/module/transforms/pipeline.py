@@ -0,0 +1,213 @@
+import logging
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import pandas as pd
+
+from module.reports.metrics import metrics
+from module.reports.profiler import FUNCTION, profiler
+
+from .date_parts import DateParts, date_parts
+from .item import category_values
+from .weekday import weekday_values
+from .year_third import year_third_values
+
+logger = logging.getLogger(__name__)
+
+# Recibe el DataFrame de trabajo y una caché compartida por las transformaciones de una
+# misma ejecución; devuelve {columna nueva: valores}
+TransformFunc = Callable[[pd.DataFrame, dict[str, Any]], dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class ColumnTransform:
+    """Transformación que produce columnas nuevas a partir de columnas existentes."""
+
+    name: str
+    func: TransformFunc
+    inputs: tuple[str, ...]
+    outputs: tuple[str, ...]
+
+
+class TransformPipeline:
+    """
+    Conjunto de transformaciones de columnas que se ejecutan en una sola pasada.
+
+    Cada transformación declara las columnas que necesita y las que produce. Al ejecutar, el
+    orden se resuelve a partir de esas dependencias (respetando el orden de registro cuando
+    no hay restricciones) y todas las columnas nuevas se añaden a un único DataFrame, sin
+    copiar las columnas existentes. El tiempo de cada transformación se acumula en
+    ``timings``.
+    """
+
+    def __init__(self) -> None:
+        self._transforms: list[ColumnTransform] = []
+        self.timings: dict[str, float] = defaultdict(float)
+
+    @property
+    def transforms(self) -> list[ColumnTransform]:
+        return list(self._transforms)
+
+    def register(
+        self, name: str, inputs: tuple[str, ...], outputs: tuple[str, ...]
+    ) -> Callable[[TransformFunc], TransformFunc]:
+        """
+        Decorador que registra una función como transformación del pipeline.
+
+        :param name: Nombre de la transformación (se usa en los tiempos).
+        :type name: str
+        :param inputs: Columnas que necesita.
+        :type inputs: tuple[str, ...]
+        :param outputs: Columnas que produce.
+        :type outputs: tuple[str, ...]
+        :return: Decorador que devuelve la función sin modificar.
+        :rtype: Callable[[TransformFunc], TransformFunc]
+        """
+        def decorator(func: TransformFunc) -> TransformFunc:
+            self.add(ColumnTransform(name, func, tuple(inputs), tuple(outputs)))
+            return func
+
+        return decorator
+
+    def add(self, transform: ColumnTransform) -> None:
+        """
+        Añade una transformación al pipeline.
+
+        :param transform: Transformación a añadir.
+        :type transform: ColumnTransform
+        :raises ValueError: Si el nombre o alguna de sus columnas de salida ya está registrada.
+        """
+        for registered in self._transforms:
+            if registered.name == transform.name:
+                raise ValueError(f"Transform '{transform.name}' is already registered")
+            repeated = set(registered.outputs) & set(transform.outputs)
+            if repeated:
+                raise ValueError(
+                    f"Column '{sorted(repeated)[0]}' is already produced by "
+                    f"'{registered.name}'"
+                )
+        self._transforms.append(transform)
+
+    def plan(self, columns: list[str]) -> list[ColumnTransform]:
+        """
+        Ordena las transformaciones según sus dependencias de columnas.
+
+        :param columns: Columnas disponibles en el DataFrame de entrada.
+        :type columns: list[str]
+        :raises ValueError: Si alguna transformación necesita una columna que ni existe ni
+                            produce otra transformación (o hay una dependencia circular).
+        :return: Transformaciones en orden de ejecución.
+        :rtype: list[ColumnTransform]
+        """
+        available = set(columns)
+        pending = list(self._transforms)
+        ordered: list[ColumnTransform] = []
+
+        while pending:
+            ready = next(
+                (t for t in pending if all(col in available for col in t.inputs)), None
+            )
+            if ready is None:
+                transform = pending[0]
+                missing = next(col for col in transform.inputs if col not in available)
+                raise ValueError(
+                    f"Column '{missing}' not found in DataFrame "
+                    f"(required by '{transform.name}')"
+                )
+            pending.remove(ready)
+            ordered.append(ready)
+            available.update(ready.outputs)
+
+        return ordered
+
+    def run(self, df: pd.DataFrame, log: bool = True) -> pd.DataFrame:
+        """
+        Ejecuta todas las transformaciones y devuelve el DataFrame con las columnas nuevas.
+
+        :param df: DataFrame de entrada. No se modifica.
+        :type df: pd.DataFrame
+        :param log: Si es False no se registran los tiempos (el modo por chunks los resume
+                    al final con log_timings).
+        :type log: bool
+        :return: DataFrame con las columnas de entrada y las producidas.
+        :rtype: pd.DataFrame
+        """
+        ordered = self.plan(list(df.columns))
+
+        # Copia superficial: las columnas nuevas se añaden sin copiar las existentes
+        result = df.copy(deep=False)
+        cache: dict[str, Any] = {}
+        timings: dict[str, float] = {}
+
+        for transform in ordered:
+            start = time.perf_counter()
+            with profiler.stage(f"transform:{transform.name}", FUNCTION) as stage:
+                stage.rows = len(result)
+                for column, values in transform.func(result, cache).items():
+                    result[column] = values
+            timings[transform.name] = time.perf_counter() - start
+            self.timings[transform.name] += timings[transform.name]
+            metrics.record(
+                f"transform:{transform.name}",
+                timings[transform.name],
+                rows_in=len(result),
+                rows_out=len(result),
+            )
+
+        if log:
+            self._log(timings, len(result))
+        return result
+
+    def log_timings(self) -> None:
+        """Registra los tiempos acumulados de todas las ejecuciones."""
+        self._log(self.timings)
+
+    @staticmethod
+    def _log(timings: dict[str, float], rows: int | None = None) -> None:
+        if not timings:
+            return
+        logger.info(
+            "Transformaciones%s: %s.",
+            f" ({rows} filas)" if rows is not None else "",
+            ", ".join(f"'{name}' {seconds:.4f} s" for name, seconds in timings.items()),
+        )
+
+
+def cached_date_parts(
+    df: pd.DataFrame, cache: dict[str, Any], date_column: str = "Transaction Date"
+) -> DateParts:
+    """Partes de la fecha compartidas por las transformaciones de una misma ejecución."""
+    key = f"date_parts:{date_column}"
+    if key not in cache:
+        cache[key] = date_parts(df, date_column)
+    return cache[key]
+
+
+def default_pipeline(compact: bool = False) -> TransformPipeline:
+    """
+    Pipeline con las transformaciones del proyecto: Year third, Weekday y Category.
+
+    :param compact: Si es True, las columnas nuevas son categóricas, como las columnas de
+                    baja cardinalidad que lee el modo compacto; si no, de texto.
+    :type compact: bool
+    :return: Pipeline nuevo, con los tiempos a cero.
+    :rtype: TransformPipeline
+    """
+    pipeline = TransformPipeline()
+
+    @pipeline.register("year_third", inputs=("Transaction Date",), outputs=("Year third",))
+    def _year_third(df: pd.DataFrame, cache: dict[str, Any]) -> dict[str, Any]:
+        return {"Year third": year_third_values(cached_date_parts(df, cache), compact)}
+
+    @pipeline.register("weekday", inputs=("Transaction Date",), outputs=("Weekday",))
+    def _weekday(df: pd.DataFrame, cache: dict[str, Any]) -> dict[str, Any]:
+        return {"Weekday": weekday_values(cached_date_parts(df, cache), compact)}
+
+    @pipeline.register("category", inputs=("Item",), outputs=("Category",))
+    def _category(df: pd.DataFrame, cache: dict[str, Any]) -> dict[str, Any]:
+        return {"Category": category_values(df["Item"], compact=compact)}
+
+    return pipeline
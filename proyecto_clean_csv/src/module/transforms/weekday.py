@@ -1,18 +1,26 @@
 import pandas as pd
 
+from module.data_models.schema import WEEKDAYS
 from module.reports import track_changes
 
+from .date_parts import DateParts, date_parts
+
 
 @track_changes
 def add_weekday_column(
     df: pd.DataFrame,
     date_column: str= "Transaction Date",
-    weekday_column: str="Weekday"
+    weekday_column: str="Weekday",
+    parts: DateParts | None = None,
+    compact: bool = False,
 )-> pd.DataFrame:
     """
     Añade una columna indicando el nombre del día de la semana de cada fecha de transacción
     (e.g., Monday, Tuesday, etc.).
 
+    En modo compacto la columna es categórica y ordenada de lunes a domingo. Se obtiene
+    indexando la tabla de días con las partes de la fecha, sin day_name() por fila.
+
     :param df: Input DataFrame.
     :type df: pd.DataFrame
     :param date_column: Nombre de la columna que contiene las fechas.
@@ -21,6 +29,11 @@ def add_weekday_column(
     :param weekday_column: Nombre de la nueva columna añadida al df.
                            El Default es "Weekday".
     :type weekday_column: str
+    :param parts: Partes de la fecha ya calculadas (ver date_parts). Si no se indican o no
+                  están alineadas con el df, se calculan.
+    :type parts: DateParts | None
+    :param compact: Si es True, la columna es categórica; si no, de texto.
+    :type compact: bool
     :raises ValueError: Si la columna que se especifíca no existe en el df.
     :return: DataFrame con la columna nueva añadida.
     :rtype: pd.DataFrame
@@ -28,8 +41,32 @@ def add_weekday_column(
     if date_column not in df.columns:
         raise ValueError(f"Column '{date_column}' not found in DataFrame")
 
-    df=df.copy()
+    if parts is None or not parts.aligned_with(df):
+        parts = date_parts(df, date_column)
 
-    df[weekday_column]=df[date_column].dt.day_name()
+    # Copia superficial: solo se añade una columna, no se copian las existentes
+    df = df.copy(deep=False)
+
+    df[weekday_column] = weekday_values(parts, compact)
 
     return df
+
+
+def weekday_values(
+    parts: DateParts, compact: bool = False
+) -> pd.api.extensions.ExtensionArray:
+    """
+    Día de la semana de cada fila, como categórica ordenada de lunes a domingo en modo
+    compacto y como texto en otro caso.
+
+    :param parts: Partes de la fecha.
+    :type parts: DateParts
+    :param compact: Si es True, los valores se devuelven como categórica.
+    :type compact: bool
+    :return: Valores de la columna Weekday.
+    :rtype: pd.api.extensions.ExtensionArray
+    """
+    values = pd.Categorical.from_codes(
+        parts.weekday_codes(), categories=WEEKDAYS, ordered=True
+    )
+    return values if compact else values.astype("str")
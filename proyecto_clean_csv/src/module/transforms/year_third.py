@@ -1,13 +1,18 @@
 import pandas as pd
 
+from module.data_models.schema import YEAR_THIRDS
 from module.reports import track_changes
 
+from .date_parts import DateParts, date_parts
+
 
 @track_changes
 def add_year_third_column(
     df: pd.DataFrame,
     date_column: str="Transaction Date",
-    output_column: str="Year third"
+    output_column: str="Year third",
+    parts: DateParts | None = None,
+    compact: bool = False,
 )-> pd.DataFrame:
     """
     Añade una columna indicando el tercio del año en el que se produce cada transacción
@@ -17,6 +22,8 @@ def add_year_third_column(
         - T2: de Mayo a Agosto
         - T3: de Septiembre a Diciembre
 
+    En modo compacto la columna es categórica y ordenada (T1 < T2 < T3).
+
     :param df: Input DataFrame.
     :type df: pd.DataFrame
     :param date_column: Nombre de la columna que contiene las fechas.
@@ -25,6 +32,11 @@ def add_year_third_column(
     :param output_column: Nombre de la columna que contiene los tercios del año.
                           El Default es "Year Third".
     :type output_column: str
+    :param parts: Partes de la fecha ya calculadas (ver date_parts). Si no se indican o no
+                  están alineadas con el df, se calculan.
+    :type parts: DateParts | None
+    :param compact: Si es True, la columna es categórica; si no, de texto.
+    :type compact: bool
     :raises ValueError: Si el DataFrame es None.
     :raises ValueError: Si la columna que se ha especificado no existe en el df.
     :return: Una copia del DataFrame con la nuevacolumna añadida.
@@ -36,12 +48,33 @@ def add_year_third_column(
     if date_column not in df.columns:
         raise ValueError(f"Column '{date_column}' not found in DataFrame")
 
-    df=df.copy()
+    if parts is None or not parts.aligned_with(df):
+        parts = date_parts(df, date_column)
 
-    months = df[date_column].dt.month
+    # Copia superficial: solo se añade una columna, no se copian las existentes
+    df = df.copy(deep=False)
 
-    year_third_numeric = ((months - 1) // 4 + 1)
-
-    df[output_column] = year_third_numeric.map({1: "T1", 2:"T2", 3:"T3"})
+    df[output_column] = year_third_values(parts, compact)
 
     return df
+
+
+def year_third_values(
+    parts: DateParts, compact: bool = False
+) -> pd.api.extensions.ExtensionArray:
+    """
+    Tercio del año de cada fila, como categórica ordenada (T1 < T2 < T3) en modo compacto y
+    como texto en otro caso.
+
+    :param parts: Partes de la fecha.
+    :type parts: DateParts
+    :param compact: Si es True, los valores se devuelven como categórica.
+    :type compact: bool
+    :return: Valores de la columna Year third.
+    :rtype: pd.api.extensions.ExtensionArray
+    """
+    # Código 0, 1 o 2 del tercio; las fechas nulas quedan con el código -1 (nulo)
+    values = pd.Categorical.from_codes(
+        parts.year_third_codes(), categories=YEAR_THIRDS, ordered=True
+    )
+    return values if compact else values.astype("str")
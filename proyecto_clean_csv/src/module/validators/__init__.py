@@ -1,8 +1,12 @@
 from .base_validator import Validator
+from .fused_validator import FusedValidator
+from .sampling import ColumnConfidence
 from .specific_validators import DuplicateValidator, NullValidator, TypeValidator
 
 __all__ = [
+    "ColumnConfidence",
     "Validator",
+    "FusedValidator",
     "NullValidator",
     "DuplicateValidator",
     "TypeValidator",
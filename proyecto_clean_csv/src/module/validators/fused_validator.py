@@ -0,0 +1,244 @@
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from module.data_models.coercion import SCHEMA_TYPES, coerce_column
+from module.data_models.error_index import SENTINEL_VALUES, ErrorIndex
+from module.data_models.nulls import is_text
+from module.data_models.schema import (
+    COLUMN_TYPES,
+    DUPLICATED_VALUES_ERROR,
+    NULL_SENTINELS,
+    NULL_VALUES_ERROR,
+    TRANSACTION_ID,
+    TYPE_ERROR,
+)
+
+from .base_validator import Validator
+from .parallel import map_columns
+from .sampling import ERROR_ORDER, ColumnConfidence, max_error_rate, sample_positions
+
+
+class FusedValidator(Validator):
+    """
+    Validador que sustituye a NullValidator, DuplicateValidator y TypeValidator recorriendo
+    cada columna una sola vez.
+
+    Para cada columna calcula la máscara de nulos, los duplicados de la columna clave y la
+    conversión al tipo del esquema. Las columnas convertidas quedan guardadas en ``coerced``
+    para que la limpieza (apply_schema_types) las reutilice en lugar de volver a parsearlas.
+
+    Además, ``error_index`` guarda las posiciones de las filas de cada error para que los
+    limpiadores revisen solo esas filas.
+
+    Con "validations.sampling" habilitado y un DataFrame mayor que la muestra, se valida
+    primero una muestra de filas (ver validate_column_sampled) y ``confidence`` indica la
+    fiabilidad del informe de cada columna.
+    """
+
+    def __init__(self, key_column: str = TRANSACTION_ID) -> None:
+        self._key_column = key_column
+        self._types = COLUMN_TYPES
+        self.coerced: dict[str, pd.Series] = {}
+        self.confidence: dict[str, ColumnConfidence] = {}
+        self.error_index = ErrorIndex()
+
+    def validate(self, df: pd.DataFrame, config: dict[str, Any]) -> dict[str, list[str]]:
+        """
+        Devuelve los mismos errores que los tres validadores por separado, respetando los
+        interruptores de la sección "validations" de la configuración.
+
+        :param df: DataFrame de pandas a validar.
+        :type df: pd.DataFrame
+        :return: Diccionario con los errores encontrados.
+        :rtype: dict[str, list[str]]
+        """
+        validations = config.get("validations", {})
+        check_nulls = validations.get("validate_nulls", False)
+        check_duplicates = validations.get("validate_duplicates", False)
+        check_types = validations.get("validate_types", False)
+
+        sampling = validations.get("sampling", {})
+        positions = (
+            sample_positions(len(df), sampling) if sampling.get("enabled", False) else None
+        )
+
+        sentinels = tuple(config.get("nulls", {}).get("sentinels", NULL_SENTINELS))
+
+        self.coerced = {}
+        self.confidence = {}
+        self.error_index = ErrorIndex(len(df))
+        errors: dict[str, list[str]] = {}
+
+        columns = list(df.columns)
+        tasks = [
+            (
+                df[col],
+                self._types.get(col) if check_types else None,
+                check_nulls,
+                check_duplicates and col == self._key_column,
+            )
+            for col in columns
+        ]
+        if positions is None:
+            results = map_columns(
+                validate_column, [(*task, sentinels) for task in tasks], config
+            )
+        else:
+            escalate = sampling.get("escalate", True)
+            results = map_columns(
+                validate_column_sampled,
+                [(column, positions, *checks, escalate) for column, *checks in tasks],
+                config,
+            )
+
+        for col, (column_errors, converted, rows, *confidence) in zip(
+            columns, results, strict=True
+        ):
+            if column_errors:
+                errors[col] = column_errors
+            if converted is not None:
+                self.coerced[col] = converted
+            # Con muestreo solo se conocen las filas de la muestra: la columna no se indexa
+            if rows is not None:
+                self.error_index.add(col, rows)
+            if confidence:
+                self.confidence[col] = confidence[0]
+
+        return errors
+
+
+def validate_column(
+    column: pd.Series,
+    expected_type: str | None,
+    check_nulls: bool,
+    check_duplicates: bool,
+    sentinels: Sequence[str] = (),
+) -> tuple[list[str], pd.Series | None, dict[str, np.ndarray]]:
+    """
+    Valida una columna en un único recorrido.
+
+    :param column: Columna a validar.
+    :type column: pd.Series
+    :param expected_type: Tipo del esquema, o None si no se valida el tipo.
+    :type expected_type: str | None
+    :param check_nulls: Si se comprueban nulos.
+    :type check_nulls: bool
+    :param check_duplicates: Si se comprueban duplicados (solo en la columna clave).
+    :type check_duplicates: bool
+    :param sentinels: Textos que los limpiadores tratan como nulos; se guardan sus posiciones
+                      en las columnas de texto.
+    :type sentinels: Sequence[str]
+    :return: Errores de la columna, la columna convertida al tipo del esquema (o None) y las
+             posiciones de las filas de cada error (ver ErrorIndex).
+    :rtype: tuple[list[str], pd.Series | None, dict[str, np.ndarray]]
+    """
+    errors: list[str] = []
+    positions: dict[str, np.ndarray] = {}
+    typed = expected_type in SCHEMA_TYPES
+    coerced = None
+
+    missing = column.isna().to_numpy()
+    nulls = int(missing.sum())
+    positions[NULL_VALUES_ERROR] = np.flatnonzero(missing)
+    if check_nulls and nulls:
+        errors.append(NULL_VALUES_ERROR)
+
+    if sentinels and is_text(column):
+        positions[SENTINEL_VALUES] = np.flatnonzero(column.isin(sentinels).to_numpy(dtype=bool))
+
+    if check_duplicates:
+        # Todas las apariciones de cada clave repetida, no solo las que se eliminarían
+        repeated = column.duplicated(keep=False).to_numpy()
+        positions[DUPLICATED_VALUES_ERROR] = np.flatnonzero(repeated)
+        if repeated.any():
+            errors.append(DUPLICATED_VALUES_ERROR)
+
+    if typed:
+        try:
+            converted = coerced = coerce_column(column, expected_type)
+        except (ValueError, TypeError):
+            # No admite el tipo final (p. ej. decimales en Int64): solo se comprueba
+            converted = pd.to_numeric(column, errors="coerce")
+
+        invalid = converted.isna().to_numpy() & ~missing
+        positions[TYPE_ERROR] = np.flatnonzero(invalid)
+        if invalid.any():
+            errors.append(TYPE_ERROR)
+
+    return errors, coerced, positions
+
+
+def validate_column_sampled(
+    column: pd.Series,
+    positions: np.ndarray,
+    expected_type: str | None,
+    check_nulls: bool,
+    check_duplicates: bool,
+    escalate: bool,
+) -> tuple[list[str], pd.Series | None, None, ColumnConfidence]:
+    """
+    Valida una columna sobre una muestra de filas.
+
+    Un error encontrado en la muestra es seguro. Las comprobaciones que no encuentran nada
+    solo se repiten sobre la columna completa si escalate es True. Los duplicados se
+    comprueban siempre sobre la columna completa si la muestra no los encuentra: es muy raro
+    que una muestra contenga las dos copias de una fila.
+
+    :param column: Columna completa.
+    :type column: pd.Series
+    :param positions: Posiciones de las filas de la muestra.
+    :type positions: np.ndarray
+    :param expected_type: Tipo del esquema, o None si no se valida el tipo.
+    :type expected_type: str | None
+    :param check_nulls: Si se comprueban nulos.
+    :type check_nulls: bool
+    :param check_duplicates: Si se comprueban duplicados (solo en la columna clave).
+    :type check_duplicates: bool
+    :param escalate: Si las comprobaciones sin errores en la muestra se repiten enteras.
+    :type escalate: bool
+    :return: Errores de la columna, la columna completa convertida al tipo del esquema (si
+             se ha convertido entera), None en lugar de las posiciones de los errores (solo
+             se conocen las de la muestra) y la fiabilidad del informe.
+    :rtype: tuple[list[str], pd.Series | None, None, ColumnConfidence]
+    """
+    errors, _, _ = validate_column(
+        column.iloc[positions], expected_type, check_nulls, check_duplicates
+    )
+    checks = {
+        NULL_VALUES_ERROR: check_nulls,
+        DUPLICATED_VALUES_ERROR: check_duplicates,
+        TYPE_ERROR: expected_type in SCHEMA_TYPES,
+    }
+    pending = {error for error, enabled in checks.items() if enabled and error not in errors}
+    escalated = False
+    coerced = None
+
+    if DUPLICATED_VALUES_ERROR in pending:
+        escalated = True
+        pending.discard(DUPLICATED_VALUES_ERROR)
+        if column.duplicated().any():
+            errors.append(DUPLICATED_VALUES_ERROR)
+
+    if escalate and pending:
+        escalated = True
+        full_errors, coerced, _ = validate_column(
+            column,
+            expected_type if TYPE_ERROR in pending else None,
+            NULL_VALUES_ERROR in pending,
+            False,
+        )
+        errors += full_errors
+        pending.clear()
+
+    conclusive = not pending
+    confidence = ColumnConfidence(
+        rows=len(column),
+        sampled=len(positions),
+        escalated=escalated,
+        conclusive=conclusive,
+        max_error_rate=0.0 if conclusive else max_error_rate(len(positions)),
+    )
+    return sorted(errors, key=ERROR_ORDER.index), coerced, None, confidence
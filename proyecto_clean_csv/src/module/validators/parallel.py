@@ -0,0 +1,58 @@
+import atexit
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cache
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+THREAD_EXECUTOR = "thread"
+PROCESS_EXECUTOR = "process"
+
+
+def map_columns(
+    func: Callable[..., T], tasks: Sequence[tuple], config: dict[str, Any]
+) -> list[T]:
+    """
+    Aplica func a cada tarea (una por columna) en serie o en un pool, según la configuración
+    "validations.parallel":
+
+        - enabled (bool): activa la validación en paralelo.
+        - executor (str): "thread" o "process".
+        - max_workers (int | null): número de workers; por defecto, los núcleos disponibles.
+
+    Los resultados se devuelven siempre en el orden de las tareas, de modo que el informe de
+    errores es el mismo que en serie. Con "process" func y sus argumentos deben poder
+    serializarse (funciones de módulo y Series).
+
+    :param func: Función que valida una columna.
+    :type func: Callable[..., T]
+    :param tasks: Argumentos de func para cada columna.
+    :type tasks: Sequence[tuple]
+    :param config: Configuración cargada del config.json.
+    :type config: dict[str, Any]
+    :return: Resultado de func para cada tarea, en el mismo orden.
+    :rtype: list[T]
+    """
+    parallel = config.get("validations", {}).get("parallel", {})
+
+    if not parallel.get("enabled", False) or len(tasks) < 2:
+        return [func(*task) for task in tasks]
+
+    kind = parallel.get("executor", THREAD_EXECUTOR)
+    if kind not in (THREAD_EXECUTOR, PROCESS_EXECUTOR):
+        raise ValueError(f"Executor de validación no soportado: {kind}")
+
+    workers = parallel.get("max_workers") or os.cpu_count() or 1
+    executor = _executor(kind, min(workers, len(tasks)))
+    return list(executor.map(func, *zip(*tasks, strict=True)))
+
+
+@cache
+def _executor(kind: str, workers: int) -> Executor:
+    """Pool reutilizado entre llamadas (p. ej. entre chunks) y cerrado al salir."""
+    executor_class = ProcessPoolExecutor if kind == PROCESS_EXECUTOR else ThreadPoolExecutor
+    executor = executor_class(max_workers=workers)
+    atexit.register(executor.shutdown)
+    return executor
@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from module.data_models.schema import DUPLICATED_VALUES_ERROR, NULL_VALUES_ERROR, TYPE_ERROR
+
+RANDOM_SAMPLING = "random"
+STRATIFIED_SAMPLING = "stratified"
+
+DEFAULT_SAMPLE_SIZE = 100_000
+# Tramos consecutivos del archivo en el muestreo estratificado
+STRATA = 100
+# Nivel de confianza de la cota del porcentaje de errores no detectados
+CONFIDENCE_LEVEL = 0.95
+
+# Orden de los errores en el informe, el mismo que en la validación completa
+ERROR_ORDER = [NULL_VALUES_ERROR, DUPLICATED_VALUES_ERROR, TYPE_ERROR]
+
+
+@dataclass(frozen=True)
+class ColumnConfidence:
+    """
+    Fiabilidad del informe de una columna validada por muestreo.
+
+        - rows: filas de la columna.
+        - sampled: filas de la muestra.
+        - escalated: si alguna comprobación se repitió sobre la columna completa.
+        - conclusive: si el informe es exacto. Lo es cuando cada comprobación encontró el
+          error en la muestra o se repitió sobre la columna completa.
+        - max_error_rate: si no es concluyente, proporción máxima de filas con errores no
+          detectados (con un nivel de confianza CONFIDENCE_LEVEL); 0 si es concluyente.
+    """
+
+    rows: int
+    sampled: int
+    escalated: bool
+    conclusive: bool
+    max_error_rate: float
+
+
+def sample_positions(rows: int, sampling: dict[str, Any]) -> np.ndarray | None:
+    """
+    Posiciones de las filas que se validan según la sección "validations.sampling".
+
+        - random: filas al azar de todo el DataFrame.
+        - stratified: el mismo número de filas al azar de cada uno de STRATA tramos
+          consecutivos, de modo que la muestra cubre todo el archivo aunque los errores
+          estén concentrados en una parte.
+
+    :param rows: Filas del DataFrame.
+    :type rows: int
+    :param sampling: Configuración del muestreo (size, method, seed).
+    :type sampling: dict[str, Any]
+    :raises ValueError: Si el método de muestreo no existe.
+    :return: Posiciones ordenadas, o None si el DataFrame no es mayor que la muestra.
+    :rtype: np.ndarray | None
+    """
+    size = sampling.get("size") or DEFAULT_SAMPLE_SIZE
+    if rows <= size:
+        return None
+
+    method = sampling.get("method", RANDOM_SAMPLING)
+    rng = np.random.default_rng(sampling.get("seed"))
+    if method == RANDOM_SAMPLING:
+        return np.sort(rng.choice(rows, size, replace=False))
+    if method == STRATIFIED_SAMPLING:
+        bounds = np.linspace(0, rows, min(STRATA, size) + 1).astype(np.int64)
+        per_stratum = size // (len(bounds) - 1)
+        return np.concatenate([
+            start + np.sort(rng.choice(end - start, min(per_stratum, end - start), replace=False))
+            for start, end in zip(bounds[:-1], bounds[1:])
+        ]).astype(np.int64)
+    raise ValueError(
+        f"Unknown sampling method '{method}', expected one of "
+        f"{[RANDOM_SAMPLING, STRATIFIED_SAMPLING]}"
+    )
+
+
+def max_error_rate(sampled: int, level: float = CONFIDENCE_LEVEL) -> float:
+    """
+    Proporción máxima de filas con errores compatible con no haber encontrado ninguno en
+    una muestra de sampled filas: p tal que (1 - p) ** sampled = 1 - level (≈ 3 / sampled
+    con un 95 %).
+
+    :param sampled: Filas de la muestra sin errores.
+    :type sampled: int
+    :param level: Nivel de confianza.
+    :type level: float
+    :return: Cota superior de la proporción de filas con errores.
+    :rtype: float
+    """
+    return float(1 - (1 - level) ** (1 / sampled))
@@ -2,6 +2,7 @@ from typing import Any
 
 import pandas as pd
 
+from module.data_models.coercion import coerce_column
 from module.data_models.schema import (
     COLUMN_TYPES,
     DUPLICATED_VALUES_ERROR,
@@ -11,6 +12,7 @@ from module.data_models.schema import (
 )
 
 from .base_validator import Validator
+from .parallel import map_columns
 
 
 class NullValidator(Validator):
@@ -32,8 +34,11 @@ class NullValidator(Validator):
 
         errors: dict[str, list[str]] = {}
 
-        for col in df.columns:
-            if df[col].isnull().any():
+        columns = list(df.columns)
+        has_nulls = map_columns(_has_nulls, [(df[col],) for col in columns], config)
+
+        for col, flag in zip(columns, has_nulls, strict=True):
+            if flag:
                 errors.setdefault(col, []).append(NULL_VALUES_ERROR)
 
         return errors
@@ -89,22 +94,34 @@ class TypeValidator(Validator):
 
         errors: dict[str, list[str]] = {}
 
-        for col, expected_type in self._types.items():
+        columns = [
+            (col, expected_type) for col, expected_type in self._types.items()
+            if col in df.columns
+        ]
+        has_errors = map_columns(
+            _has_type_errors,
+            [(df[col], expected_type) for col, expected_type in columns],
+            config,
+        )
 
-            if col not in df.columns:
-                continue
+        for (col, _), flag in zip(columns, has_errors, strict=True):
+            if flag:
+                errors.setdefault(col, []).append(TYPE_ERROR)
 
-            original = df[col]
+        return errors
 
-            if expected_type in ["int", "float"]:
-                converted = pd.to_numeric(original, errors="coerce")
-                if converted.isna().sum() > original.isna().sum():
-                    errors.setdefault(col, []).append(TYPE_ERROR)
 
-            elif expected_type == "datetime":
-                original: pd.Series = df[col]
-                converted = pd.to_datetime(original, errors="coerce")
-                if converted.isna().sum() > original.isna().sum():
-                    errors.setdefault(col, []).append(TYPE_ERROR)
+def _has_nulls(column: pd.Series) -> bool:
+    return bool(column.isnull().any())
 
-        return errors
+
+def _has_type_errors(original: pd.Series, expected_type: str) -> bool:
+    """Indica si la conversión al tipo esperado genera nulos que no existían."""
+    if expected_type in ["int", "float"]:
+        converted = pd.to_numeric(original, errors="coerce")
+    elif expected_type == "datetime":
+        converted = coerce_column(original, "datetime")
+    else:
+        return False
+
+    return bool(converted.isna().sum() > original.isna().sum())
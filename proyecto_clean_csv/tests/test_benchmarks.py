@@ -0,0 +1,84 @@
+import pandas as pd
+import pytest
+from bench_pipeline import find_regressions, to_ratios
+from synthetic_data import generate_sales_csv, generate_sales_frame
+
+from module.data_models.schema import COLUMN_TYPES, TRANSACTION_ID
+
+
+def test_generate_sales_frame_uses_schema_columns():
+    df = generate_sales_frame(100, "cafe")
+
+    assert list(df.columns) == list(COLUMN_TYPES)
+    assert df[TRANSACTION_ID].is_unique
+    assert (df["Item"] != "").all()
+
+
+def test_generate_sales_frame_injects_rates():
+    rows = 50_000
+    df = generate_sales_frame(
+        rows, "cafe", null_rate=0.05, duplicate_rate=0.1, type_error_rate=0.02, seed=1
+    )
+
+    assert df[TRANSACTION_ID].duplicated().mean() == pytest.approx(0.1, abs=0.01)
+    assert (df["Payment Method"] == "").mean() == pytest.approx(0.05, abs=0.01)
+    assert (df[TRANSACTION_ID] == "").sum() == 0
+
+    errors = df.isin(["ERROR", "UNKNOWN"]).mean()
+    # Los errores de tipo solo van a las columnas no textuales del esquema
+    assert errors["Quantity"] == pytest.approx(0.02, abs=0.005)
+    assert errors["Transaction Date"] == pytest.approx(0.02, abs=0.005)
+    assert errors["Item"] == 0
+    assert errors["Location"] == 0
+
+
+def test_generate_sales_frame_rejects_invalid_arguments():
+    with pytest.raises(ValueError, match="Unknown profile"):
+        generate_sales_frame(10, "bakery")
+    with pytest.raises(ValueError, match="null_rate"):
+        generate_sales_frame(10, null_rate=1.5)
+
+
+def test_generate_sales_csv_writes_blocks(tmp_path):
+    path = generate_sales_csv(
+        tmp_path / "retail.csv", 2_500, "retail", duplicate_rate=0.2, seed=3, block_rows=1_000
+    )
+
+    df = pd.read_csv(path, dtype=str)
+    assert len(df) == 2_500
+    assert {"Customer ID", "Discount Applied"} <= set(df.columns)
+    # Los duplicados repiten IDs de bloques anteriores, no solo del bloque actual
+    ids = df[TRANSACTION_ID].str.removeprefix("TXN_").astype(int)
+    assert ids.max() < 2_500
+    assert ids.iloc[1_000:].lt(1_000).any()
+
+    again = generate_sales_csv(
+        tmp_path / "again.csv", 2_500, "retail", duplicate_rate=0.2, seed=3, block_rows=1_000
+    )
+    assert path.read_bytes() == again.read_bytes()
+
+
+def test_find_regressions():
+    # Proporciones respecto a la calibración; en esta ejecución la calibración dura 0.5 s
+    baseline = {"1000": {"read": 2.0, "clean": 0.002}}
+    results = {"1000": {"read": 1.3, "clean": 0.004, "new": 5.0}}
+
+    regressions = find_regressions(
+        results, baseline, calibration=0.5, tolerance=0.25, min_delta=0.005
+    )
+
+    # "clean" es 4 veces más lento pero por debajo de min_delta; "new" no tiene línea base
+    assert [(reg.name, reg.rows) for reg in regressions] == [("read", "1000")]
+    assert regressions[0].baseline == pytest.approx(1.0)
+    assert regressions[0].ratio == pytest.approx(1.3)
+    assert find_regressions(
+        results, baseline, calibration=0.5, tolerance=0.5, min_delta=0.005
+    ) == []
+    # En una máquina el doble de lenta la calibración también tarda el doble
+    assert find_regressions(
+        results, baseline, calibration=1.0, tolerance=0.25, min_delta=0.005
+    ) == []
+
+
+def test_to_ratios():
+    assert to_ratios({"1000": {"read": 0.3}}, calibration=0.2) == {"1000": {"read": 1.5}}
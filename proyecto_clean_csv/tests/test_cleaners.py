@@ -3,12 +3,18 @@ import pandas as pd
 import pytest
 
 from module.cleaners import (
+    GroupImputer,
+    ImputationRule,
     apply_schema_types,
     drop_null_rows,
     fill_null_values,
     impute_amounts,
+    null_mask,
     remove_duplicate_rows,
 )
+from module.cleaners.cleaner_dispatcher import DataCleanerDispatcher
+from module.data_models.error_index import ErrorIndex
+from module.validators import FusedValidator
 
 
 def test_remove_duplicate_rows_keep_first():
@@ -67,6 +73,87 @@ def test_drop_null_rows_specific_columns():
     assert df_clean["Critical_Col"].tolist() == ["A", "C", "D"]
 
 
+def test_drop_null_rows_only_checks_subset_for_sentinels():
+    df = pd.DataFrame(
+        {
+            "Critical_Col": ["A", "UNKNOWN", "C", "ERROR", None],
+            "Optional_Col": ["UNKNOWN", "Y", "ERROR", "W", "V"],
+            "Number": [1.0, 2.0, None, 4.0, 5.0],
+        }
+    )
+
+    df_clean = drop_null_rows(df, columns=["Critical_Col"])
+
+    assert df_clean["Critical_Col"].tolist() == ["A", "C"]
+    # Los centinelas del resto de columnas de texto no eliminan filas, pero pasan a ser nulos
+    assert df_clean["Optional_Col"].isna().tolist() == [True, True]
+    assert df_clean["Number"].isna().tolist() == [False, True]
+    assert df_clean.index.tolist() == [0, 1]
+
+
+def test_drop_null_rows_nullifies_sentinels_with_error_index():
+    df = pd.DataFrame(
+        {
+            "Critical_Col": ["A", None, "C", "D"],
+            "Optional_Col": ["ERROR", "Y", "Z", "UNKNOWN"],
+        }
+    )
+    error_index = ErrorIndex(len(df))
+    error_index.add("Optional_Col", {"NULL_VALUES": np.array([], int), "SENTINEL_VALUES": [0, 3]})
+
+    df_clean = drop_null_rows(df, columns=["Critical_Col"], error_index=error_index)
+
+    assert df_clean["Optional_Col"].isna().tolist() == [True, False, True]
+
+
+def test_drop_null_rows_custom_sentinels():
+    df = pd.DataFrame({"Critical_Col": ["A", "N/A", "UNKNOWN"]})
+
+    df_clean = drop_null_rows(df, columns=["Critical_Col"], sentinels=["N/A"])
+
+    assert df_clean["Critical_Col"].tolist() == ["A", "UNKNOWN"]
+
+
+def test_null_mask_ignores_sentinels_in_numeric_columns():
+    df = pd.DataFrame(
+        {
+            "Text": ["A", "ERROR", "C"],
+            "Number": pd.array([1.0, 2.0, None], dtype="Float64"),
+        }
+    )
+
+    assert null_mask(df, ["Text", "Number"]).tolist() == [False, True, True]
+
+
+def test_fill_null_values_replaces_sentinels():
+    df = pd.DataFrame({"Category": ["Food", None, "ERROR"], "Other": ["ERROR", None, "x"]})
+
+    df_clean = fill_null_values(
+        df, columns=["Category"], fill_value="NO_PROPORCIONADO", sentinels=["ERROR"]
+    )
+
+    assert df_clean["Category"].tolist() == ["Food", "NO_PROPORCIONADO", "NO_PROPORCIONADO"]
+    assert df_clean["Other"].tolist()[0] == "ERROR"
+
+
+def test_null_handling_on_categorical_columns():
+    df = pd.DataFrame(
+        {
+            "Critical_Col": pd.Categorical(["A", "UNKNOWN", "C", None]),
+            "Payment": pd.Categorical(["Cash", None, "ERROR", "Card"]),
+        }
+    )
+
+    df_clean = drop_null_rows(df, columns=["Critical_Col"])
+    df_clean = fill_null_values(
+        df_clean, columns=["Payment"], fill_value="NO_PROPORCIONADO", sentinels=["ERROR"]
+    )
+
+    assert df_clean["Critical_Col"].tolist() == ["A", "C"]
+    assert df_clean["Payment"].tolist() == ["Cash", "NO_PROPORCIONADO"]
+    assert isinstance(df_clean["Payment"].dtype, pd.CategoricalDtype)
+
+
 def test_apply_schema_types():
     df = pd.DataFrame(
         {
@@ -123,3 +210,233 @@ def test_impute_amounts_calculations(
     assert df_clean["Quantity"][0] == expected_quantity
     assert df_clean["Price Per Unit"][0] == expected_price
     assert df_clean["Total Spent"][0] == expected_total
+
+
+def test_impute_amounts_counts_recovered_values_and_keeps_dtypes():
+    df = pd.DataFrame(
+        {
+            "Quantity": pd.array([2, None, None, 0, None], dtype="Int64"),
+            "Price Per Unit": pd.array([1.5, 2.0, 2.0, 3.0, 0.0], dtype="Float64"),
+            "Total Spent": [np.nan, 6.0, 7.0, 3.0, 5.0],
+        }
+    )
+    recovered = {}
+
+    df_clean = impute_amounts(df, recovered=recovered)
+
+    # 7 / 2 no es una cantidad entera y 5 / 0 no se puede calcular: quedan nulos
+    assert df_clean["Quantity"].tolist() == [2, 3, pd.NA, pd.NA, pd.NA]
+    assert df_clean["Price Per Unit"].isna().tolist() == [False, False, False, False, True]
+    assert df_clean["Total Spent"].tolist() == [3.0, 6.0, 7.0, 3.0, 5.0]
+    assert df_clean.dtypes.tolist() == ["Int64", "Float64", "Float64"]
+    assert recovered == {"Quantity": 1, "Price Per Unit": 0, "Total Spent": 1}
+    assert df["Total Spent"].isna().sum() == 1
+
+
+def test_apply_schema_types_reuses_coerced_columns():
+    df = pd.DataFrame({"Int_Col": ["10", "invalid_int"], "Other": ["a", "b"]})
+    cached = pd.Series([99, None], dtype="Int64")
+
+    df_clean = apply_schema_types(
+        df, {"Int_Col": "Int64"}, {"Int_Col": ["TYPE_ERROR"]}, coerced={"Int_Col": cached}
+    )
+
+    assert df_clean["Int_Col"].tolist()[0] == 99
+
+
+def test_apply_schema_types_raises_on_unconvertible_custom_dtype():
+    df = pd.DataFrame({"Int_Col": ["10", "invalid_int"]})
+
+    with pytest.raises(ValueError):
+        apply_schema_types(df, {"Int_Col": "int64"}, {"Int_Col": ["TYPE_ERROR"]})
+
+
+def test_apply_schema_types_ignores_misaligned_coerced_columns():
+    df = pd.DataFrame({"Int_Col": ["10", "20"]}, index=[3, 4])
+    cached = pd.Series([99, 98], dtype="Int64")
+
+    df_clean = apply_schema_types(
+        df, {"Int_Col": "Int64"}, {"Int_Col": ["TYPE_ERROR"]}, coerced={"Int_Col": cached}
+    )
+
+    assert df_clean["Int_Col"].tolist() == [10, 20]
+
+
+@pytest.mark.parametrize(
+    "cleaner, kwargs",
+    [
+        (remove_duplicate_rows, {"columns": ["Transaction ID"]}),
+        (drop_null_rows, {"columns": ["Quantity"]}),
+        (fill_null_values, {"columns": ["Quantity"], "fill_value": 0}),
+        (impute_amounts, {}),
+    ],
+)
+def test_cleaners_inplace_mutate_the_given_frame(cleaner, kwargs):
+    df = pd.DataFrame(
+        {
+            "Transaction ID": ["1", "1", "2"],
+            "Quantity": [2.0, np.nan, np.nan],
+            "Price Per Unit": [1.5, 2.0, 3.0],
+            "Total Spent": [3.0, 4.0, 6.0],
+        }
+    )
+    expected = cleaner(df.copy(), **kwargs)
+
+    result = cleaner(df, inplace=True, **kwargs)
+
+    assert result is df
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_dispatcher_inplace_matches_copying_clean():
+    config = {
+        "duplicates": {"apply": True, "keep": "first"},
+        "types": {"apply": True},
+        "imputation": {"apply_amounts": True},
+        "nulls": {"apply": True, "columns": ["Location"], "fill_value": "UNKNOWN"},
+    }
+    df = pd.DataFrame(
+        {
+            "Transaction ID": ["TXN_1", "TXN_1", "TXN_2", "TXN_3"],
+            "Item": ["Coffee", "Coffee", "Tea", None],
+            "Quantity": ["2", "2", None, "1"],
+            "Price Per Unit": ["1.5", "1.5", "2.0", "3.0"],
+            "Total Spent": ["3.0", "3.0", "4.0", "3.0"],
+            "Location": ["In-store", "In-store", None, "Takeaway"],
+        }
+    )
+    report = {
+        "Transaction ID": ["DUPLICATED_VALUES"],
+        "Item": ["NULL_VALUES"],
+        "Quantity": ["NULL_VALUES", "TYPE_ERROR"],
+        "Price Per Unit": ["TYPE_ERROR"],
+        "Total Spent": ["TYPE_ERROR"],
+        "Location": ["NULL_VALUES"],
+    }
+    original = df.copy()
+    dispatcher = DataCleanerDispatcher(config)
+
+    copied = dispatcher.clean(df, report)
+    pd.testing.assert_frame_equal(df, original)
+
+    owned = dispatcher.clean(df, report, inplace=True)
+
+    assert owned is df
+    pd.testing.assert_frame_equal(owned, copied)
+    assert owned["Transaction ID"].tolist() == ["TXN_1", "TXN_2"]
+
+
+# Índice de errores
+def test_error_index_drop_shifts_positions():
+    index = ErrorIndex(6)
+    index.add("a", {"NULL_VALUES": np.array([0, 2, 5]), "SENTINEL_VALUES": np.array([], int)})
+
+    index.drop(np.array([1, 2]))
+
+    assert index.get("a", "NULL_VALUES").tolist() == [0, 3]
+    assert index.aligned(4)
+    assert index.covers("a", ["NULL_VALUES", "SENTINEL_VALUES"])
+    assert not index.covers("a", ["DUPLICATED_VALUES"])
+
+
+@pytest.mark.parametrize("keep", ["first", "last", False])
+def test_dispatcher_with_error_index_matches_full_scan(keep):
+    config = {
+        "duplicates": {"apply": True, "keep": keep},
+        "types": {"apply": True},
+        "imputation": {"apply_amounts": True},
+        "nulls": {"apply": True, "columns": ["Location"], "fill_value": "UNKNOWN"},
+        "validations": {
+            "validate_nulls": True, "validate_duplicates": True, "validate_types": True
+        },
+    }
+    df = pd.DataFrame(
+        {
+            "Transaction ID": ["TXN_1", "TXN_2", "TXN_1", "TXN_3", "TXN_4", "TXN_2"],
+            "Item": ["Coffee", "ERROR", "Coffee", "Tea", None, "Cake"],
+            "Quantity": ["2", "2", "2", "x", "1", "3"],
+            "Price Per Unit": ["1.5", "1.5", "1.5", "2.0", "ERROR", "1.0"],
+            "Total Spent": ["3.0", "3.0", "3.0", "4.0", "3.0", "ERROR"],
+            "Location": ["In-store", "UNKNOWN", None, "Takeaway", "In-store", None],
+        }
+    )
+    validator = FusedValidator()
+    report = validator.validate(df, config)
+    dispatcher = DataCleanerDispatcher(config)
+
+    expected = dispatcher.clean(df, report, validator.coerced)
+    result = dispatcher.clean(df, report, validator.coerced, error_index=validator.error_index)
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert validator.error_index.aligned(len(result))
+
+
+# Imputación por grupos
+@pytest.fixture
+def group_rules():
+    return [
+        ImputationRule.from_config(
+            {"column": "Price Per Unit", "by": "Item", "statistic": "median"}
+        ),
+        ImputationRule.from_config(
+            {"column": "Payment Method", "by": ["Item", "Location"], "statistic": "mode"}
+        ),
+    ]
+
+
+@pytest.fixture
+def group_df():
+    return pd.DataFrame(
+        {
+            "Item": ["Tea", "Tea", "Tea", "Tea", "Cake", "Cake", None, "Juice"],
+            "Location": ["A", "A", "A", "A", "A", "A", "A", "A"],
+            "Price Per Unit": pd.array(
+                [1.0, 3.0, 4.0, None, 2.0, None, None, None], dtype="Float64"
+            ),
+            "Payment Method": pd.Series(
+                ["Cash", "Card", "Card", "UNKNOWN", "ERROR", None, None, None],
+                dtype="category",
+            ),
+        }
+    )
+
+
+def test_group_imputer_fills_from_group_statistics(group_rules, group_df):
+    recovered = {}
+
+    result = GroupImputer(group_rules).fit(group_df).apply(group_df, recovered=recovered)
+
+    assert result["Price Per Unit"].tolist()[:6] == [1.0, 3.0, 4.0, 3.0, 2.0, 2.0]
+    # Los centinelas no cuentan como valores: Cake no tiene moda y se queda como estaba
+    assert result["Payment Method"].tolist()[3:5] == ["Card", "ERROR"]
+    assert pd.isna(result["Payment Method"][5])
+    # Sin Item o sin valores conocidos en el grupo no se imputa nada
+    assert result["Price Per Unit"].isna().tolist()[6:] == [True, True]
+    assert recovered == {"Price Per Unit": 2, "Payment Method": 1}
+    assert group_df["Price Per Unit"].isna().sum() == 4
+
+
+def test_group_imputer_fit_by_chunks_matches_full_fit(group_rules, group_df):
+    full = GroupImputer(group_rules).fit(group_df)
+    chunked = GroupImputer(group_rules)
+    for start in range(0, len(group_df), 3):
+        chunked.fit(group_df.iloc[start:start + 3])
+
+    for rule in group_rules:
+        pd.testing.assert_series_equal(chunked.statistics(rule), full.statistics(rule))
+
+
+@pytest.mark.parametrize(
+    "rule, message",
+    [
+        ({"column": "Price Per Unit", "statistic": "median"}, "necesita 'column' y 'by'"),
+        (
+            {"column": "Price Per Unit", "by": "Item", "statistic": "mean"},
+            "Estadístico de imputación desconocido 'mean'",
+        ),
+        ({"column": "Item", "by": "Item"}, "agrupa 'Item' por sí misma"),
+    ],
+)
+def test_imputation_rule_rejects_invalid_config(rule, message):
+    with pytest.raises(ValueError, match=message):
+        ImputationRule.from_config(rule)
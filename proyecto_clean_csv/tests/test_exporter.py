@@ -1,8 +1,10 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
+import pytest
 
-from module.reports import csv_exporter
+from module.reports import CSVExporter, ParquetExporter, csv_exporter, get_exporter
+from module.reports.exporters import ArrowExporter
 
 
 def test_csv_exporter(tmp_path):
@@ -39,3 +41,121 @@ def test_csv_exporter_directory_already_exists(tmp_path):
     csv_exporter(mock_orchestrator, df_input)
 
     assert (generated_dir / "overlap_clean.csv").exists()
+
+
+def _chunks() -> list[pd.DataFrame]:
+    return [
+        pd.DataFrame({
+            "Item": pd.Categorical(["Tea", "Cake"]),
+            "Quantity": pd.array([1, None], dtype="Int64"),
+            "Total Spent": pd.array([1.5, 3.0], dtype="Float64"),
+            "Transaction Date": pd.to_datetime(["2023-01-02", None]),
+        }),
+        pd.DataFrame({
+            "Item": pd.Categorical(["Salad", "Tea", "Coffee"]),
+            "Quantity": pd.array([2, 3, 4], dtype="Int64"),
+            "Total Spent": pd.array([10.0, None, 8.0], dtype="Float64"),
+            "Transaction Date": pd.to_datetime(["2023-03-04", "2023-05-06", "2023-07-08"]),
+        }),
+    ]
+
+
+def test_csv_exporter_appends_chunks(tmp_path):
+    with CSVExporter(tmp_path / "out.csv") as exporter:
+        for chunk in _chunks():
+            exporter.write(chunk)
+
+    df = pd.read_csv(tmp_path / "out.csv")
+    assert df["Item"].tolist() == ["Tea", "Cake", "Salad", "Tea", "Coffee"]
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "feather"])
+def test_arrow_exporters_keep_types_across_chunks(tmp_path, fmt):
+    pytest.importorskip("pyarrow")
+
+    with get_exporter(tmp_path, "ventas", {"export": {"format": fmt}}) as exporter:
+        for chunk in _chunks():
+            exporter.write(chunk)
+
+    assert exporter.path == tmp_path / f"ventas_clean.{fmt}"
+    df = getattr(pd, f"read_{fmt}")(exporter.path)
+
+    assert df["Quantity"].dtype == "Int64"
+    assert df["Total Spent"].dtype == "Float64"
+    assert pd.api.types.is_datetime64_any_dtype(df["Transaction Date"])
+    assert isinstance(df["Item"].dtype, pd.CategoricalDtype)
+    # Las categorías del segundo chunk se añaden a las del primero
+    assert df["Item"].cat.categories.tolist() == ["Cake", "Tea", "Coffee", "Salad"]
+    assert df["Item"].tolist() == ["Tea", "Cake", "Salad", "Tea", "Coffee"]
+    assert df["Quantity"].isna().tolist() == [False, True, False, False, False]
+
+
+def test_parquet_exporter_row_groups(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    exporter = get_exporter(
+        tmp_path, "ventas", {"export": {"format": "parquet", "row_group_size": 2}}
+    )
+    with exporter:
+        for chunk in _chunks():
+            exporter.write(chunk)
+
+    # Cada escritura genera sus propios row groups, de como máximo row_group_size filas
+    assert pq.ParquetFile(exporter.path).metadata.num_row_groups == 3
+
+
+def test_arrow_exporter_rejects_incompatible_chunk(tmp_path):
+    pytest.importorskip("pyarrow")
+
+    with ParquetExporter(tmp_path / "out.parquet") as exporter:
+        exporter.write(pd.DataFrame({"Quantity": pd.array([1], dtype="Int64")}))
+        with pytest.raises(ValueError, match="esquema"):
+            exporter.write(pd.DataFrame({"Quantity": ["ERROR"]}))
+
+
+def test_arrow_exporter_is_abstract(tmp_path):
+    with pytest.raises(TypeError):
+        ArrowExporter(tmp_path / "out.arrow")
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+def test_exporter_replaces_previous_output_without_writing(tmp_path, fmt):
+    if fmt == "parquet":
+        pytest.importorskip("pyarrow")
+    config = {"export": {"format": fmt}}
+    with get_exporter(tmp_path, "ventas", config) as exporter:
+        exporter.write(_chunks()[0])
+
+    with get_exporter(tmp_path, "ventas", config):
+        pass
+
+    assert not exporter.path.exists() or exporter.path.stat().st_size == 0
+
+
+def test_get_exporter_validates_format(tmp_path):
+    assert isinstance(get_exporter(tmp_path, "ventas", {}), CSVExporter)
+
+    with pytest.raises(ValueError, match="Formato de exportación desconocido"):
+        get_exporter(tmp_path, "ventas", {"export": {"format": "xlsx"}})
+
+    with patch("module.reports.exporters.find_spec", return_value=None):
+        with pytest.raises(ImportError, match="pyarrow"):
+            get_exporter(tmp_path, "ventas", {"export": {"format": "parquet"}})
+
+
+@pytest.mark.parametrize("compression, suffix", [("gzip", ".gz"), ("bz2", ".bz2"), ("xz", ".xz")])
+def test_csv_exporter_compressed(tmp_path, compression, suffix):
+    config = {"export": {"format": "csv", "compression": compression}}
+
+    with get_exporter(tmp_path, "ventas", config) as exporter:
+        for chunk in _chunks():
+            exporter.write(chunk)
+
+    assert exporter.path == tmp_path / f"ventas_clean.csv{suffix}"
+    df = pd.read_csv(exporter.path)
+    assert df["Item"].tolist() == ["Tea", "Cake", "Salad", "Tea", "Coffee"]
+
+
+def test_get_exporter_rejects_zip_csv(tmp_path):
+    with pytest.raises(ValueError, match="Compresión de CSV desconocida"):
+        get_exporter(tmp_path, "ventas", {"export": {"format": "csv", "compression": "zip"}})
@@ -0,0 +1,162 @@
+import json
+import logging
+
+import pandas as pd
+import pytest
+
+from module.cleaners import apply_schema_types, drop_null_rows
+from module.pipelines import DataPipelineOrchestrator
+from module.reports import MetricsCollector, metrics
+from module.reports.decorators import logger as decorators_logger
+from module.reports.profiler import FUNCTION, StageProfiler
+
+
+@pytest.fixture
+def collector():
+    metrics.reset()
+    metrics.enabled = True
+    yield metrics
+    metrics.reset()
+    metrics.enabled = False
+
+
+def test_collector_ignores_records_when_disabled():
+    collector = MetricsCollector()
+
+    collector.record("func", 1.0, rows_in=10, rows_out=5)
+
+    assert collector.to_dict() == {}
+
+
+def test_collector_aggregates_calls(tmp_path):
+    collector = MetricsCollector(enabled=True)
+
+    collector.record("func", 1.0, rows_in=10, rows_out=8, memory_delta=-100)
+    collector.record("func", 0.5, rows_in=8, rows_out=8, dtype_changes={"a": ("str", "Int64")})
+
+    data = collector.to_dict()["func"]
+    assert data["calls"] == 2
+    assert data["seconds"] == 1.5
+    assert (data["rows_in"], data["rows_out"], data["memory_delta"]) == (18, 16, -100)
+    assert data["dtype_changes"] == {"a": ["str", "Int64"]}
+
+    path = collector.export_json(tmp_path / "out" / "metrics.json")
+    assert json.loads(path.read_text(encoding="utf-8")) == collector.to_dict()
+
+
+def test_decorators_record_metrics_without_logging(collector, caplog):
+    df = pd.DataFrame({"A": ["1", None, "3"], "B": ["x", "y", "z"]})
+
+    with caplog.at_level(logging.WARNING, logger=decorators_logger.name):
+        df = drop_null_rows(df, columns=["A"])
+        apply_schema_types(df, {"A": "int"}, {"A": ["TYPE_ERROR"]})
+
+    assert caplog.records == []
+    data = collector.to_dict()
+    assert data["drop_null_rows"]["rows_in"] == 3
+    assert data["drop_null_rows"]["rows_out"] == 2
+    assert data["apply_schema_types"]["dtype_changes"]["A"][1] == "Int64"
+    assert "B" not in data["apply_schema_types"]["dtype_changes"]
+
+
+def test_dtype_changes_logged_in_one_line(caplog):
+    df = pd.DataFrame({"A": ["1", "2"], "B": ["x", "y"]})
+
+    with caplog.at_level(logging.INFO, logger=decorators_logger.name):
+        apply_schema_types(df, {"A": "int"}, {"A": ["TYPE_ERROR"]})
+
+    lines = [r.getMessage() for r in caplog.records if "Cambios de tipos" in r.getMessage()]
+    assert len(lines) == 1
+    assert "'A'" in lines[0] and "'B'" not in lines[0]
+
+
+def test_orchestrator_exports_metrics(tmp_path):
+    csv_path = tmp_path / "ventas.csv"
+    csv_path.write_text(
+        "Transaction ID,Item,Quantity,Price Per Unit,Total Spent,Payment Method,Location,"
+        "Transaction Date\n"
+        "TXN_1,Coffee,2,2.0,4.0,Cash,In-store,2023-09-08\n"
+        "TXN_2,Cake,,3.0,12.0,Card,Takeaway,2023-05-16\n",
+        encoding="utf-8",
+    )
+    config = {
+        "execution": {"mode": "chunked", "chunk_size": 1},
+        "validations": {"validate_nulls": True, "validate_types": True},
+        "types": {"apply": True},
+        "imputation": {"apply_amounts": True},
+        "metrics": {"enabled": True},
+    }
+
+    try:
+        DataPipelineOrchestrator(csv_path, config, tmp_path).run()
+    finally:
+        metrics.enabled = False
+
+    data = json.loads((tmp_path / "generated" / "ventas_metrics.json").read_text("utf-8"))
+    assert data["impute_amounts"]["calls"] == 2
+    assert data["impute_amounts"]["counts"] == {
+        "Quantity": 1, "Price Per Unit": 0, "Total Spent": 0
+    }
+    assert data["transform:weekday"]["rows_out"] == 2
+
+
+def test_profiler_measures_nested_stages():
+    profiler = StageProfiler()
+    profiler.start()
+    try:
+        with profiler.stage("outer") as outer:
+            outer.rows = 1000
+            with profiler.stage("inner", FUNCTION) as inner:
+                inner.rows = 1000
+                data = [0] * 1_000_000
+            del data
+    finally:
+        profiler.stop()
+
+    stats = profiler.to_dict()
+    assert list(stats) == ["outer", "inner"]
+    assert stats["inner"]["kind"] == FUNCTION
+    assert stats["inner"]["tracemalloc_peak_mb"] > 5
+    assert stats["outer"]["tracemalloc_peak_mb"] >= stats["inner"]["tracemalloc_peak_mb"]
+    assert stats["outer"]["wall_seconds"] >= stats["inner"]["wall_seconds"]
+    assert stats["outer"]["rows_per_second"] > 0
+    assert "inner" in profiler.table()
+
+
+def test_profiler_disabled_records_nothing():
+    profiler = StageProfiler()
+
+    with profiler.stage("stage") as stage:
+        stage.rows = 10
+
+    assert profiler.to_dict() == {}
+
+
+@pytest.mark.parametrize("mode", ["memory", "chunked"])
+def test_orchestrator_profile_report(tmp_path, mode):
+    csv_path = tmp_path / "ventas.csv"
+    csv_path.write_text(
+        "Transaction ID,Item,Quantity,Price Per Unit,Total Spent,Payment Method,Location,"
+        "Transaction Date\n"
+        "TXN_1,Coffee,2,2.0,4.0,Cash,In-store,2023-09-08\n"
+        "TXN_2,Cake,ERROR,3.0,12.0,Card,Takeaway,ERROR\n",
+        encoding="utf-8",
+    )
+    config = {
+        "execution": {"mode": mode, "chunk_size": 1},
+        "validations": {"validate_nulls": True, "validate_types": True},
+        "types": {"apply": True},
+        "imputation": {"apply_amounts": True},
+    }
+
+    DataPipelineOrchestrator(csv_path, config, tmp_path, profile=True).run()
+
+    report = json.loads((tmp_path / "generated" / "ventas_profile.json").read_text("utf-8"))
+    stages = report["stages"]
+    assert report["mode"] == mode
+    assert report["rows_in"] == 2
+    for stage in ("_read_file", "_validacion", "_limpieza", "_transformacion",
+                  "exporter", "_generate_plots", "impute_amounts", "transform:weekday"):
+        assert stage in stages
+    assert stages["_read_file"]["rows"] == 2
+    assert (tmp_path / "generated" / "ventas_profile.txt").exists()
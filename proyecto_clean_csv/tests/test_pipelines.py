@@ -0,0 +1,599 @@
+import gzip
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from module.pipelines import DataPipelineOrchestrator, run_batch
+from module.pipelines.duplicate_index import DuplicateIndex
+from module.pipelines.result_cache import ResultCache
+from module.pipelines.state import DuplicateTracker, PlotCounter
+from module.read import ReadPlan
+from module.read.reader import ReaderCSVGenerator
+from module.validators.sampling import sample_positions
+
+CONFIG_PATH = Path(__file__).resolve().parents[1] / "src" / "module" / "data_models" / "config.json"
+EXAMPLE_CSV = Path(__file__).resolve().parents[1] / "examples" / "ventas_cafe.csv"
+
+
+@pytest.fixture
+def sales_csv(tmp_path: Path) -> Path:
+    file_path = tmp_path / "ventas.csv"
+    file_path.write_text(
+        "Transaction ID,Item,Quantity,Price Per Unit,Total Spent,Payment Method,Location,"
+        "Transaction Date\n"
+        "TXN_1,Coffee,2,2.0,4.0,Cash,In-store,2023-09-08\n"
+        "TXN_2,Cake,4,3.0,12.0,,Takeaway,2023-05-16\n"
+        "TXN_3,Cookie,ERROR,1.0,5.0,Cash,In-store,2023-07-19\n"
+        "TXN_2,Cake,1,3.0,3.0,Card,Takeaway,2023-05-17\n"
+        "TXN_4,UNKNOWN,1,2.0,2.0,Card,In-store,2023-01-02\n"
+        "TXN_5,Tea,3,,4.5,Cash,,2023-02-10\n"
+        "TXN_1,Coffee,1,2.0,2.0,Cash,In-store,ERROR\n"
+        "TXN_6,Salad,1,5.0,5.0,Card,In-store,2023-11-30\n"
+        "TXN_7,,,1.0,,Card,In-store,\n",
+        encoding="utf-8",
+    )
+    return file_path
+
+
+def _split(df: pd.DataFrame, size: int) -> list[pd.DataFrame]:
+    return [df.iloc[i:i + size] for i in range(0, len(df), size)]
+
+
+@pytest.mark.parametrize("keep", ["first", "last", False])
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 10])
+@pytest.mark.parametrize("max_memory_keys", [2_000_000, 2])
+def test_duplicate_tracker_matches_drop_duplicates(keep, chunk_size, max_memory_keys):
+    df = pd.DataFrame(
+        {
+            "Transaction ID": ["1", "2", "2", "3", "1", None, "4", None, "2"],
+            "Value": range(9),
+        }
+    )
+    chunks = _split(df, chunk_size)
+
+    tracker = DuplicateTracker.from_key_batches("Transaction ID", keep, chunks, max_memory_keys)
+    result = pd.concat([tracker.filter(chunk) for chunk in chunks], ignore_index=True)
+    tracker.close()
+
+    expected = df.drop_duplicates(subset=["Transaction ID"], keep=keep)
+    assert result["Value"].tolist() == expected["Value"].tolist()
+    assert tracker.removed == len(df) - len(expected)
+
+
+def test_duplicate_tracker_requires_counts_for_last():
+    with pytest.raises(ValueError):
+        DuplicateTracker("Transaction ID", keep="last")
+
+
+@pytest.mark.parametrize("max_memory_keys", [100, 3])
+def test_duplicate_index_counts_and_spills(max_memory_keys):
+    index = DuplicateIndex(max_memory_keys=max_memory_keys)
+    index.add(pd.Series(["TXN_1", "TXN_2", "TXN_1", None]))
+    index.add(pd.Series(["TXN_3", "TXN_1", "TXN_4", None]))
+
+    counts = index.counts(pd.Series(["TXN_1", "TXN_4", "TXN_9", None]))
+
+    assert counts.tolist() == [3, 1, 0, 2]
+    assert index.on_disk == (max_memory_keys == 3)
+    assert len(index) == 5
+    assert pd.concat(index.items(batch_size=2)).sum() == 8
+    index.close()
+
+
+def test_duplicate_index_persists_only_committed_runs(tmp_path):
+    path = tmp_path / "history.sqlite"
+    with DuplicateIndex(path) as index:
+        index.add(pd.Series(["TXN_1", "TXN_2"]))
+        index.commit()
+    with DuplicateIndex(path) as index:
+        # Ejecución fallida: se cierra sin commit()
+        index.add(pd.Series(["TXN_3"]))
+
+    with DuplicateIndex(path) as index:
+        assert index.contains(pd.Series(["TXN_1", "TXN_2", "TXN_3"])).tolist() == [
+            True, True, False
+        ]
+
+
+def test_duplicate_index_ignores_own_source(tmp_path):
+    path = tmp_path / "history.sqlite"
+    with DuplicateIndex(path, source="lunes") as index:
+        index.add(pd.Series(["TXN_1", "TXN_2"]))
+        index.commit()
+    with DuplicateIndex(path, source="martes") as index:
+        index.add(pd.Series(["TXN_2", "TXN_3"]))
+        index.commit()
+
+    with DuplicateIndex(path, source="martes") as index:
+        keys = pd.Series(["TXN_1", "TXN_2", "TXN_3"])
+        assert index.contains(keys).tolist() == [True, True, False]
+        index.clear_source()
+        assert len(index) == 2
+
+
+def test_duplicate_index_sources_do_not_lock_each_other(tmp_path):
+    path = tmp_path / "history.sqlite"
+    with (
+        patch("module.pipelines.duplicate_index.LOCK_TIMEOUT", 0.1),
+        DuplicateIndex(path, source="lunes") as lunes,
+        DuplicateIndex(path, source="martes") as martes,
+    ):
+        lunes.clear_source()
+        lunes.add(pd.Series(["TXN_1"]))
+        assert not lunes.contains(pd.Series(["TXN_2"])).any()
+
+        # "lunes" sigue en curso: "martes" puede borrar, consultar y confirmar
+        martes.clear_source()
+        martes.add(pd.Series(["TXN_1", "TXN_2"]))
+        assert not martes.contains(pd.Series(["TXN_1"])).any()
+        martes.commit()
+
+        assert lunes.contains(pd.Series(["TXN_2"])).tolist() == [True]
+        lunes.commit()
+
+    with DuplicateIndex(path, source="miercoles") as index:
+        assert index.counts(pd.Series(["TXN_1", "TXN_2"])).tolist() == [2, 1]
+
+
+@pytest.mark.parametrize("mode", ["memory", "chunked"])
+@pytest.mark.parametrize(
+    "keep, expected", [("first", ["TXN_8"]), ("last", ["TXN_2", "TXN_8"])]
+)
+def test_run_drops_transactions_from_previous_runs(sales_csv, tmp_path, mode, keep, expected):
+    redelivery = tmp_path / "entrega_2.csv"
+    redelivery.write_text(
+        "Transaction ID,Item,Quantity,Price Per Unit,Total Spent,Payment Method,Location,"
+        "Transaction Date\n"
+        "TXN_2,Cake,1,3.0,3.0,Card,Takeaway,2023-05-17\n"
+        "TXN_8,Tea,2,1.5,3.0,Cash,In-store,2023-06-01\n"
+        "TXN_9,,1,1.5,1.5,Cash,In-store,ERROR\n",
+        encoding="utf-8",
+    )
+    config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+    config["execution"] = {"mode": mode, "chunk_size": 2}
+    config["duplicates"].update(keep=keep, index_path="history/transactions.sqlite")
+
+    DataPipelineOrchestrator(sales_csv, config, tmp_path).run()
+    orchestrator = DataPipelineOrchestrator(redelivery, config, tmp_path)
+    orchestrator.run()
+    # Volver a procesar el mismo archivo no lo compara consigo mismo
+    orchestrator.run()
+
+    df = pd.read_csv(tmp_path / "generated" / "entrega_2_clean.csv")
+    assert df["Transaction ID"].tolist() == expected
+    assert orchestrator.redelivered == (1 if keep == "first" else 0)
+    with DuplicateIndex(tmp_path / "history" / "transactions.sqlite") as history:
+        assert history.contains(pd.Series(["TXN_7", "TXN_8", "TXN_10"])).tolist() == [
+            True, True, False
+        ]
+
+
+def _cache_config(tmp_path: Path, mode: str = "memory", keep: str = "last") -> dict:
+    config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+    config["execution"] = {"mode": mode, "chunk_size": 2}
+    config["duplicates"]["keep"] = keep
+    config["cache"] = {"enabled": True, "dir": str(tmp_path / "cache")}
+    return config
+
+
+@pytest.mark.parametrize("mode", ["memory", "chunked"])
+def test_run_without_rows_replaces_previous_outputs(sales_csv, tmp_path, mode):
+    config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+    config["execution"] = {"mode": mode, "chunk_size": 2}
+    config["duplicates"]["keep"] = False
+    generated = tmp_path / "generated"
+
+    DataPipelineOrchestrator(sales_csv, config, tmp_path).run()
+    assert (generated / "plots" / "ventas_Weekday_plot.png").exists()
+
+    # Todas las filas repiten el mismo "Transaction ID": keep=False las descarta todas
+    lines = sales_csv.read_text(encoding="utf-8").splitlines()
+    sales_csv.write_text(
+        "\n".join([lines[0]] + ["TXN_1" + line[line.index(","):] for line in lines[1:]]) + "\n",
+        encoding="utf-8",
+    )
+    DataPipelineOrchestrator(sales_csv, config, tmp_path).run()
+
+    df = pd.read_csv(generated / "ventas_clean.csv")
+    assert df.empty
+    assert {"Transaction ID", "Weekday", "Category"} <= set(df.columns)
+    assert not list((generated / "plots").glob("ventas_*_plot.png"))
+
+
+@pytest.mark.parametrize("mode", ["memory", "chunked"])
+def test_cached_run_restores_outputs_without_processing(sales_csv, tmp_path, mode):
+    config = _cache_config(tmp_path, mode)
+    first = DataPipelineOrchestrator(sales_csv, config, tmp_path / "run")
+    first.run()
+    output = tmp_path / "run" / "generated" / "ventas_clean.csv"
+    expected = output.read_text(encoding="utf-8")
+    output.unlink()
+
+    second = DataPipelineOrchestrator(sales_csv, config, tmp_path / "run")
+    with patch.object(DataPipelineOrchestrator, "_execute", side_effect=AssertionError):
+        second.run()
+
+    assert output.read_text(encoding="utf-8") == expected
+    assert (second.rows_in, second.rows_out) == (first.rows_in, first.rows_out)
+    assert first.errors["Transaction ID"] == ["DUPLICATED_VALUES"]
+    assert second.errors == first.errors
+
+
+@pytest.mark.parametrize("mode", ["memory", "chunked"])
+def test_cached_run_without_rows(sales_csv, tmp_path, mode):
+    config = _cache_config(tmp_path, mode, keep=False)
+    lines = sales_csv.read_text(encoding="utf-8").splitlines()
+    sales_csv.write_text(
+        "\n".join([lines[0]] + ["TXN_1" + line[line.index(","):] for line in lines[1:]]) + "\n",
+        encoding="utf-8",
+    )
+
+    DataPipelineOrchestrator(sales_csv, config, tmp_path / "run").run()
+    second = DataPipelineOrchestrator(sales_csv, config, tmp_path / "run")
+    with patch.object(DataPipelineOrchestrator, "_execute", side_effect=AssertionError):
+        second.run()
+
+    assert second.rows_out == 0
+    assert pd.read_csv(tmp_path / "run" / "generated" / "ventas_clean.csv").empty
+
+
+def test_cache_misses_when_config_changes(sales_csv, tmp_path):
+    config = _cache_config(tmp_path)
+    DataPipelineOrchestrator(sales_csv, config, tmp_path / "run").run()
+    config["duplicates"]["keep"] = "first"
+
+    with patch.object(
+        DataPipelineOrchestrator, "_execute", autospec=True,
+        side_effect=DataPipelineOrchestrator._execute,
+    ) as execute:
+        DataPipelineOrchestrator(sales_csv, config, tmp_path / "run").run()
+
+    assert execute.call_count == 1
+    assert len(list((tmp_path / "cache" / "entries").iterdir())) == 2
+
+
+@pytest.mark.parametrize("mode", ["memory", "chunked"])
+@pytest.mark.parametrize(
+    "keep, appended, incremental",
+    [
+        ("first", "TXN_1,Tea,2,1.5,3.0,Cash,In-store,2023-06-01\n", True),
+        ("last", "TXN_8,Tea,2,1.5,3.0,Cash,In-store,2023-06-01\n", True),
+        # Con keep='last' una transacción repetida cambia filas ya exportadas
+        ("last", "TXN_1,Tea,2,1.5,3.0,Cash,In-store,2023-06-01\n", False),
+    ],
+)
+def test_appended_rows_match_full_run(sales_csv, tmp_path, mode, keep, appended, incremental):
+    config = _cache_config(tmp_path, mode, keep)
+    DataPipelineOrchestrator(sales_csv, config, tmp_path / "run").run()
+    with sales_csv.open("a", encoding="utf-8") as file:
+        file.write(appended + "TXN_9,Cake,,3.0,6.0,Card,Takeaway,2023-12-24\n")
+
+    orchestrator = DataPipelineOrchestrator(sales_csv, config, tmp_path / "run")
+    with patch.object(
+        DataPipelineOrchestrator, "_run_incremental", autospec=True,
+        side_effect=DataPipelineOrchestrator._run_incremental,
+    ) as run_incremental:
+        orchestrator.run()
+    full_config = {**config, "cache": {"enabled": True, "dir": str(tmp_path / "full_cache")}}
+    full = DataPipelineOrchestrator(sales_csv, full_config, tmp_path / "full")
+    full.run()
+
+    assert run_incremental.called == incremental
+    result = (tmp_path / "run" / "generated" / "ventas_clean.csv").read_text(encoding="utf-8")
+    expected = (tmp_path / "full" / "generated" / "ventas_clean.csv").read_text(
+        encoding="utf-8"
+    )
+    assert result == expected
+    assert (orchestrator.rows_in, orchestrator.rows_out) == (full.rows_in, full.rows_out)
+    for column, counts in full._plot_counts.items():
+        assert orchestrator._plot_counts[column].to_dict() == counts.to_dict()
+
+
+def test_result_cache_evicts_least_recently_used(sales_csv, tmp_path):
+    cache = ResultCache(tmp_path / "cache", max_bytes=10**9)
+    output = tmp_path / "generated" / "out.csv"
+    output.parent.mkdir()
+    output.write_text("x" * 1000, encoding="utf-8")
+    state = {"rows_in": 1, "rows_out": 1, "errors": {}, "plot_counts": {}}
+
+    lookups = []
+    for keep in ("first", "last", False):
+        lookup = cache.lookup(sales_csv, "ventas", {"duplicates": {"keep": keep}})
+        cache.store(lookup, output.parent, [output], state)
+        lookups.append(lookup)
+    # La primera entrada se vuelve a usar: la menos usada pasa a ser la segunda
+    assert cache.lookup(sales_csv, "ventas", {"duplicates": {"keep": "first"}}).entry
+
+    entries = tmp_path / "cache" / "entries"
+    total = sum(file.stat().st_size for file in entries.rglob("*") if file.is_file())
+    cache.max_bytes = total - 1
+    assert cache.evict() == 1
+    remaining = {path.name for path in entries.iterdir()}
+    assert remaining == {lookups[0].key, lookups[2].key}
+
+
+def test_plot_counter_accumulates_across_chunks():
+    counter = PlotCounter(["Category"])
+    counter.update(pd.DataFrame({"Category": ["food", "drink", "food"]}))
+    counter.update(pd.DataFrame({"Category": ["drink", "drink"]}))
+    counter.update(pd.DataFrame({"Other": [1]}))
+
+    counts = counter.counts()["Category"]
+
+    assert counts.to_dict() == {"drink": 3, "food": 2}
+    assert counts.index[0] == "drink"
+
+
+@pytest.mark.parametrize("compact", [False, True])
+@pytest.mark.parametrize("chunk_size", [1, 3, 100])
+def test_chunked_run_matches_in_memory_run(sales_csv, tmp_path, chunk_size, compact):
+    config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+    config["types"]["compact"] = compact
+    memory_dir = tmp_path / "memory"
+    chunked_dir = tmp_path / "chunked"
+    memory_dir.mkdir()
+    chunked_dir.mkdir()
+
+    config["execution"] = {"mode": "memory"}
+    memory_config = tmp_path / "memory.json"
+    memory_config.write_text(json.dumps(config), encoding="utf-8")
+
+    config["execution"] = {"mode": "chunked", "chunk_size": chunk_size}
+    chunked_config = tmp_path / "chunked.json"
+    chunked_config.write_text(json.dumps(config), encoding="utf-8")
+
+    DataPipelineOrchestrator(sales_csv, memory_config, memory_dir).run()
+    DataPipelineOrchestrator(sales_csv, chunked_config, chunked_dir).run()
+
+    expected = (memory_dir / "generated" / "ventas_clean.csv").read_text(encoding="utf-8")
+    result = (chunked_dir / "generated" / "ventas_clean.csv").read_text(encoding="utf-8")
+    assert result == expected
+    assert (chunked_dir / "generated" / "plots" / "ventas_Weekday_plot.png").exists()
+
+
+@pytest.mark.parametrize("chunk_size", [2, 100])
+def test_coercion_nulls_match_between_modes(tmp_path, chunk_size):
+    # Sin nulos reales: los únicos nulos son las fechas que la conversión no puede leer
+    file_path = tmp_path / "ventas.csv"
+    file_path.write_text(
+        "Transaction ID,Item,Quantity,Price Per Unit,Total Spent,Payment Method,Location,"
+        "Transaction Date\n"
+        "TXN_1,Coffee,2,2.0,4.0,Cash,In-store,2023-09-08\n"
+        "TXN_2,Cake,4,3.0,12.0,Card,Takeaway,ERROR\n"
+        "TXN_3,Cookie,1,1.0,1.0,Cash,In-store,2023-07-19\n"
+        "TXN_4,Tea,3,1.5,4.5,Cash,Takeaway,not a date\n"
+        "TXN_5,Salad,1,5.0,5.0,Card,In-store,2023-11-30\n",
+        encoding="utf-8",
+    )
+    outputs = {}
+    for mode in ("memory", "chunked"):
+        config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+        config["execution"] = {"mode": mode, "chunk_size": chunk_size}
+        base_dir = tmp_path / mode
+        base_dir.mkdir()
+
+        DataPipelineOrchestrator(file_path, config, base_dir).run()
+
+        outputs[mode] = pd.read_csv(base_dir / "generated" / "ventas_clean.csv")
+
+    pd.testing.assert_frame_equal(outputs["chunked"], outputs["memory"])
+    assert outputs["memory"]["Transaction ID"].tolist() == ["TXN_1", "TXN_3", "TXN_5"]
+
+
+def test_example_run_nullifies_sentinels_in_every_text_column(tmp_path):
+    config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+    config["execution"] = {"mode": "memory"}
+
+    DataPipelineOrchestrator(EXAMPLE_CSV, config, tmp_path).run()
+
+    df = pd.read_csv(tmp_path / "generated" / "ventas_cafe_clean.csv")
+    assert len(df) == 8564
+    # "Location" no es crítica ni se rellena: sus "ERROR" y "UNKNOWN" quedan vacíos
+    assert set(df["Location"].dropna()) == {"In-store", "Takeaway"}
+    assert df["Location"].isna().sum() == 3407
+    assert df["Payment Method"].value_counts()["NO_PROPORCIONADO"] == 2713
+
+
+def test_group_imputation_matches_between_modes(sales_csv, tmp_path):
+    outputs = {}
+    for mode in ("memory", "chunked"):
+        config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+        config["execution"] = {"mode": mode, "chunk_size": 2}
+        config["imputation"]["apply_rules"] = True
+        base_dir = tmp_path / mode
+        base_dir.mkdir()
+
+        DataPipelineOrchestrator(sales_csv, config, base_dir).run()
+
+        outputs[mode] = pd.read_csv(base_dir / "generated" / "ventas_clean.csv")
+
+    pd.testing.assert_frame_equal(outputs["chunked"], outputs["memory"])
+    # TXN_7 no tiene Item: no hay grupo del que tomar sus valores y se elimina
+    assert "TXN_7" not in outputs["memory"]["Transaction ID"].tolist()
+
+
+@pytest.mark.parametrize("escalate", [True, False])
+def test_sampled_validation_run_matches_full_validation(sales_csv, tmp_path, escalate):
+    outputs = {}
+    for sampled in (False, True):
+        config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+        config["execution"] = {"mode": "memory"}
+        config["validations"]["sampling"] = {
+            "enabled": sampled, "size": 3, "seed": 0, "escalate": escalate
+        }
+        base_dir = tmp_path / f"sampled_{sampled}"
+
+        DataPipelineOrchestrator(sales_csv, config, base_dir).run()
+
+        outputs[sampled] = (base_dir / "generated" / "ventas_clean.csv").read_text(
+            encoding="utf-8"
+        )
+
+    assert outputs[True] == outputs[False]
+
+
+@pytest.mark.parametrize("escalate", [True, False])
+def test_sampled_run_handles_coercion_errors_outside_sample(tmp_path, escalate):
+    sampling = {"enabled": True, "size": 5, "seed": 0, "escalate": escalate}
+    sampled_rows = set(sample_positions(40, sampling).tolist())
+    outside = [row for row in range(40) if row not in sampled_rows][:3]
+    lines = [
+        "Transaction ID,Item,Quantity,Price Per Unit,Total Spent,Payment Method,Location,"
+        "Transaction Date"
+    ]
+    for row in range(40):
+        date = "ERROR" if row in outside else f"2023-01-{row % 28 + 1:02d}"
+        lines.append(f"TXN_{row},Coffee,2,2.0,4.0,Cash,In-store,{date}")
+    file_path = tmp_path / "ventas.csv"
+    file_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    outputs = {}
+    for sampled in (False, True):
+        config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+        config["execution"] = {"mode": "memory"}
+        config["validations"]["sampling"] = {**sampling, "enabled": sampled}
+        base_dir = tmp_path / f"sampled_{sampled}"
+
+        DataPipelineOrchestrator(file_path, config, base_dir).run()
+
+        outputs[sampled] = pd.read_csv(base_dir / "generated" / "ventas_clean.csv")
+
+    pd.testing.assert_frame_equal(outputs[True], outputs[False])
+    assert len(outputs[True]) == 40 - len(outside)
+
+
+def test_compact_run_matches_plain_run(sales_csv, tmp_path):
+    outputs = {}
+    for compact in (False, True):
+        config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+        config["execution"] = {"mode": "memory"}
+        config["types"]["compact"] = compact
+        base_dir = tmp_path / f"compact_{compact}"
+        base_dir.mkdir()
+
+        DataPipelineOrchestrator(sales_csv, config, base_dir).run()
+
+        outputs[compact] = (base_dir / "generated" / "ventas_clean.csv").read_text(
+            encoding="utf-8"
+        )
+
+    assert outputs[True] == outputs[False]
+
+
+def test_parquet_export_matches_between_modes(sales_csv, tmp_path):
+    pytest.importorskip("pyarrow")
+    outputs = {}
+    for mode in ("memory", "chunked"):
+        config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+        config["execution"] = {"mode": mode, "chunk_size": 3}
+        config["export"] = {"format": "parquet"}
+        base_dir = tmp_path / mode
+        base_dir.mkdir()
+
+        DataPipelineOrchestrator(sales_csv, config, base_dir).run()
+
+        outputs[mode] = pd.read_parquet(base_dir / "generated" / "ventas_clean.parquet")
+
+    pd.testing.assert_frame_equal(outputs["chunked"], outputs["memory"], check_categorical=False)
+    assert outputs["memory"]["Quantity"].dtype == "Int64"
+    assert pd.api.types.is_datetime64_any_dtype(outputs["memory"]["Transaction Date"])
+
+
+def test_run_reads_and_writes_gzip(sales_csv, tmp_path):
+    compressed = tmp_path / "ventas.csv.gz"
+    compressed.write_bytes(gzip.compress(sales_csv.read_bytes()))
+    outputs = {}
+    for name, path, compression in (("plain", sales_csv, None), ("gzip", compressed, "gzip")):
+        config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+        config["execution"] = {"mode": "chunked", "chunk_size": 3}
+        config["export"] = {"format": "csv", "compression": compression}
+        base_dir = tmp_path / name
+        base_dir.mkdir()
+
+        DataPipelineOrchestrator(path, config, base_dir).run()
+
+        outputs[name] = base_dir / "generated"
+
+    # "ventas.csv.gz" produce las mismas salidas que "ventas.csv", comprimidas
+    result = gzip.decompress((outputs["gzip"] / "ventas_clean.csv.gz").read_bytes())
+    assert result == (outputs["plain"] / "ventas_clean.csv").read_bytes()
+
+
+def test_chunked_run_with_generator_reader(sales_csv, tmp_path):
+    config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+    config["execution"] = {"mode": "chunked", "chunk_size": 2}
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps(config), encoding="utf-8")
+
+    with patch.object(ReadPlan, "reader", return_value=ReaderCSVGenerator()):
+        DataPipelineOrchestrator(sales_csv, config_path, tmp_path).run()
+
+    df = pd.read_csv(tmp_path / "generated" / "ventas_clean.csv")
+    assert df["Transaction ID"].tolist() == ["TXN_3", "TXN_2", "TXN_5", "TXN_6"]
+
+
+def test_auto_mode_runs_chunked_when_file_does_not_fit(sales_csv, tmp_path):
+    config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+    config["execution"] = {"mode": "auto", "chunk_size": 2}
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps(config), encoding="utf-8")
+    orchestrator = DataPipelineOrchestrator(sales_csv, config_path, tmp_path)
+
+    with (
+        patch("module.read.csv_reader_selector.available_memory", return_value=1024),
+        patch.object(orchestrator, "_run_chunked") as run_chunked,
+    ):
+        orchestrator.run()
+
+    run_chunked.assert_called_once()
+
+
+def test_run_batch_processes_directory(sales_csv, tmp_path):
+    inputs = tmp_path / "stores"
+    inputs.mkdir()
+    for store in ["store_a", "store_b"]:
+        (inputs / f"{store}.csv").write_text(sales_csv.read_text(encoding="utf-8"))
+    (inputs / "broken.csv").write_text("Transaction ID,Item\nTXN_1,Coffee\n", encoding="utf-8")
+    (inputs / "notes.txt").write_text("no es un csv", encoding="utf-8")
+
+    summary = run_batch(inputs, CONFIG_PATH, tmp_path, workers=2)
+
+    assert [Path(result.path).name for result in summary.files] == [
+        "broken.csv", "store_a.csv", "store_b.csv"
+    ]
+    assert [result.path for result in summary.failures] == [str(inputs / "broken.csv")]
+    assert summary.failures[0].error
+    for result in summary.files[1:]:
+        assert result.status == "ok"
+        assert result.rows_in == 9
+        assert result.rows_out == 4
+
+    report = json.loads((tmp_path / "generated" / "batch_summary.json").read_text())
+    assert report["total_files"] == 3
+    assert report["failed_files"] == 1
+    assert report["rows_out"] == 8
+    assert (tmp_path / "generated" / "store_a_clean.csv").exists()
+    # Cada archivo guarda sus propios gráficos
+    assert (tmp_path / "generated" / "plots" / "store_a_Weekday_plot.png").exists()
+    assert (tmp_path / "generated" / "plots" / "store_b_Weekday_plot.png").exists()
+
+
+def test_run_batch_rejects_files_with_the_same_outputs(sales_csv, tmp_path):
+    stores = tmp_path / "stores"
+    for folder in ["a", "b"]:
+        (stores / folder).mkdir(parents=True)
+        (stores / folder / "ventas.csv").write_bytes(sales_csv.read_bytes())
+    (stores / "a" / "ventas.csv.gz").write_bytes(gzip.compress(sales_csv.read_bytes()))
+
+    summary = run_batch(stores / "*" / "ventas.csv*", CONFIG_PATH, tmp_path)
+
+    # Todos generarían generated/ventas_clean.csv: solo se procesa el primero
+    assert [
+        (Path(result.path).relative_to(stores).as_posix(), result.status)
+        for result in summary.files
+    ] == [("a/ventas.csv", "ok"), ("a/ventas.csv.gz", "error"), ("b/ventas.csv", "error")]
+    for result in summary.failures:
+        assert result.error == f"Sus salidas sobrescribirían las de '{stores / 'a' / 'ventas.csv'}'"
@@ -1,11 +1,36 @@
+import bz2
+import gzip
+import lzma
+import zipfile
 from pathlib import Path
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from module.read.csv_reader_selector import SIZE_THRESHOLD, get_csv_reader
-from module.read.reader import ReaderCSVGenerator, ReaderCSVPandas
+from module.read.compression import (
+    SAMPLE_COMPRESSED_BYTES,
+    base_name,
+    estimate_uncompressed_size,
+)
+from module.read.csv_reader_selector import (
+    CHUNKED_STRATEGY,
+    MEMORY_STRATEGY,
+    MMAP_STRATEGY,
+    MMAP_THRESHOLD,
+    PARALLEL_STRATEGY,
+    PARALLEL_THRESHOLD,
+    get_csv_reader,
+    plan_csv_read,
+)
+from module.read.reader import (
+    ReaderCSVGenerator,
+    ReaderCSVMmap,
+    ReaderCSVPandas,
+    byte_ranges,
+    sniff_delimiter,
+)
 
 
 # Fixture (csv de ejemplo)
@@ -23,7 +48,7 @@ def fixture_csv(tmp_path: Path) -> Path:
 
 @pytest.mark.parametrize(
     "reader_class",
-    [ReaderCSVPandas, ReaderCSVGenerator],
+    [ReaderCSVPandas, ReaderCSVGenerator, ReaderCSVMmap],
 )
 def test_read_csv_valid(reader_class, fixture_csv):
     reader = reader_class()
@@ -37,7 +62,7 @@ def test_read_csv_valid(reader_class, fixture_csv):
 
 @pytest.mark.parametrize(
     "reader_class",
-    [ReaderCSVPandas, ReaderCSVGenerator],
+    [ReaderCSVPandas, ReaderCSVGenerator, ReaderCSVMmap],
 )
 def test_read_csv_not_found(reader_class):
     reader = reader_class()
@@ -45,14 +70,331 @@ def test_read_csv_not_found(reader_class):
     with pytest.raises(FileNotFoundError):
         reader.read("invalid_file.csv")
 
+GB = 1024 * 1024 * 1024
+
+
 def test_csv_reader_selector_pandas():
-    with patch("os.path.getsize", return_value=SIZE_THRESHOLD - 1):
+    with (
+        patch("os.path.getsize", return_value=3 * 1024 * 1024),
+        patch("module.read.csv_reader_selector.available_memory", return_value=8 * GB),
+    ):
         reader = get_csv_reader("dummy.csv")
 
         assert isinstance(reader, ReaderCSVPandas)
+        assert not reader.memory_map
 
-def test_csv_reader_selector_generator():
-    with patch("os.path.getsize", return_value=SIZE_THRESHOLD + 1):
+def test_csv_reader_selector_mmap():
+    with (
+        patch("os.path.getsize", return_value=MMAP_THRESHOLD),
+        patch("module.read.csv_reader_selector.available_memory", return_value=64 * GB),
+    ):
         reader = get_csv_reader("dummy.csv")
 
+        assert isinstance(reader, ReaderCSVPandas)
+        assert reader.memory_map
+
+def test_csv_reader_selector_generator():
+    with (
+        patch("os.path.getsize", return_value=30 * GB),
+        patch("module.read.csv_reader_selector.available_memory", return_value=8 * GB),
+    ):
+        reader = get_csv_reader("dummy.csv", workers=1)
+
         assert isinstance(reader, ReaderCSVGenerator)
+
+def test_csv_reader_selector_parallel():
+    with (
+        patch("os.path.getsize", return_value=PARALLEL_THRESHOLD),
+        patch("module.read.csv_reader_selector.available_memory", return_value=64 * GB),
+    ):
+        reader = get_csv_reader("dummy.csv", workers=4)
+        single = get_csv_reader("dummy.csv", workers=1)
+
+    assert isinstance(reader, ReaderCSVMmap)
+    assert reader.workers == 4
+    # Con un solo proceso no compensa repartir rangos: se usa memory_map
+    assert isinstance(single, ReaderCSVPandas) and single.memory_map
+
+def test_csv_reader_selector_chunked_parallel():
+    with (
+        patch("os.path.getsize", return_value=30 * GB),
+        patch("module.read.csv_reader_selector.available_memory", return_value=8 * GB),
+    ):
+        reader = get_csv_reader("dummy.csv", workers=4)
+
+    assert isinstance(reader, ReaderCSVMmap)
+
+
+@pytest.mark.parametrize(
+    "name, size, memory, expected",
+    [
+        ("ventas.csv", 1024, 8 * GB, MEMORY_STRATEGY),
+        ("ventas.csv", MMAP_THRESHOLD, 64 * GB, MMAP_STRATEGY),
+        ("ventas.csv", PARALLEL_THRESHOLD, 64 * GB, PARALLEL_STRATEGY),
+        ("ventas.csv", 30 * GB, 8 * GB, CHUNKED_STRATEGY),
+        # Comprimido: no se usa memory_map y se estima el tamaño descomprimido
+        ("ventas.csv.gz", MMAP_THRESHOLD, 64 * GB, MEMORY_STRATEGY),
+        ("ventas.csv.gz", 1 * GB, 8 * GB, CHUNKED_STRATEGY),
+    ],
+)
+def test_plan_csv_read_strategies(name, size, memory, expected):
+    with (
+        patch("os.path.getsize", return_value=size),
+        patch("module.read.csv_reader_selector.available_memory", return_value=memory),
+    ):
+        plan = plan_csv_read(name, workers=4)
+
+    assert plan.strategy == expected
+    assert plan.reason
+
+
+def test_plan_csv_read_measures_sample(fixture_csv):
+    plan = plan_csv_read(fixture_csv)
+
+    assert plan.strategy == MEMORY_STRATEGY
+    assert plan.estimated_rows == 2
+
+
+@pytest.mark.parametrize("delimiter", [",", ";", "\t", "|"])
+def test_sniff_delimiter(tmp_path, delimiter):
+    file_path = tmp_path / "sep.csv"
+    file_path.write_text(
+        delimiter.join(["Transaction ID", "Item", "Quantity"]) + "\n"
+        + delimiter.join(["TXN_1", "Coffee", "2"]) + "\n"
+        + delimiter.join(["TXN_2", "Cake", "3"]) + "\n",
+        encoding="utf-8",
+    )
+
+    assert sniff_delimiter(str(file_path)) == delimiter
+
+    df = ReaderCSVPandas().read(str(file_path))
+    assert df.columns.tolist() == ["Transaction ID", "Item", "Quantity"]
+    assert df["Item"].tolist() == ["Coffee", "Cake"]
+
+
+def test_read_csv_pandas_uses_schema_dtypes(tmp_path):
+    file_path = tmp_path / "typed.csv"
+    file_path.write_text(
+        "Transaction ID,Quantity,Transaction Date\n"
+        "1,5,2010-06-11\n"
+        "2,3,1987-06-24\n",
+        encoding="utf-8",
+    )
+
+    df = ReaderCSVPandas().read(str(file_path))
+
+    assert df["Transaction ID"].tolist() == ["1", "2"]
+    assert df["Transaction Date"].tolist() == ["2010-06-11", "1987-06-24"]
+    assert pd.api.types.is_integer_dtype(df["Quantity"])
+
+
+def test_read_csv_pandas_integer_column_with_nulls(tmp_path):
+    file_path = tmp_path / "nulls.csv"
+    file_path.write_text(
+        "Transaction ID,Quantity,Total Spent\n"
+        "TXN_1,2,4.0\n"
+        "TXN_2,,12.0\n",
+        encoding="utf-8",
+    )
+
+    df = ReaderCSVPandas().read(str(file_path))
+
+    assert df["Transaction ID"].tolist() == ["TXN_1", "TXN_2"]
+    assert df["Quantity"].iloc[0] == 2
+    assert pd.isna(df["Quantity"].iloc[1])
+
+
+@pytest.mark.parametrize(
+    "reader_class",
+    [ReaderCSVPandas, ReaderCSVGenerator, ReaderCSVMmap],
+)
+def test_compact_read_uses_categoricals(reader_class, tmp_path):
+    file_path = tmp_path / "compact.csv"
+    file_path.write_text(
+        "Transaction ID,Item,Location\n"
+        "TXN_1,Coffee,In-store\n"
+        "TXN_2,Cake,\n"
+        "TXN_3,Coffee,Takeaway\n",
+        encoding="utf-8",
+    )
+
+    df = reader_class(compact=True).read(str(file_path))
+
+    assert isinstance(df["Item"].dtype, pd.CategoricalDtype)
+    assert isinstance(df["Location"].dtype, pd.CategoricalDtype)
+    assert not isinstance(df["Transaction ID"].dtype, pd.CategoricalDtype)
+    assert sorted(df["Item"].cat.categories) == ["Cake", "Coffee"]
+    assert pd.isna(df["Location"].iloc[1])
+
+
+@pytest.mark.parametrize(
+    "reader_class",
+    [ReaderCSVPandas, ReaderCSVGenerator],
+)
+def test_iter_batches(reader_class, tmp_path):
+    file_path = tmp_path / "batches.csv"
+    file_path.write_text(
+        "Transaction ID,Item,Quantity\n"
+        + "".join(f"TXN_{i},Coffee,{i}\n" for i in range(5))
+        + "TXN_5,,ERROR\n",
+        encoding="utf-8",
+    )
+
+    batches = list(reader_class().iter_batches(str(file_path), batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 2]
+    assert pd.api.types.is_integer_dtype(batches[0]["Quantity"])
+    assert batches[2]["Quantity"].tolist() == ["4", "ERROR"]
+    assert pd.isna(batches[2]["Item"].iloc[1])
+
+
+@pytest.mark.parametrize(
+    "reader_class",
+    [ReaderCSVPandas, ReaderCSVGenerator, ReaderCSVMmap],
+)
+def test_iter_batches_selected_columns(reader_class, fixture_csv):
+    batches = list(
+        reader_class().iter_batches(str(fixture_csv), batch_size=10, columns=["Transaction Id"])
+    )
+
+    assert len(batches) == 1
+    assert batches[0].columns.tolist() == ["Transaction Id"]
+
+
+def _compress(source: Path, suffix: str) -> Path:
+    target = source.with_name(source.name + suffix)
+    data = source.read_bytes()
+    if suffix == ".zip":
+        with zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(source.name, data)
+    else:
+        target.write_bytes({".gz": gzip, ".bz2": bz2, ".xz": lzma}[suffix].compress(data))
+    return target
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".bz2", ".xz", ".zip"])
+@pytest.mark.parametrize("reader_class", [ReaderCSVPandas, ReaderCSVGenerator])
+def test_read_compressed_csv(reader_class, suffix, tmp_path):
+    source = tmp_path / "ventas.csv"
+    source.write_text(
+        "Transaction ID;Item;Quantity\nTXN_1;Coffee;2\nTXN_2;Cake;\nTXN_3;Tea;1\n",
+        encoding="utf-8",
+    )
+    path = _compress(source, suffix)
+
+    df = reader_class().read(str(path))
+    batches = list(reader_class().iter_batches(str(path), batch_size=2))
+
+    pd.testing.assert_frame_equal(df, reader_class().read(str(source)))
+    assert [len(batch) for batch in batches] == [2, 1]
+
+
+def test_byte_ranges_end_on_newlines():
+    data = b"a,b\n1,2\n33,44\n555,666\n7,8"
+
+    ranges = byte_ranges(data, 4, 5)
+
+    assert ranges[0][0] == 4 and ranges[-1][1] == len(data)
+    assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+    assert all(data[end - 1:end] == b"\n" for _, end in ranges[:-1])
+    assert b"".join(data[start:end] for start, end in ranges) == data[4:]
+
+
+@pytest.fixture
+def ranges_csv(tmp_path: Path) -> Path:
+    # "ERROR" solo aparece al final: los primeros rangos infieren Quantity como numérica
+    rows = [f"TXN_{i},{'Coffee' if i % 3 else 'Tea'},{i % 5 or ''},In-store" for i in range(400)]
+    rows[-1] = "TXN_399,Cake,ERROR,Takeaway"
+    file_path = tmp_path / "ranges.csv"
+    file_path.write_text(
+        "Transaction ID,Item,Quantity,Location\n" + "\n".join(rows) + "\n", encoding="utf-8"
+    )
+    return file_path
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("compact", [False, True])
+def test_mmap_reader_matches_pandas(ranges_csv, workers, compact):
+    reader = ReaderCSVMmap(workers=workers, compact=compact, range_bytes=1024)
+
+    df = reader.read(str(ranges_csv))
+
+    pd.testing.assert_frame_equal(df, ReaderCSVPandas(compact=compact).read(str(ranges_csv)))
+    # Los rangos numéricos se releen como texto: "1" y no "1.0"
+    assert df["Quantity"].iloc[1] == "1"
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_generator_reader_reconciles_batch_dtypes(ranges_csv, compact):
+    df = ReaderCSVGenerator(compact=compact, batch_size=30).read(str(ranges_csv))
+
+    pd.testing.assert_frame_equal(df, ReaderCSVPandas(compact=compact).read(str(ranges_csv)))
+    # Los lotes numéricos se releen como texto: "1" y no "1.0"
+    assert df["Quantity"].iloc[1] == "1"
+
+
+def test_mmap_reader_batches_do_not_cross_ranges(ranges_csv):
+    reader = ReaderCSVMmap(workers=2, range_bytes=1024)
+
+    batches = list(reader.iter_batches(str(ranges_csv), batch_size=30))
+
+    assert sum(len(batch) for batch in batches) == 400
+    assert max(len(batch) for batch in batches) == 30
+    assert batches[-1]["Quantity"].iloc[-1] == "ERROR"
+
+
+def test_mmap_reader_starts_at_byte_offset(ranges_csv):
+    lines = ranges_csv.read_bytes().splitlines(keepends=True)
+    start = sum(len(line) for line in lines[:101])
+
+    df = ReaderCSVMmap(workers=2, range_bytes=1024, start=start).read(str(ranges_csv))
+
+    assert df.columns.tolist() == ["Transaction ID", "Item", "Quantity", "Location"]
+    assert df["Transaction ID"].tolist() == [f"TXN_{i}" for i in range(100, 400)]
+
+
+def test_mmap_reader_header_only(tmp_path):
+    file_path = tmp_path / "empty.csv"
+    file_path.write_text("Transaction ID,Quantity\n", encoding="utf-8")
+
+    df = ReaderCSVMmap(workers=2).read(str(file_path))
+
+    assert df.empty
+    assert df.columns.tolist() == ["Transaction ID", "Quantity"]
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".bz2", ".xz", ".zip"])
+def test_estimate_uncompressed_size(suffix, tmp_path):
+    source = tmp_path / "ventas.csv"
+    source.write_text("TXN_1,Coffee,2,2.0\n" * 5000, encoding="utf-8")
+
+    path = _compress(source, suffix)
+
+    # Archivo menor que la muestra: se descomprime entero y el tamaño es exacto
+    assert estimate_uncompressed_size(path) == source.stat().st_size
+    plan = plan_csv_read(path)
+    assert plan.estimated_size == source.stat().st_size
+    assert plan.estimated_rows == pytest.approx(5000, rel=0.01)
+
+
+def test_estimate_uncompressed_size_large_gzip(tmp_path):
+    rng = np.random.default_rng(0)
+    lines = [f"TXN_{n},{rng.integers(1000)},{rng.random():.6f}\n" for n in range(300_000)]
+    data = "".join(lines).encode("utf-8")
+    single = tmp_path / "single.csv.gz"
+    single.write_bytes(gzip.compress(data))
+    multi = tmp_path / "multi.csv.gz"
+    half = len(data) // 2
+    multi.write_bytes(gzip.compress(data[:half]) + gzip.compress(data[half:]))
+    assert single.stat().st_size > SAMPLE_COMPRESSED_BYTES
+
+    # Un solo miembro: ISIZE da el tamaño exacto
+    assert estimate_uncompressed_size(single) == len(data)
+    # Varios miembros: ISIZE solo cuenta el último y se usa el ratio de la muestra
+    assert estimate_uncompressed_size(multi) == pytest.approx(len(data), rel=0.1)
+
+
+def test_base_name():
+    assert base_name("datos/ventas.csv") == "ventas"
+    assert base_name("datos/ventas.csv.gz") == "ventas"
+    assert base_name("datos/ventas.zip") == "ventas"
@@ -1,7 +1,9 @@
 import pandas as pd
 import pytest
 
+from module.transforms.date_parts import date_parts
 from module.transforms.item import add_category_column
+from module.transforms.pipeline import TransformPipeline, default_pipeline
 from module.transforms.weekday import add_weekday_column
 from module.transforms.year_third import add_year_third_column
 
@@ -78,8 +80,153 @@ def test_add_year_third_column_correct_labels(date_str, expected):
     assert "Year third" in out.columns
     assert out.loc[0, "Year third"] == expected
 
+
+def test_compact_derived_columns_are_ordered_categoricals():
+    df = pd.DataFrame(
+        {
+            "Transaction Date": pd.to_datetime(["2023-09-08", None, "2023-01-02"]),
+            "Item": ["Coffee", "Muffin", None],
+        }
+    )
+
+    out = add_category_column(
+        add_weekday_column(add_year_third_column(df, compact=True), compact=True),
+        compact=True,
+    )
+
+    assert out["Year third"].cat.ordered
+    assert out["Year third"].cat.categories.tolist() == ["T1", "T2", "T3"]
+    assert out["Year third"].tolist()[0] == "T3"
+    assert pd.isna(out["Year third"].iloc[1])
+    assert out["Weekday"].cat.ordered
+    assert out["Weekday"].cat.categories[0] == "Monday"
+    assert out["Weekday"].tolist()[2] == "Monday"
+    assert out["Category"].tolist() == ["drink", "unknown", "unknown"]
+
+
+def test_derived_columns_are_text_outside_compact_mode():
+    df = pd.DataFrame(
+        {
+            "Transaction Date": pd.to_datetime(["2023-09-08", None]),
+            "Item": ["Coffee", "Muffin"],
+        }
+    )
+
+    out = default_pipeline().run(df)
+
+    for col in ("Year third", "Weekday", "Category"):
+        assert pd.api.types.is_string_dtype(out[col])
+        assert not isinstance(out[col].dtype, pd.CategoricalDtype)
+    assert out["Year third"].tolist()[0] == "T3"
+    assert pd.isna(out["Weekday"].iloc[1])
+
+
+def test_add_category_column_accepts_categorical_items():
+    df = pd.DataFrame({"Item": pd.Categorical(["Coffee", "Muffin", "Cake"])})
+
+    out = add_category_column(df)
+
+    assert out["Category"].tolist() == ["drink", "unknown", "food"]
+
 def test_add_year_third_column_raises_if_date_column_missing():
     df = pd.DataFrame({"Other": pd.to_datetime(["2023-01-01"])})
 
     with pytest.raises(ValueError, match="Column 'Transaction Date' not found in DataFrame"):
         add_year_third_column(df)
+
+
+def test_date_parts_factorizes_unique_dates():
+    df = pd.DataFrame(
+        {"Transaction Date": pd.to_datetime(["2023-09-08", "2023-01-02", None, "2023-09-08"])}
+    )
+
+    parts = date_parts(df)
+
+    assert len(parts.month) == 2
+    assert parts.weekday_codes().tolist() == [4, 0, -1, 4]
+    assert parts.year_third_codes().tolist() == [2, 0, -1, 2]
+
+
+def test_date_parts_rejects_non_datetime_column():
+    df = pd.DataFrame({"Transaction Date": ["2023-09-08"]})
+
+    with pytest.raises(TypeError, match="not a datetime column"):
+        date_parts(df)
+
+
+def test_shared_date_parts_give_same_columns():
+    df = pd.DataFrame(
+        {"Transaction Date": pd.to_datetime(["2024-05-01", None, "2024-12-31", "2024-02-29"])}
+    )
+    parts = date_parts(df)
+
+    shared = add_weekday_column(add_year_third_column(df, parts=parts), parts=parts)
+    separate = add_weekday_column(add_year_third_column(df))
+
+    pd.testing.assert_frame_equal(shared, separate)
+    assert "Weekday" not in df.columns
+
+
+def test_misaligned_date_parts_are_recomputed():
+    df = pd.DataFrame({"Transaction Date": pd.to_datetime(["2023-09-08", "2023-01-02"])})
+    parts = date_parts(df.iloc[::-1])
+
+    out = add_weekday_column(df, parts=parts)
+
+    assert out["Weekday"].tolist() == ["Friday", "Monday"]
+
+
+#TransformPipeline
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_default_pipeline_matches_individual_transforms(compact):
+    df = pd.DataFrame(
+        {
+            "Transaction Date": pd.to_datetime(["2023-09-08", None, "2023-01-02"]),
+            "Item": ["Coffee", "Muffin", "Cake"],
+        }
+    )
+    pipeline = default_pipeline(compact)
+
+    out = pipeline.run(df)
+
+    expected = add_category_column(
+        add_weekday_column(add_year_third_column(df, compact=compact), compact=compact),
+        compact=compact,
+    )
+    pd.testing.assert_frame_equal(out, expected)
+    assert list(df.columns) == ["Transaction Date", "Item"]
+    assert set(pipeline.timings) == {"year_third", "weekday", "category"}
+
+
+def test_pipeline_orders_transforms_by_dependencies():
+    pipeline = TransformPipeline()
+
+    @pipeline.register("double", inputs=("Base",), outputs=("Double",))
+    def _double(df, cache):
+        return {"Double": df["Base"] * 2}
+
+    @pipeline.register("base", inputs=("Value",), outputs=("Base",))
+    def _base(df, cache):
+        return {"Base": df["Value"] + 1}
+
+    out = pipeline.run(pd.DataFrame({"Value": [1, 2]}))
+
+    assert [t.name for t in pipeline.plan(["Value"])] == ["base", "double"]
+    assert out["Double"].tolist() == [4, 6]
+
+
+def test_pipeline_raises_if_input_column_missing():
+    pipeline = default_pipeline()
+
+    with pytest.raises(ValueError, match="Column 'Item' not found in DataFrame"):
+        pipeline.run(pd.DataFrame({"Transaction Date": pd.to_datetime(["2023-01-01"])}))
+
+
+def test_pipeline_rejects_repeated_outputs():
+    pipeline = default_pipeline()
+
+    with pytest.raises(ValueError, match="already produced"):
+        pipeline.register("other", inputs=("Item",), outputs=("Category",))(
+            lambda df, cache: {}
+        )
@@ -1,12 +1,19 @@
+from unittest.mock import patch
+
+import numpy as np
 import pandas as pd
 import pytest
 
+from module.data_models.dates import DateParser
+from module.data_models.error_index import SENTINEL_VALUES
 from module.data_models.schema import (
     DUPLICATED_VALUES_ERROR,
     NULL_VALUES_ERROR,
     TRANSACTION_ID,
     TYPE_ERROR,
 )
+from module.validators.fused_validator import FusedValidator
+from module.validators.sampling import sample_positions
 from module.validators.specific_validators import (
     DuplicateValidator,
     NullValidator,
@@ -160,3 +167,190 @@ def test_type_validator_disabled(data, base_config):
     errors = validator.validate(df, base_config)
 
     assert errors == {}
+
+# FusedValidator
+@pytest.mark.parametrize(
+    "data",
+    [
+        {TRANSACTION_ID: ["1", "2", "3"], "Quantity": ["1", "2", "3"]},
+        {TRANSACTION_ID: ["1", "2", "2"], "Item": ["Tea", None, "Cake"]},
+        {"Quantity": ["1", "str", None], "Price Per Unit": ["10.5", "20.0", "30"]},
+        {"Total Spent": ["20.4", "ERROR"], "Transaction Date": ["1987-06-24", "str"]},
+        {TRANSACTION_ID: [None, None], "Quantity": ["2.5", "x"]},
+    ]
+)
+@pytest.mark.parametrize("disabled", [None, "validate_nulls", "validate_types"])
+def test_fused_validator_matches_sequential_validators(data, disabled, base_config):
+    if disabled:
+        base_config["validations"][disabled] = False
+    df = pd.DataFrame(data)
+
+    expected: dict[str, list[str]] = {}
+    for validator in [NullValidator(), DuplicateValidator(), TypeValidator()]:
+        if TRANSACTION_ID not in df.columns and isinstance(validator, DuplicateValidator):
+            continue
+        for col, errors in validator.validate(df, base_config).items():
+            expected.setdefault(col, []).extend(errors)
+
+    assert FusedValidator().validate(df, base_config) == expected
+
+
+def test_fused_validator_caches_coerced_columns(base_config):
+    df = pd.DataFrame({
+        "Quantity": ["1", "str", "3"],
+        "Transaction Date": ["1987-06-24", "2026-02-15", None],
+        "Item": ["Tea", "Cake", "Cookie"],
+    })
+
+    validator = FusedValidator()
+    validator.validate(df, base_config)
+
+    assert set(validator.coerced) == {"Quantity", "Transaction Date"}
+    assert validator.coerced["Quantity"].dtype == "Int64"
+    assert pd.isna(validator.coerced["Quantity"][1])
+    assert pd.api.types.is_datetime64_any_dtype(validator.coerced["Transaction Date"])
+
+def test_fused_validator_indexes_error_rows(base_config):
+    df = pd.DataFrame({
+        TRANSACTION_ID: ["1", "2", "1", "3"],
+        "Item": ["Tea", None, "UNKNOWN", "Cake"],
+        "Quantity": ["1", "str", None, "3"],
+    })
+
+    validator = FusedValidator()
+    validator.validate(df, base_config)
+    index = validator.error_index
+
+    assert index.get(TRANSACTION_ID, DUPLICATED_VALUES_ERROR).tolist() == [0, 2]
+    assert index.get("Item", NULL_VALUES_ERROR).tolist() == [1]
+    assert index.get("Item", SENTINEL_VALUES).tolist() == [2]
+    assert index.get("Quantity", TYPE_ERROR).tolist() == [1]
+    assert index.get("Quantity", NULL_VALUES_ERROR).tolist() == [2]
+    # Columna sin duplicados comprobados: no se puede usar para eliminar duplicados
+    assert not index.covers("Item", [DUPLICATED_VALUES_ERROR])
+
+# Validación en paralelo
+@pytest.mark.parametrize("executor", ["thread", "process"])
+@pytest.mark.parametrize("validator_class", [NullValidator, TypeValidator, FusedValidator])
+def test_parallel_validation_matches_serial(executor, validator_class, base_config):
+    df = pd.DataFrame({
+        TRANSACTION_ID: ["1", "2", "2", None],
+        "Item": ["Tea", None, "Cake", "Cookie"],
+        "Quantity": ["1", "str", "3", None],
+        "Price Per Unit": ["10.5", "20.0", "30", "1"],
+        "Total Spent": ["20.4", "ERROR", None, "3"],
+        "Transaction Date": ["1987-06-24", "str", "2026-02-15", "2026-02-16"],
+    })
+
+    expected = validator_class().validate(df, base_config)
+
+    base_config["validations"]["parallel"] = {
+        "enabled": True, "executor": executor, "max_workers": 2
+    }
+    result = validator_class().validate(df, base_config)
+
+    assert result == expected
+    assert list(result) == list(expected)
+
+
+def test_parallel_validation_unknown_executor(base_config):
+    base_config["validations"]["parallel"] = {"enabled": True, "executor": "gpu"}
+    df = pd.DataFrame({"a": [1, None], "b": [None, 2]})
+
+    with pytest.raises(ValueError):
+        NullValidator().validate(df, base_config)
+
+
+# Validación por muestreo
+@pytest.fixture
+def large_df():
+    rows = 1000
+    quantity = [str(i % 9 + 1) for i in range(rows)]
+    quantity[997] = "ERROR"
+    return pd.DataFrame({
+        TRANSACTION_ID: [f"TXN_{i}" for i in range(rows - 1)] + ["TXN_3"],
+        "Item": ["Tea"] * rows,
+        "Quantity": quantity,
+        "Payment Method": [None if i % 2 else "Cash" for i in range(rows)],
+    })
+
+
+@pytest.mark.parametrize("method", ["random", "stratified"])
+def test_sampled_validation_escalates_to_full_report(large_df, method, base_config):
+    expected = FusedValidator().validate(large_df, base_config)
+    base_config["validations"]["sampling"] = {
+        "enabled": True, "size": 50, "method": method, "seed": 1, "escalate": True
+    }
+
+    validator = FusedValidator()
+    result = validator.validate(large_df, base_config)
+
+    assert result == expected
+    assert all(confidence.conclusive for confidence in validator.confidence.values())
+    # Los nulos de Payment Method están en la muestra: no hace falta recorrer la columna
+    assert not validator.confidence["Payment Method"].escalated
+    assert validator.confidence["Quantity"].escalated
+    assert "Quantity" in validator.coerced
+
+
+def test_sampled_validation_without_escalation_reports_confidence(large_df, base_config):
+    base_config["validations"]["sampling"] = {
+        "enabled": True, "size": 50, "seed": 1, "escalate": False
+    }
+
+    validator = FusedValidator()
+    result = validator.validate(large_df, base_config)
+
+    # La fila con "ERROR" no está en la muestra; los duplicados se comprueban siempre enteros
+    assert result == {
+        TRANSACTION_ID: [DUPLICATED_VALUES_ERROR],
+        "Payment Method": [NULL_VALUES_ERROR],
+    }
+    quantity = validator.confidence["Quantity"]
+    assert (quantity.rows, quantity.sampled, quantity.conclusive) == (1000, 50, False)
+    assert quantity.max_error_rate == pytest.approx(3 / 50, rel=0.05)
+    assert validator.confidence["Payment Method"].conclusive
+
+
+def test_stratified_sample_covers_every_stratum():
+    positions = sample_positions(10_000, {"size": 200, "method": "stratified", "seed": 0})
+
+    assert len(positions) == 200
+    assert (np.diff(positions) > 0).all()
+    assert np.bincount(positions // 100).tolist() == [2] * 100
+
+
+# Fechas
+def test_date_parser_declared_format_resolves_ambiguous_dates():
+    column = pd.Series(["01/02/2023", "13/02/2023", None], dtype="str", name="Fecha")
+
+    parsed = DateParser(["%d/%m/%Y"]).parse(column)
+
+    assert parsed.tolist()[:2] == [pd.Timestamp("2023-02-01"), pd.Timestamp("2023-02-13")]
+    assert parsed.isna().tolist() == [False, False, True]
+
+
+def test_date_parser_infers_formats_and_rejects_garbage():
+    parser = DateParser(["%Y-%m-%d"])
+    column = pd.Series(
+        ["2023-09-08", "2023/01/05", "ERROR", "5", "March 5, 2023"], dtype="str", name="Fecha"
+    )
+
+    parsed = parser.parse(column)
+
+    assert parsed.tolist() == [
+        pd.Timestamp("2023-09-08"), pd.Timestamp("2023-01-05"), pd.NaT, pd.NaT,
+        pd.Timestamp("2023-03-05"),
+    ]
+    assert parser.formats == ["%Y-%m-%d", "%Y/%m/%d"]
+
+
+def test_date_parser_parses_each_text_once():
+    parser = DateParser(["%Y-%m-%d"])
+    parser.parse(pd.Series(["2023-09-08", "2023-09-08", "ERROR"], dtype="str"))
+
+    with patch.object(DateParser, "_parse_new", wraps=parser._parse_new) as parse_new:
+        parsed = parser.parse(pd.Series(["2023-09-08", "2023-09-09", "ERROR"], dtype="str"))
+
+    assert parse_new.call_args.args == (["2023-09-09"],)
+    assert parsed.isna().tolist() == [False, False, True]